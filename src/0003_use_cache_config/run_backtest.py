@@ -1,7 +1,7 @@
 import pandas as pd
 from nautilus_trader.backtest.engine import BacktestEngine, Decimal
 from nautilus_trader.backtest.models import PerContractFeeModel
-from nautilus_trader.config import BacktestEngineConfig, CacheConfig, LoggingConfig
+from nautilus_trader.config import BacktestEngineConfig, LoggingConfig
 from nautilus_trader.model import TraderId
 from nautilus_trader.model.currencies import USD
 from nautilus_trader.model.data import Bar, BarType
@@ -9,27 +9,43 @@ from nautilus_trader.model.enums import AccountType, OmsType
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Money
 
+import utils_cache
 import utils_csv
 import utils_instruments
 from strategy import DemoStrategy, DemoStrategyConfig
 
 
 if __name__ == "__main__":
+    # Venue + instrument (needed by strategy config -> created before engine)
+    venue: Venue = Venue("GLBX")
+    eurusd_future_instrument = utils_instruments.eurusd_future(2024, 3, venue.value)
+    eurusd_future_1min_bar_type = BarType.from_str(
+        f"{eurusd_future_instrument.id}-1-MINUTE-LAST-EXTERNAL"
+    )
+
+    # Strategy: Configure (before engine -> Cache is sized from what strategies read)
+    strategy_config = DemoStrategyConfig(
+        instrument=eurusd_future_instrument,
+        primary_bar_type=eurusd_future_1min_bar_type,
+        lookback_bars=29_001,  # Strategy reads bar at index 29000 (see `on_stop`)
+    )
+    strategy_configs = [strategy_config]
+
     # Engine: configure + create
+    # FOCUS POINT: configure cache
+    #   - Fixed: `CacheConfig(bar_capacity=100_000, tick_capacity=100_000)` keeps up to 100k bars
+    #     for every bar type, even if strategies read only a few of them
+    #   - Auto-sized: capacity = the largest lookback declared by strategies (see `utils_cache`)
+    cache_config = utils_cache.auto_cache_config(strategy_configs)
     engine_config = BacktestEngineConfig(
         trader_id=TraderId("BACKTEST_TRADER-001"),
-        # FOCUS POINT: configure cache
-        cache=CacheConfig(
-            bar_capacity=100_000,  # Number of bars stored in Cache (per bar type)
-            tick_capacity=100_000,  # Number of ticks stored in Cache (per bar type)
-        ),
+        cache=cache_config,
         logging=LoggingConfig(log_level="DEBUG"),
     )
     engine = BacktestEngine(config=engine_config)
 
-    # Venue: create + add to engine
+    # Venue: add to engine
     #   - Note: Venue must be added first -> before Instrument
-    venue: Venue = Venue("GLBX")
     engine.add_venue(
         venue=venue,
         oms_type=OmsType.NETTING,  # Order Management System type
@@ -40,28 +56,20 @@ if __name__ == "__main__":
         default_leverage=Decimal(1),
     )
 
-    # Instrument: create + add to engine
-    eurusd_future_instrument = utils_instruments.eurusd_future(2024, 3, venue.value)
+    # Instrument: add to engine
     engine.add_instrument(eurusd_future_instrument)
 
     # BAR DATA: LOAD FROM CSV + ADD TO ENGINE
-    # Step 1: Define bar type
-    eurusd_future_1min_bar_type = BarType.from_str(
-        f"{eurusd_future_instrument.id}-1-MINUTE-LAST-EXTERNAL"
-    )
-    # Step 2: Load bar data from CSV file
+    # Step 1: Load bar data from CSV file
     eurusd_futures_1min_bars_list: list[Bar] = utils_csv.load_bars_from_ninjatrader_csv(
         csv_path=r"../!market_data/cme/futures/fx/6EH4.GLBX_1min_bars_20240101_20240131.csv",
         instrument=eurusd_future_instrument,
         bar_type=eurusd_future_1min_bar_type,
     )
-    # Step 3: Add bars to engine
+    # Step 2: Add bars to engine
     engine.add_data(eurusd_futures_1min_bars_list)
 
-    # Strategy: Configure -> create -> add to engine
-    strategy_config = DemoStrategyConfig(
-        instrument=eurusd_future_instrument, primary_bar_type=eurusd_future_1min_bar_type
-    )
+    # Strategy: create -> add to engine
     strategy = DemoStrategy(strategy_config)
     engine.add_strategy(strategy)
 
@@ -91,5 +99,18 @@ if __name__ == "__main__":
         print(f"\n{'-' * n_dashes}\nPositions report: {venue}\n{'-' * n_dashes}")
         print(engine.trader.generate_positions_report())
 
+    # Memory of Cache: fixed 100k capacity vs auto-sized capacity
+    print(f"\n{'-' * n_dashes}\nCache memory\n{'-' * n_dashes}")
+    assert engine.cache.bar_count(eurusd_future_1min_bar_type) == min(
+        len(eurusd_futures_1min_bars_list), cache_config.bar_capacity
+    ), "Cache doesn't store expected number of bars"
+    utils_cache.print_cache_memory_report(
+        strategy_configs,
+        bars_counts={eurusd_future_1min_bar_type: len(eurusd_futures_1min_bars_list)},
+        sample_bar=eurusd_futures_1min_bars_list[0],
+        capacity_before=100_000,
+        capacity_after=cache_config.bar_capacity,
+    )
+
     # Cleanup resources
     engine.dispose()
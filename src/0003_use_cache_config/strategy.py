@@ -2,6 +2,7 @@ from nautilus_trader.config import StrategyConfig
 from nautilus_trader.model import Quantity
 from nautilus_trader.model.data import Bar, BarType
 from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.trading.strategy import Strategy
 
@@ -9,6 +10,15 @@ from nautilus_trader.trading.strategy import Strategy
 class DemoStrategyConfig(StrategyConfig, frozen=True):
     instrument: Instrument
     primary_bar_type: BarType
+    # How many bars back strategy reads from Cache (see `on_stop`)
+    lookback_bars: int = 29_001
+
+    # Declare what strategy reads from Cache -> Cache capacity is computed from it (`utils_cache`)
+    def cache_bar_lookbacks(self) -> dict[BarType, int]:
+        return {self.primary_bar_type: self.lookback_bars}
+
+    def cache_tick_lookbacks(self) -> dict[InstrumentId, int]:
+        return {}  # No ticks are read
 
 
 class DemoStrategy(Strategy):
@@ -45,7 +55,8 @@ class DemoStrategy(Strategy):
         self.log.info(f"Total 1-min bars processed: {self.bars_1min_processed}")
 
         # FOCUS POINT:
-        # See we can access many bars back, because store up to 100k bars in Cache
+        # See we can access many bars back, because Cache stores `lookback_bars` bars
+        # (the oldest bar we declared to read = index `lookback_bars - 1`)
         bars = self.cache.bars(self.config.primary_bar_type)
-        idx = 29000
+        idx = self.config.lookback_bars - 1
         self.log.info(f"Accessing bar at index {idx}: {bars[idx]}")
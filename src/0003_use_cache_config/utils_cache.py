@@ -0,0 +1,96 @@
+import sys
+from collections import deque
+
+from nautilus_trader.config import CacheConfig, StrategyConfig
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.identifiers import InstrumentId
+
+
+# Auto-sizing of CacheConfig from what strategies actually read from Cache.
+#
+# Each strategy config declares, how many bars / ticks back it reads from Cache:
+#   - `cache_bar_lookbacks()` -> {bar type: number of bars}, e.g. lookback + indicator periods
+#   - `cache_tick_lookbacks()` -> {instrument ID: number of ticks}
+# Required capacity of each bar type = the largest lookback of all strategies reading it.
+#
+# Note: Nautilus has only one capacity for all bar types (`bar_capacity`) + one for all tick types
+# (`tick_capacity`) -> Cache is configured with the largest required capacity. Bar types with
+# smaller lookbacks still keep up to this capacity, but nothing is kept "just in case" anymore.
+#
+# Note: Cache keeps bars in `deque(maxlen=capacity)` per bar type -> memory grows with stored bars
+# up to capacity (nothing is preallocated). In long runs each bar type gets to its capacity.
+
+MIN_CAPACITY = 1  # Cache requires positive capacity, even if nothing is read
+
+
+def required_bar_capacities(strategy_configs: list[StrategyConfig]) -> dict[BarType, int]:
+    capacities: dict[BarType, int] = {}
+    for config in strategy_configs:
+        for bar_type, lookback in config.cache_bar_lookbacks().items():
+            capacities[bar_type] = max(capacities.get(bar_type, 0), lookback)
+    return capacities
+
+
+def required_tick_capacities(strategy_configs: list[StrategyConfig]) -> dict[InstrumentId, int]:
+    capacities: dict[InstrumentId, int] = {}
+    for config in strategy_configs:
+        for instrument_id, lookback in config.cache_tick_lookbacks().items():
+            capacities[instrument_id] = max(capacities.get(instrument_id, 0), lookback)
+    return capacities
+
+
+def auto_cache_config(strategy_configs: list[StrategyConfig]) -> CacheConfig:
+    bar_capacities = required_bar_capacities(strategy_configs)
+    tick_capacities = required_tick_capacities(strategy_configs)
+    return CacheConfig(
+        bar_capacity=max(bar_capacities.values(), default=MIN_CAPACITY),
+        tick_capacity=max(tick_capacities.values(), default=MIN_CAPACITY),
+    )
+
+
+def bar_memory_bytes(bars_count: int, sample_bar: Bar) -> int:
+    # Memory of `bars_count` bars in Cache = deque slots + Bar objects
+    #   - Note: in backtest Bar objects are shared with engine data (memory of deque slots only),
+    #     in live trading they exist only in Cache
+    deque_bytes = sys.getsizeof(deque(range(bars_count)))
+    return deque_bytes + bars_count * sys.getsizeof(sample_bar)
+
+
+def print_cache_memory_report(
+    strategy_configs: list[StrategyConfig],
+    bars_counts: dict[BarType, int],
+    sample_bar: Bar,
+    capacity_before: int,
+    capacity_after: int,
+):
+    # `bars_counts` = number of bars of each bar type in backtest data
+    # `capacity_before` = fixed capacity (e.g. 100_000), `capacity_after` = auto-sized capacity
+    bar_capacities = required_bar_capacities(strategy_configs)
+    mb = 1024 * 1024
+    total = {"stored_before": 0, "stored_after": 0, "full_before": 0, "full_after": 0}
+    print(f"Cache bar capacity: {capacity_before:,} (fixed) -> {capacity_after:,} (auto-sized)")
+    for bar_type, required in bar_capacities.items():
+        bars_count = bars_counts.get(bar_type, 0)
+        memory = {
+            # Bars stored at the end of this backtest
+            "stored_before": bar_memory_bytes(min(bars_count, capacity_before), sample_bar),
+            "stored_after": bar_memory_bytes(min(bars_count, capacity_after), sample_bar),
+            # Full capacity (long backtests, live trading)
+            "full_before": bar_memory_bytes(capacity_before, sample_bar),
+            "full_after": bar_memory_bytes(capacity_after, sample_bar),
+        }
+        for key, value in memory.items():
+            total[key] += value
+        print(
+            f"  {bar_type}: required {required:,} bars, "
+            f"stored {min(bars_count, capacity_before):,} -> {min(bars_count, capacity_after):,} "
+            f"bars ({memory['stored_before'] / mb:.1f} MB -> {memory['stored_after'] / mb:.1f} MB)"
+        )
+    print(
+        f"Memory saved in this backtest: {(total['stored_before'] - total['stored_after']) / mb:.1f}"
+        f" MB ({total['stored_before'] / mb:.1f} MB -> {total['stored_after'] / mb:.1f} MB)"
+    )
+    print(
+        f"Memory saved at full capacity: {(total['full_before'] - total['full_after']) / mb:.1f}"
+        f" MB ({total['full_before'] / mb:.1f} MB -> {total['full_after'] / mb:.1f} MB)"
+    )
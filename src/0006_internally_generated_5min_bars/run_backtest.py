@@ -12,6 +12,12 @@ from nautilus_trader.model.objects import Money
 import utils_csv
 import utils_instruments
 from strategy import DemoStrategy, DemoStrategyConfig
+from utils_aggregation import aggregate_bars
+
+
+# True = 5-min bars are pre-aggregated from all 1-min bars at once (faster backtest),
+# False = 5-min bars are aggregated by engine during backtest
+USE_PREAGGREGATED_BARS = False
 
 
 if __name__ == "__main__":
@@ -52,10 +58,24 @@ if __name__ == "__main__":
     )
     # Step 3: Add bars to engine
     engine.add_data(eurusd_futures_1min_bars_list)
+    # Step 4 (optional): Pre-aggregate 5-min bars + add them to engine
+    #   - EXTERNAL bar type = bars come from data -> engine starts no aggregator + no timer for them
+    #   - must be added after 1-min bars -> 1-min bar at 10:05 comes before 5-min bar at 10:05
+    #     (the same order as with aggregation in engine)
+    if USE_PREAGGREGATED_BARS:
+        eurusd_future_5min_bar_type = BarType.from_str(
+            f"{eurusd_future_instrument.id}-5-MINUTE-LAST-EXTERNAL"
+        )
+        eurusd_futures_5min_bars_list = aggregate_bars(
+            eurusd_futures_1min_bars_list, eurusd_future_5min_bar_type, eurusd_future_instrument
+        )
+        engine.add_data(eurusd_futures_5min_bars_list)
 
     # Strategy: Configure -> create -> add to engine
     strategy_config = DemoStrategyConfig(
-        instrument=eurusd_future_instrument, primary_bar_type=eurusd_future_1min_bar_type
+        instrument=eurusd_future_instrument,
+        primary_bar_type=eurusd_future_1min_bar_type,
+        use_preaggregated_bars=USE_PREAGGREGATED_BARS,
     )
     strategy = DemoStrategy(strategy_config)
     engine.add_strategy(strategy)
@@ -0,0 +1,183 @@
+import time
+import timeit
+from typing import Callable
+
+from nautilus_trader.backtest.engine import BacktestEngine, Decimal
+from nautilus_trader.config import BacktestEngineConfig, LoggingConfig, StrategyConfig
+from nautilus_trader.model import TraderId
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Money
+from nautilus_trader.trading.strategy import Strategy
+
+import utils_csv
+import utils_instruments
+
+
+# Benchmark: cost of dispatching bars to handlers, as number of subscribed bar types grows
+#   "compare" = `on_bar` compares bar type with each subscribed bar type (like `match bar.bar_type`)
+#   "dict"    = `on_bar` finds handler of bar type in dict (as `DemoStrategy.on_bar` does)
+#   "none"    = `on_bar` only counts bars (cost of engine + message bus routing itself)
+#
+# The same 1-min bars are used in each run, spread evenly over N bar types
+# (bar types differ only by step, e.g. `6EH4.GLBX-7-MINUTE-LAST-EXTERNAL`, bars are only relabeled).
+
+BAR_TYPES_COUNTS = [1, 2, 5, 10, 20, 50, 100]
+DISPATCH_MODES = ["none", "compare", "dict"]
+
+
+class DispatchStrategyConfig(StrategyConfig, frozen=True):
+    bar_types: tuple[BarType, ...]
+    dispatch: str  # one of `DISPATCH_MODES`
+
+
+class DispatchStrategy(Strategy):
+    def __init__(self, config: DispatchStrategyConfig):
+        super().__init__(config)
+        self.bars_processed = 0
+        self.bar_handlers: dict[BarType, Callable[[Bar], None]] = {}
+        self.bar_handlers_list: list[tuple[BarType, Callable[[Bar], None]]] = []
+        self.on_bar = {
+            "none": self.on_bar_none,
+            "compare": self.on_bar_compare,
+            "dict": self.on_bar_dict,
+        }[config.dispatch]
+
+    def on_start(self):
+        for bar_type in self.config.bar_types:
+            self.bar_handlers[bar_type] = self.on_bar_counted
+            self.bar_handlers_list.append((bar_type, self.on_bar_counted))
+            self.subscribe_bars(bar_type)
+
+    def on_bar_none(self, bar: Bar):
+        self.bars_processed += 1
+
+    def on_bar_compare(self, bar: Bar):
+        bar_type = bar.bar_type
+        for handled_bar_type, handler in self.bar_handlers_list:
+            if bar_type == handled_bar_type:
+                handler(bar)
+                return
+        raise Exception(f"Bar type not expected: {bar_type}")
+
+    def on_bar_dict(self, bar: Bar):
+        handler = self.bar_handlers.get(bar.bar_type)
+        if handler is None:
+            raise Exception(f"Bar type not expected: {bar.bar_type}")
+        handler(bar)
+
+    def on_bar_counted(self, bar: Bar):
+        self.bars_processed += 1
+
+
+def relabel_bars(bars: list[Bar], bar_types: list[BarType]) -> list[Bar]:
+    # Bar `i` gets bar type `i % N` -> each bar type has the same number of bars
+    count = len(bar_types)
+    return [
+        Bar(
+            bar_type=bar_types[index % count],
+            open=bar.open,
+            high=bar.high,
+            low=bar.low,
+            close=bar.close,
+            volume=bar.volume,
+            ts_event=bar.ts_event,
+            ts_init=bar.ts_init,
+        )
+        for index, bar in enumerate(bars)
+    ]
+
+
+def run_backtest(
+    instrument: Instrument,
+    bar_types: list[BarType],
+    bars: list[Bar],
+    dispatch: str,
+) -> float:
+    # Engine: configure + create
+    engine_config = BacktestEngineConfig(
+        trader_id=TraderId("BACKTEST_TRADER-001"),
+        logging=LoggingConfig(log_level="ERROR"),
+    )
+    engine = BacktestEngine(config=engine_config)
+    engine.add_venue(
+        venue=Venue("GLBX"),
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.MARGIN,
+        starting_balances=[Money(1_000_000, USD)],
+        base_currency=USD,
+        default_leverage=Decimal(1),
+    )
+    engine.add_instrument(instrument)
+    engine.add_data(bars)
+
+    strategy = DispatchStrategy(
+        DispatchStrategyConfig(bar_types=tuple(bar_types), dispatch=dispatch)
+    )
+    engine.add_strategy(strategy)
+
+    start = time.perf_counter()
+    engine.run()
+    run_secs = time.perf_counter() - start
+
+    assert strategy.bars_processed == len(bars), "Not all bars were processed"
+    engine.dispose()
+    return run_secs
+
+
+if __name__ == "__main__":
+    # Instrument
+    eurusd_future_instrument = utils_instruments.eurusd_future(2024, 3, "GLBX")
+
+    # BAR DATA: LOAD FROM CSV
+    eurusd_future_1min_bar_type = BarType.from_str(
+        f"{eurusd_future_instrument.id}-1-MINUTE-LAST-EXTERNAL"
+    )
+    eurusd_futures_1min_bars_list: list[Bar] = utils_csv.load_bars_from_ninjatrader_csv(
+        csv_path=r"../!market_data/cme/futures/fx/6EH4.GLBX_1min_bars_20240101_20240131.csv",
+        instrument=eurusd_future_instrument,
+        bar_type=eurusd_future_1min_bar_type,
+    )
+    all_bar_types = [
+        BarType.from_str(f"{eurusd_future_instrument.id}-{step}-MINUTE-LAST-EXTERNAL")
+        for step in range(1, max(BAR_TYPES_COUNTS) + 1)
+    ]
+
+    # PART 1: Dispatch only (`on_bar` called directly, without engine)
+    print("Dispatch only - nanoseconds per bar (bars spread evenly over all bar types):")
+    print(f"{'bar types':>10} | {'compare':>8} | {'dict':>8}")
+    for bar_types_count in BAR_TYPES_COUNTS:
+        bar_types = all_bar_types[:bar_types_count]
+        bars = relabel_bars(eurusd_futures_1min_bars_list[:10_000], bar_types)
+        nanos_per_bar = {}
+        for dispatch in ["compare", "dict"]:
+            strategy = DispatchStrategy(
+                DispatchStrategyConfig(bar_types=tuple(bar_types), dispatch=dispatch)
+            )
+            for bar_type in bar_types:
+                strategy.bar_handlers[bar_type] = strategy.on_bar_counted
+                strategy.bar_handlers_list.append((bar_type, strategy.on_bar_counted))
+            on_bar = strategy.on_bar
+            secs = min(timeit.repeat(lambda: [on_bar(bar) for bar in bars], number=1, repeat=5))
+            nanos_per_bar[dispatch] = secs / len(bars) * 1e9
+        print(
+            f"{bar_types_count:>10} | {nanos_per_bar['compare']:>8.0f} | "
+            f"{nanos_per_bar['dict']:>8.0f}"
+        )
+
+    # PART 2: Whole backtest (engine + message bus routing + dispatch)
+    # (first backtest in process is slower -> warm-up run, not measured)
+    run_backtest(eurusd_future_instrument, all_bar_types[:1], eurusd_futures_1min_bars_list, "none")
+    print("\nBacktest - seconds, best of 3 runs (the same bars in each run):")
+    print(f"{'bar types':>10} | " + " | ".join(f"{mode:>8}" for mode in DISPATCH_MODES))
+    for bar_types_count in BAR_TYPES_COUNTS:
+        bar_types = all_bar_types[:bar_types_count]
+        bars = relabel_bars(eurusd_futures_1min_bars_list, bar_types)
+        durations = [
+            min(run_backtest(eurusd_future_instrument, bar_types, bars, dispatch) for _ in range(3))
+            for dispatch in DISPATCH_MODES
+        ]
+        print(f"{bar_types_count:>10} | " + " | ".join(f"{secs:>8.2f}" for secs in durations))
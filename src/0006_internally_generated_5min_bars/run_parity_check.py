@@ -0,0 +1,223 @@
+import time
+
+import pandas as pd
+from nautilus_trader.backtest.engine import BacktestEngine, Decimal
+from nautilus_trader.backtest.models import PerContractFeeModel
+from nautilus_trader.config import BacktestEngineConfig, LoggingConfig, StrategyConfig
+from nautilus_trader.model import TraderId
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.enums import AccountType, AggregationSource, OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Money
+from nautilus_trader.trading.strategy import Strategy
+
+import utils_csv
+import utils_instruments
+from strategy import DemoStrategy, DemoStrategyConfig
+from utils_aggregation import aggregate_bars, aggregate_session_bars
+from utils_sessions import SessionCalendar
+
+
+# Parity check: bars pre-aggregated by `aggregate_bars` vs. bars aggregated by engine in backtest
+#   1. all 5/15/60-min bars received by strategy must be identical (values + timestamps)
+#   2. demo strategy must produce identical fills
+# + comparison of backtest duration + timer events fired in engine
+#
+# Pre-aggregated bars have EXTERNAL bar type (e.g. `6EH4.GLBX-5-MINUTE-LAST-EXTERNAL`), so engine
+# only delivers them - no aggregator + no timer (see `utils_aggregation.py`).
+
+TIMEFRAMES = (5, 15, 60)  # minutes
+
+
+def preaggregated_bar_type(bar_type: BarType) -> BarType:
+    # The same bar spec as bars aggregated by engine, but EXTERNAL (bars come from data)
+    return BarType(bar_type.instrument_id, bar_type.spec, AggregationSource.EXTERNAL)
+
+
+class BarRecorderConfig(StrategyConfig, frozen=True):
+    primary_bar_type: BarType
+    bar_types: tuple[BarType, ...]  # INTERNAL bar types (standard, without `@1-MINUTE-EXTERNAL`)
+    use_preaggregated_bars: bool  # True = subscribe EXTERNAL bar types with the same spec
+
+
+class BarRecorder(Strategy):
+    # Only records all received bars
+    def __init__(self, config: BarRecorderConfig):
+        super().__init__(config)
+        self.bars: list[Bar] = []
+
+    def on_start(self):
+        self.subscribe_bars(self.config.primary_bar_type)
+        for bar_type in self.config.bar_types:
+            if self.config.use_preaggregated_bars:
+                self.subscribe_bars(preaggregated_bar_type(bar_type))
+            else:
+                self.subscribe_bars(BarType.from_str(f"{bar_type}@1-MINUTE-EXTERNAL"))
+
+    def on_bar(self, bar: Bar):
+        self.bars.append(bar)
+
+
+def run_backtest(
+    instrument: Instrument,
+    bars: list[Bar],
+    strategy: Strategy,
+    preaggregated_bar_types: list[BarType],  # EXTERNAL bar types to pre-aggregate
+    calendar: SessionCalendar | None = None,  # None = bars identical to engine aggregation
+) -> tuple[float, int, BacktestEngine]:
+    # Returns: duration in secs, count of timer events fired in engine, engine
+    # Engine: configure + create
+    engine_config = BacktestEngineConfig(
+        trader_id=TraderId("BACKTEST_TRADER-001"),
+        logging=LoggingConfig(log_level="ERROR"),
+    )
+    engine = BacktestEngine(config=engine_config)
+
+    # Venue: create + add to engine
+    engine.add_venue(
+        venue=Venue("GLBX"),
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.MARGIN,
+        starting_balances=[Money(1_000_000, USD)],
+        fee_model=PerContractFeeModel(commission=Money(2.50, USD)),
+        base_currency=USD,
+        default_leverage=Decimal(1),
+    )
+
+    # Instrument + bars: add to engine
+    # (time of pre-aggregation is included in measured time)
+    start = time.perf_counter()
+    engine.add_instrument(instrument)
+    engine.add_data(bars)
+    for bar_type in preaggregated_bar_types:
+        if calendar is None:
+            preaggregated_bars = aggregate_bars(bars, bar_type, instrument)
+        else:
+            preaggregated_bars = aggregate_session_bars(bars, bar_type, instrument, calendar)
+        engine.add_data(preaggregated_bars)
+
+    # Strategy: add to engine + run backtest
+    # (streaming -> engine is not ended yet, so its timers can be inspected)
+    engine.add_strategy(strategy)
+    engine.run(streaming=True)
+    run_secs = time.perf_counter() - start
+    timer_events = count_timer_events(engine, bars[0].ts_init)
+    engine.end()
+
+    return run_secs, timer_events, engine
+
+
+def count_timer_events(engine: BacktestEngine, start_ns: int) -> int:
+    # Timer events fired by bar aggregators in engine since `start_ns` (start of backtest).
+    # Aggregator timer is named by its bar type + fires at each interval end (multiple of step),
+    # so count of fired events = intervals from the first one till the next (not fired) one.
+    clock = engine.kernel.clock
+    count = 0
+    for name in clock.timer_names:
+        step_ns = pd.Timedelta(BarType.from_str(name).spec.timedelta).value
+        first_ns = (start_ns // step_ns + 1) * step_ns
+        count += (clock.next_time_ns(name) - first_ns) // step_ns
+    return count
+
+
+if __name__ == "__main__":
+    # Instrument
+    eurusd_future_instrument = utils_instruments.eurusd_future(2024, 3, "GLBX")
+
+    # BAR DATA: LOAD FROM CSV
+    eurusd_future_1min_bar_type = BarType.from_str(
+        f"{eurusd_future_instrument.id}-1-MINUTE-LAST-EXTERNAL"
+    )
+    eurusd_futures_1min_bars_list: list[Bar] = utils_csv.load_bars_from_ninjatrader_csv(
+        csv_path=r"../!market_data/cme/futures/fx/6EH4.GLBX_1min_bars_20240101_20240131.csv",
+        instrument=eurusd_future_instrument,
+        bar_type=eurusd_future_1min_bar_type,
+    )
+    internal_bar_types = [
+        BarType.from_str(f"{eurusd_future_instrument.id}-{minutes}-MINUTE-LAST-INTERNAL")
+        for minutes in TIMEFRAMES
+    ]
+
+    # CHECK 1: All received 5/15/60-min bars are identical
+    received_bars = {}
+    durations = {}
+    timer_events = {}
+    for use_preaggregated_bars in [False, True]:
+        recorder = BarRecorder(
+            BarRecorderConfig(
+                primary_bar_type=eurusd_future_1min_bar_type,
+                bar_types=tuple(internal_bar_types),
+                use_preaggregated_bars=use_preaggregated_bars,
+            )
+        )
+        secs, timer_events_count, engine = run_backtest(
+            eurusd_future_instrument,
+            eurusd_futures_1min_bars_list,
+            recorder,
+            [preaggregated_bar_type(bar_type) for bar_type in internal_bar_types]
+            if use_preaggregated_bars
+            else [],
+        )
+        engine.dispose()
+        received_bars[use_preaggregated_bars] = recorder.bars
+        durations[use_preaggregated_bars] = secs
+        timer_events[use_preaggregated_bars] = timer_events_count
+
+    # Bars are compared per bar type: order of bars of different bar types with the same timestamp
+    # (e.g. 5 + 15-min bar at 10:15) is given by order of timers in engine, so it is not guaranteed
+    # (1-min bar always comes before internal bars with the same timestamp in both cases)
+    # (pre-aggregated bars differ only by EXTERNAL label -> bars are grouped by bar spec)
+    def bars_by_bar_spec(bars: list[Bar]) -> dict[str, list[tuple]]:
+        result: dict[str, list[tuple]] = {}
+        for bar in bars:
+            # Bar equality doesn't compare prices + volume -> compare all fields
+            fields = (bar.open, bar.high, bar.low, bar.close, bar.volume, bar.ts_event, bar.ts_init)
+            result.setdefault(str(bar.bar_type.spec), []).append(fields)
+        return result
+
+    engine_bars = bars_by_bar_spec(received_bars[False])
+    preaggregated_bars = bars_by_bar_spec(received_bars[True])
+    for bar_type in internal_bar_types:
+        spec = str(bar_type.spec)
+        assert engine_bars[spec] == preaggregated_bars[spec], f"Bars differ: {bar_type}"
+        print(f"OK: {len(preaggregated_bars[spec])} identical bars {spec}")
+
+    # Timer events: each engine aggregator fires its timer at every interval end,
+    # pre-aggregated EXTERNAL bars need no timer at all
+    assert timer_events[True] == 0, "Pre-aggregated bars must not start any timer"
+    aggregated_bars_count = sum(
+        len(engine_bars[str(bar_type.spec)]) for bar_type in internal_bar_types
+    )
+    print(
+        f"OK: timer events {timer_events[False]} (engine aggregation, "
+        f"{aggregated_bars_count} bars) -> {timer_events[True]} (pre-aggregated bars)"
+    )
+
+    # CHECK 2: Demo strategy produces identical fills
+    fills = {}
+    for use_preaggregated_bars in [False, True]:
+        strategy = DemoStrategy(
+            DemoStrategyConfig(
+                instrument=eurusd_future_instrument,
+                primary_bar_type=eurusd_future_1min_bar_type,
+                use_preaggregated_bars=use_preaggregated_bars,
+            )
+        )
+        _, _, engine = run_backtest(
+            eurusd_future_instrument,
+            eurusd_futures_1min_bars_list,
+            strategy,
+            [preaggregated_bar_type(internal_bar_types[0])] if use_preaggregated_bars else [],
+        )
+        report = engine.trader.generate_order_fills_report()
+        fills[use_preaggregated_bars] = report[["side", "filled_qty", "avg_px", "ts_last"]]
+        engine.dispose()
+
+    assert fills[False].equals(fills[True]), "Demo strategy fills differ"
+    print(f"OK: identical fills of demo strategy ({len(fills[True])} orders)")
+
+    # Speed (5/15/60-min bars)
+    print(f"\nBacktest with aggregation in engine:    {durations[False]:.2f} secs")
+    print(f"Backtest with pre-aggregated bars:      {durations[True]:.2f} secs")
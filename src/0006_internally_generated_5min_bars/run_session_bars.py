@@ -0,0 +1,124 @@
+import time
+
+import pandas as pd
+from nautilus_trader.model.data import Bar, BarType
+
+import utils_csv
+import utils_instruments
+from run_parity_check import preaggregated_bar_type, run_backtest
+from strategy import DemoStrategy, DemoStrategyConfig
+from utils_aggregation import aggregate_bars, aggregate_session_bars
+from utils_sessions import CME_GLOBEX_FX
+
+
+# Session-aware bars vs. bars aggregated by engine (= `aggregate_bars`)
+#   - engine creates flat bars (+ fires timer) for each interval of daily breaks and weekends
+#   - session bars exist only inside sessions, they start at session open + end at session close
+#   - pre-aggregated session bars are delivered as EXTERNAL bars -> no aggregator, no timer events
+
+
+def print_bars(title: str, bars: list[Bar], count: int = 8):
+    print(f"\n{title}")
+    for bar in bars[:count]:
+        print(
+            f"  {pd.Timestamp(bar.ts_event, tz='UTC')} | close: {bar.close} | volume: {bar.volume}"
+        )
+
+
+if __name__ == "__main__":
+    # Instrument
+    eurusd_future_instrument = utils_instruments.eurusd_future(2024, 3, "GLBX")
+
+    # BAR DATA: LOAD FROM CSV
+    eurusd_future_1min_bar_type = BarType.from_str(
+        f"{eurusd_future_instrument.id}-1-MINUTE-LAST-EXTERNAL"
+    )
+    eurusd_futures_1min_bars_list: list[Bar] = utils_csv.load_bars_from_ninjatrader_csv(
+        csv_path=r"../!market_data/cme/futures/fx/6EH4.GLBX_1min_bars_20240101_20240131.csv",
+        instrument=eurusd_future_instrument,
+        bar_type=eurusd_future_1min_bar_type,
+    )
+
+    # 5-min bars: engine aggregation vs. session-aware aggregation
+    bar_type_5min = BarType.from_str(f"{eurusd_future_instrument.id}-5-MINUTE-LAST-INTERNAL")
+    engine_bars = aggregate_bars(
+        eurusd_futures_1min_bars_list, bar_type_5min, eurusd_future_instrument
+    )
+    start = time.perf_counter()
+    session_bars = aggregate_session_bars(
+        eurusd_futures_1min_bars_list, bar_type_5min, eurusd_future_instrument, CME_GLOBEX_FX
+    )
+    aggregation_secs = time.perf_counter() - start
+
+    # Inside sessions, bars are identical (session opens at full hour -> the same 5-min intervals)
+    session_bars_by_ts = {bar.ts_event: bar for bar in session_bars}
+    removed_bars = [bar for bar in engine_bars if bar.ts_event not in session_bars_by_ts]
+    for bar in engine_bars:
+        if bar.ts_event in session_bars_by_ts:
+            session_bar = session_bars_by_ts[bar.ts_event]
+            assert (bar.open, bar.high, bar.low, bar.close, bar.volume) == (
+                session_bar.open,
+                session_bar.high,
+                session_bar.low,
+                session_bar.close,
+                session_bar.volume,
+            ), f"Bars differ at {pd.Timestamp(bar.ts_event, tz='UTC')}"
+    assert len(session_bars) + len(removed_bars) == len(engine_bars)
+
+    print(f"5-min bars aggregated by engine:  {len(engine_bars)}")
+    print(f"5-min session bars:               {len(session_bars)} ({aggregation_secs:.3f} secs)")
+    print(
+        f"OK: session bars are identical to engine bars, {len(removed_bars)} flat bars "
+        f"outside sessions are not created"
+    )
+    print(f"All removed bars are flat: {all(bar.volume == 0 for bar in removed_bars)}")
+
+    # 4-hour bars: engine aligns intervals to midnight UTC, session bars to session open (17:00 CT)
+    bar_type_4h = BarType.from_str(f"{eurusd_future_instrument.id}-4-HOUR-LAST-INTERNAL")
+    print_bars(
+        "4-hour bars aggregated by engine (from midnight UTC):",
+        aggregate_bars(eurusd_futures_1min_bars_list, bar_type_4h, eurusd_future_instrument),
+    )
+    print_bars(
+        "4-hour session bars (from session open 23:00 UTC, last bar of session is partial):",
+        aggregate_session_bars(
+            eurusd_futures_1min_bars_list, bar_type_4h, eurusd_future_instrument, CME_GLOBEX_FX
+        ),
+    )
+
+    # Backtest: 5-min bars aggregated by engine vs. pre-aggregated session bars
+    #   - duration, count of 5-min bars processed by strategy, timer events fired in engine
+    #   - demo strategy counts 5-min bars -> orders are at different times, without flat bars
+    results = {}
+    for use_preaggregated_bars in [False, True]:
+        strategy = DemoStrategy(
+            DemoStrategyConfig(
+                instrument=eurusd_future_instrument,
+                primary_bar_type=eurusd_future_1min_bar_type,
+                use_preaggregated_bars=use_preaggregated_bars,
+            )
+        )
+        secs, timer_events, engine = run_backtest(
+            eurusd_future_instrument,
+            eurusd_futures_1min_bars_list,
+            strategy,
+            preaggregated_bar_types=[preaggregated_bar_type(bar_type_5min)]
+            if use_preaggregated_bars
+            else [],
+            calendar=CME_GLOBEX_FX,
+        )
+        engine.dispose()
+        results[use_preaggregated_bars] = (secs, strategy.bars_5min_processed, timer_events)
+
+    # Engine aggregation: one timer event per 5-min interval (incl. breaks + weekends),
+    # session bars: no timer at all
+    assert results[False][2] == results[False][1], "Expected 1 timer event per aggregated bar"
+    assert results[True][2] == 0, "Pre-aggregated session bars must not start any timer"
+
+    print()
+    for use_preaggregated_bars, title in [(False, "engine aggregation"), (True, "session bars")]:
+        secs, count, timer_events = results[use_preaggregated_bars]
+        print(
+            f"Backtest with {title:<20} {secs:.2f} secs "
+            f"({count} 5-min bars processed, {timer_events} timer events)"
+        )
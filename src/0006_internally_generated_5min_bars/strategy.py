@@ -1,3 +1,5 @@
+from typing import Callable
+
 from nautilus_trader.config import StrategyConfig
 from nautilus_trader.model import Quantity
 from nautilus_trader.model.data import Bar, BarType
@@ -9,6 +11,13 @@ from nautilus_trader.trading.strategy import Strategy
 class DemoStrategyConfig(StrategyConfig, frozen=True):
     instrument: Instrument
     primary_bar_type: BarType
+    # False = 5-min bars are aggregated by engine during backtest (from subscribed 1-min bars)
+    # True  = 5-min bars were pre-aggregated before backtest and added into engine as data
+    #         (see `utils_aggregation.aggregate_bars`) under EXTERNAL bar type
+    #         -> engine only delivers them, no aggregator + no timer is started
+    #         (subscribing `5-MINUTE-LAST-INTERNAL` would start aggregator with 5-min timer,
+    #         which fires during the whole backtest, even if bars come from data)
+    use_preaggregated_bars: bool = False
 
 
 class DemoStrategy(Strategy):
@@ -19,26 +28,46 @@ class DemoStrategy(Strategy):
         self.bars_5min_processed = 0
         # New 5-min bar type
         self.bar_type_5min = BarType.from_str(f"{config.instrument.id}-5-MINUTE-LAST-INTERNAL")
+        # Handler for each subscribed bar type (see `subscribe_bars_with_handler`)
+        self.bar_handlers: dict[BarType, Callable[[Bar], None]] = {}
 
     def on_start(self):
         # Subscribe to primary bars (1-min external data)
-        self.subscribe_bars(self.config.primary_bar_type)
+        self.subscribe_bars_with_handler(self.config.primary_bar_type, self.on_bar_1min)
+
+        if self.config.use_preaggregated_bars:
+            # 5-min bars are already in engine data (the same bars + timestamps, EXTERNAL label)
+            self.subscribe_bars_with_handler(
+                BarType.from_str(f"{self.config.instrument.id}-5-MINUTE-LAST-EXTERNAL"),
+                self.on_bar_5min,
+            )
+        else:
+            # Subscribe to secondary derived bars (5-min internal bars, generated from 1-min bars)
+            self.subscribe_bars_with_handler(
+                BarType.from_str(f"{self.bar_type_5min}@1-MINUTE-EXTERNAL"), self.on_bar_5min
+            )
 
-        # Subscribe to secondary derived bars (5-min internal bars, generated from 1-min external bars)
-        self.subscribe_bars(BarType.from_str(f"{self.bar_type_5min}@1-MINUTE-EXTERNAL"))
+    def subscribe_bars_with_handler(self, bar_type: BarType, handler: Callable[[Bar], None]):
+        # Received bars have standard bar type (without `@1-MINUTE-EXTERNAL`)
+        self.bar_handlers[bar_type.standard()] = handler
+        self.subscribe_bars(bar_type)
 
     def on_bar(self, bar: Bar):
-        # Count processed bars (by bar type)
-        match bar.bar_type:
-            case self.config.primary_bar_type:
-                self.bars_1min_processed += 1
-            case self.bar_type_5min:
-                self.bars_5min_processed += 1
-            case _:
-                raise Exception(f"Bar type not expected: {bar.bar_type}")
+        # One dict lookup per bar, instead of comparing bar type with each subscribed bar type
+        # (see `run_benchmark_dispatch.py`)
+        handler = self.bar_handlers.get(bar.bar_type)
+        if handler is None:
+            raise Exception(f"Bar type not expected: {bar.bar_type}")
+        handler(bar)
+
+    def on_bar_1min(self, bar: Bar):
+        self.bars_1min_processed += 1
+
+    def on_bar_5min(self, bar: Bar):
+        self.bars_5min_processed += 1
 
         # Enter position: on 5th (5-min bar)
-        if (bar.bar_type == self.bar_type_5min) and (self.bars_5min_processed == 5):
+        if self.bars_5min_processed == 5:
             order = self.order_factory.market(
                 instrument_id=self.config.instrument.id,
                 order_side=OrderSide.BUY,
@@ -48,7 +77,7 @@ class DemoStrategy(Strategy):
             self.log.info("Entering position.")
 
         # Close position: on 10th (5-min bar)
-        if (bar.bar_type == self.bar_type_5min) and (self.bars_5min_processed == 100):
+        if self.bars_5min_processed == 100:
             self.close_all_positions(instrument_id=self.config.instrument.id)
             self.log.info("Closing position.")
 
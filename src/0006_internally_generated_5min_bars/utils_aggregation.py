@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.instruments import Instrument
+
+from utils_sessions import SessionCalendar
+
+
+# Vectorized pre-aggregation of bars for backtests.
+#
+# Instead of subscribing `5-MINUTE-LAST-INTERNAL@1-MINUTE-EXTERNAL` (engine aggregates bars
+# one by one during backtest, with timer for each bar), 5-min bars are computed from all 1-min bars
+# at once before the backtest and added into engine as data.
+#
+# Use EXTERNAL bar type for pre-aggregated bars (e.g. `...-5-MINUTE-LAST-EXTERNAL`):
+# subscribing INTERNAL time bar type always starts aggregator with its own timer in engine
+# (it fires every interval of the whole backtest, even if all bars come from data).
+#
+# `aggregate_bars` - bars are identical to bars of Nautilus time bar aggregator (default settings):
+#   - bar closes at interval end (e.g. 10:05), 1-min bar at 10:05 belongs to interval (10:00, 10:05]
+#   - ts_event = ts_init = interval end
+#   - interval without any data gives flat bar (OHLC = last close, volume = 0)
+#   - last interval is not closed, if data end before its end (timer would not fire in backtest)
+#
+# `aggregate_session_bars` - the same, but intervals follow trading sessions of `SessionCalendar`:
+#   - intervals start at session open (not at midnight UTC), e.g. 4-hour bars 17:00, 21:00, ...
+#   - last interval of session ends at session close -> partial bar (e.g. 4-hour bar 13:00 - 16:00)
+#   - no bars outside sessions (no flat bars for daily breaks, weekends + holidays)
+
+
+def aggregate_bars(bars: list[Bar], bar_type: BarType, instrument: Instrument) -> list[Bar]:
+    # `bars` must be sorted by time
+    # `bar_type` = target time bar type, e.g. `...-5-MINUTE-LAST-EXTERNAL`
+    step_ns = _step_ns(bar_type)
+    if not bars:
+        return []
+
+    # Step 1: Input bars as NumPy arrays
+    ts_event, prices, volumes = _bars_to_arrays(bars)
+
+    # Step 2: End of interval for each input bar (ceil to multiple of step)
+    interval_ends = -(-ts_event // step_ns) * step_ns
+
+    # Step 3: All intervals from the first interval with data to the last closed interval
+    all_ends = np.arange(interval_ends[0], ts_event[-1] + 1, step_ns, dtype=np.int64)
+
+    # Step 4: OHLCV of each interval (incl. flat bars) -> bars
+    return _aggregate(bar_type, instrument, interval_ends, prices, volumes, all_ends)
+
+
+def aggregate_session_bars(
+    bars: list[Bar],
+    bar_type: BarType,
+    instrument: Instrument,
+    calendar: SessionCalendar,
+) -> list[Bar]:
+    # `bars` must be sorted by time, input bars outside sessions are ignored
+    # `bar_type` = target time bar type, e.g. `...-5-MINUTE-LAST-EXTERNAL`
+    step_ns = _step_ns(bar_type)
+    if not bars:
+        return []
+
+    # Step 1: Input bars as NumPy arrays + session of each input bar
+    ts_event, prices, volumes = _bars_to_arrays(bars)
+    session_opens, session_closes = calendar.sessions(ts_event[0], ts_event[-1])
+    # Input bar belongs to session, if open < ts_event <= close (the same as bar intervals)
+    sessions = np.searchsorted(session_closes, ts_event, side="left")
+    in_session = sessions < len(session_closes)
+    in_session[in_session] = session_opens[sessions[in_session]] < ts_event[in_session]
+    if not in_session.all():
+        ts_event, sessions = ts_event[in_session], sessions[in_session]
+        prices, volumes = prices[:, in_session], volumes[in_session]
+        if len(ts_event) == 0:
+            return []
+    opens, closes = session_opens[sessions], session_closes[sessions]
+
+    # Step 2: End of interval for each input bar (counted from session open, max. session close)
+    interval_ends = np.minimum(opens + -(-(ts_event - opens) // step_ns) * step_ns, closes)
+
+    # Step 3: All intervals of sessions with data (sessions without data = holidays -> no bars)
+    used = np.unique(sessions)
+    opens, closes = session_opens[used], session_closes[used]
+    counts = -(-(closes - opens) // step_ns)  # intervals per session
+    first_index = np.repeat(np.cumsum(counts) - counts, counts)
+    steps = np.arange(counts.sum(), dtype=np.int64) - first_index + 1
+    all_ends = np.minimum(np.repeat(opens, counts) + steps * step_ns, np.repeat(closes, counts))
+    # Only intervals after the first input bar, which were closed before the last input bar
+    all_ends = all_ends[(all_ends >= interval_ends[0]) & (all_ends <= ts_event[-1])]
+
+    # Step 4: OHLCV of each interval (incl. flat bars) -> bars
+    return _aggregate(bar_type, instrument, interval_ends, prices, volumes, all_ends)
+
+
+def _step_ns(bar_type: BarType) -> int:
+    if not bar_type.spec.is_time_aggregated():
+        raise ValueError(f"Only time bars can be pre-aggregated, got {bar_type}")
+    return pd.Timedelta(bar_type.spec.timedelta).value
+
+
+def _bars_to_arrays(bars: list[Bar]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # ts_event (int64), prices (4 rows: open, high, low, close) + volumes (float64)
+    count = len(bars)
+    ts_event = np.fromiter((bar.ts_event for bar in bars), dtype=np.int64, count=count)
+    prices = np.empty((4, count), dtype=np.float64)
+    prices[0] = np.fromiter((bar.open.as_double() for bar in bars), dtype=np.float64, count=count)
+    prices[1] = np.fromiter((bar.high.as_double() for bar in bars), dtype=np.float64, count=count)
+    prices[2] = np.fromiter((bar.low.as_double() for bar in bars), dtype=np.float64, count=count)
+    prices[3] = np.fromiter((bar.close.as_double() for bar in bars), dtype=np.float64, count=count)
+    volumes = np.fromiter((bar.volume.as_double() for bar in bars), dtype=np.float64, count=count)
+    return ts_event, prices, volumes
+
+
+def _aggregate(
+    bar_type: BarType,
+    instrument: Instrument,
+    interval_ends: np.ndarray,
+    prices: np.ndarray,
+    volumes: np.ndarray,
+    all_ends: np.ndarray,
+) -> list[Bar]:
+    # `interval_ends` = interval of each input bar (sorted)
+    # `all_ends` = intervals to create bars for
+    if len(all_ends) == 0:
+        return []
+    opens, highs, lows, closes = prices
+
+    # OHLCV of each interval with data (input bars are sorted -> intervals are continuous)
+    starts = np.flatnonzero(np.r_[True, interval_ends[1:] != interval_ends[:-1]])
+    lasts = np.r_[starts[1:], len(interval_ends)] - 1
+    group_ends = interval_ends[starts]
+    group_opens = opens[starts]
+    group_highs = np.maximum.reduceat(highs, starts)
+    group_lows = np.minimum.reduceat(lows, starts)
+    group_closes = closes[lasts]
+    group_volumes = np.add.reduceat(volumes, starts)
+
+    # Intervals without data -> flat bars with close of the latest interval with data
+    latest = np.searchsorted(group_ends, all_ends, side="right") - 1
+    has_data = group_ends[latest] == all_ends
+    flat_prices = group_closes[latest]
+
+    out_opens = np.where(has_data, group_opens[latest], flat_prices)
+    out_highs = np.where(has_data, group_highs[latest], flat_prices)
+    out_lows = np.where(has_data, group_lows[latest], flat_prices)
+    out_closes = np.where(has_data, group_closes[latest], flat_prices)
+    out_volumes = np.where(has_data, group_volumes[latest], 0.0)
+    ts = all_ends.astype(np.uint64)
+
+    # Create bars in one call (prices are rounded to instrument precision)
+    return Bar.from_raw_arrays_to_list(
+        bar_type,
+        instrument.price_precision,
+        instrument.size_precision,
+        out_opens,
+        out_highs,
+        out_lows,
+        out_closes,
+        out_volumes,
+        ts,
+        ts,
+    )
@@ -0,0 +1,60 @@
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+
+
+class SessionCalendar:
+    # Trading sessions of exchange (in exchange local time, converted to UTC incl. daylight saving).
+    #
+    # Session is identified by its trading day = day, when it closes. If `open_time` is after
+    # `close_time`, session opens on previous day (e.g. CME FX: Sunday 17:00 -> Monday 16:00).
+    #
+    # Usage:
+    #   calendar = SessionCalendar("America/Chicago", dt.time(17), dt.time(16))
+    #   opens, closes = calendar.sessions(start_ns, end_ns)  # UTC nanoseconds
+    #
+    # Optional:
+    #   - `holidays` = trading days without session
+    #   - `early_closes` = trading days with other close time, e.g. {date(2024, 11, 29): time(12)}
+
+    def __init__(
+        self,
+        timezone: str,
+        open_time: dt.time,
+        close_time: dt.time,
+        weekdays: tuple[int, ...] = (0, 1, 2, 3, 4),  # trading days Monday..Friday
+        holidays: set[dt.date] | None = None,
+        early_closes: dict[dt.date, dt.time] | None = None,
+    ):
+        self.timezone = timezone
+        self.open_time = open_time
+        self.close_time = close_time
+        self.weekdays = weekdays
+        self.holidays = holidays or set()
+        self.early_closes = early_closes or {}
+
+    def sessions(self, start_ns: int, end_ns: int) -> tuple[np.ndarray, np.ndarray]:
+        # Opens + closes (UTC nanoseconds, sorted) of all sessions overlapping [start_ns, end_ns]
+        first_day = pd.Timestamp(start_ns, tz="UTC").tz_convert(self.timezone).date()
+        last_day = pd.Timestamp(end_ns, tz="UTC").tz_convert(self.timezone).date()
+        # Overnight session opens on previous day
+        open_days_before = 1 if self.open_time >= self.close_time else 0
+
+        opens, closes = [], []
+        for day in pd.date_range(first_day, last_day + dt.timedelta(days=1)).date:
+            if day.weekday() not in self.weekdays or day in self.holidays:
+                continue
+            open_day = day - dt.timedelta(days=open_days_before)
+            opens.append(dt.datetime.combine(open_day, self.open_time))
+            closes.append(dt.datetime.combine(day, self.early_closes.get(day, self.close_time)))
+
+        # Local time -> UTC nanoseconds
+        opens_ns = pd.DatetimeIndex(opens).tz_localize(self.timezone).tz_convert("UTC").asi8
+        closes_ns = pd.DatetimeIndex(closes).tz_localize(self.timezone).tz_convert("UTC").asi8
+        overlapping = (closes_ns >= start_ns) & (opens_ns <= end_ns)
+        return opens_ns[overlapping], closes_ns[overlapping]
+
+
+# CME Globex FX futures (e.g. 6E): Sunday - Friday, 17:00 - 16:00 Chicago time (1-hour daily break)
+CME_GLOBEX_FX = SessionCalendar("America/Chicago", dt.time(17, 0), dt.time(16, 0))
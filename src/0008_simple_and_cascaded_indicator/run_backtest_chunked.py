@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+from nautilus_trader.backtest.engine import BacktestEngine, Decimal
+from nautilus_trader.config import BacktestEngineConfig, LoggingConfig
+from nautilus_trader.model import TraderId
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Money
+
+import utils_csv
+import utils_instruments
+from strategy import DemoStrategy, DemoStrategyConfig
+
+
+# Backtest split into 2 chunks, where state of indicators is carried from 1st chunk into 2nd one
+# (the same way, as live strategy keeps its indicators over restart).
+#
+#   1st chunk: run -> `strategy.save()` -> state (calls `DemoStrategy.on_save()`)
+#   2nd chunk: new engine + new strategy -> `strategy.load(state)` (calls `DemoStrategy.on_load()`)
+#              -> indicators are initialized from the first bar, no warmup / replay of history
+#
+# Result must be the same as one continuous backtest over all bars. Script fails, if it differs.
+# Round trip of pickled Nautilus indicators is checked also alone: state right after restore
+# must be equal to state of uninterrupted run at the end of 1st chunk.
+
+CSV_PATH = r"../!market_data/cme/futures/fx/6EH4.GLBX_1min_bars_20240101_20240131.csv"
+SPLIT = pd.Timestamp("2024-01-15", tz="UTC")  # 1st chunk = bars before, 2nd chunk = the rest
+
+
+def run_chunk(
+    instrument: Instrument,
+    bar_type: BarType,
+    bars: list[Bar],
+    state: dict[str, bytes] | None = None,
+) -> DemoStrategy:
+    engine = BacktestEngine(
+        config=BacktestEngineConfig(
+            trader_id=TraderId("BACKTEST_TRADER-001"),
+            logging=LoggingConfig(log_level="WARNING"),
+        )
+    )
+    engine.add_venue(
+        venue=Venue("GLBX"),
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.MARGIN,
+        starting_balances=[Money(1_000_000, USD)],
+        base_currency=USD,
+        default_leverage=Decimal(1),
+    )
+    engine.add_instrument(instrument)
+    engine.add_data(bars)
+
+    strategy = DemoStrategy(DemoStrategyConfig(instrument=instrument, primary_bar_type=bar_type))
+    engine.add_strategy(strategy)
+    # Restore state saved by previous chunk (strategy must be added to engine first)
+    if state is not None:
+        strategy.load(state)
+
+    engine.run()
+    engine.dispose()
+    return strategy
+
+
+if __name__ == "__main__":
+    instrument = utils_instruments.eurusd_future(2024, 3, "GLBX")
+    bar_type = BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL")
+    bars = utils_csv.load_bars_from_ninjatrader_csv(CSV_PATH, instrument, bar_type)
+    bars_chunk_1 = [bar for bar in bars if bar.ts_init < SPLIT.value]
+    bars_chunk_2 = [bar for bar in bars if bar.ts_init >= SPLIT.value]
+
+    # One continuous backtest
+    continuous = run_chunk(instrument, bar_type, bars)
+
+    # The same backtest in 2 chunks
+    first = run_chunk(instrument, bar_type, bars_chunk_1)
+    state = first.save()
+
+    # Round trip check: restore into graph of new strategy = the same state as after 1st chunk
+    restored = DemoStrategy(DemoStrategyConfig(instrument=instrument, primary_bar_type=bar_type))
+    restored.indicators_1min.restore(state["indicators_1min"])
+    # Reference held by strategy must still be the indicator in graph (not replaced by restore)
+    assert restored.indicators_1min.node("ema10").indicator is restored.ema10, (
+        "ema10: indicator object was replaced by restore"
+    )
+    for name in ["ema10", "ema20", "ema_spread"]:
+        expected_node = first.indicators_1min.node(name)
+        actual_node = restored.indicators_1min.node(name)
+        assert actual_node.value == expected_node.value, f"{name}: restored value differs"
+        assert actual_node.initialized == expected_node.initialized, f"{name}: initialized differs"
+        if expected_node.indicator is not None:
+            # Whole internal state of Nautilus indicator (value, count, buffers, ...)
+            assert (
+                actual_node.indicator.__reduce__()[2] == expected_node.indicator.__reduce__()[2]
+            ), f"{name}: restored indicator state differs"
+    assert restored.ema10.value == first.ema10.value, "ema10: value of held reference differs"
+
+    second = run_chunk(instrument, bar_type, bars_chunk_2, state=state)
+
+    rows = []
+    for name in ["ema10", "ema20", "ema_spread"]:
+        expected = continuous.indicators_1min.history(name)
+        actual = second.indicators_1min.history(name)
+        assert expected[0] == actual[0], f"{name}: latest value differs"
+        assert np.array_equal(expected.window(len(expected)), actual.window(len(actual))), (
+            f"{name}: history differs"
+        )
+        rows.append({"indicator": name, "latest_value": actual[0], "history_values": len(actual)})
+    # References held by strategy were updated by restore + by all bars of 2nd chunk
+    assert second.ema10.value == continuous.ema10.value, "ema10: value of held reference differs"
+    assert second.ema20.value == continuous.ema20.value, "ema20: value of held reference differs"
+
+    print(f"State size: {sum(len(value) for value in state.values())} bytes")
+    print("OK: Chunked backtest with restored indicators = continuous backtest")
+    print(pd.DataFrame(rows).set_index("indicator"))
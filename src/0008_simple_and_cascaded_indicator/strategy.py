@@ -1,5 +1,3 @@
-from collections import deque
-
 from nautilus_trader.config import StrategyConfig
 from nautilus_trader.indicators.average.ma_factory import (
     MovingAverageFactory,
@@ -9,6 +7,12 @@ from nautilus_trader.model.data import Bar, BarType
 from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.trading.strategy import Strategy
 
+from utils_indicator_graph import IndicatorGraph
+
+
+# How many historical values of each indicator are stored (older values are overwritten)
+INDICATOR_HISTORY_CAPACITY = 1_000
+
 
 class DemoStrategyConfig(StrategyConfig, frozen=True):
     instrument: Instrument
@@ -24,63 +28,79 @@ class DemoStrategy(Strategy):
         # 1-min bar type (from config)
         self.bar_type_1min = config.primary_bar_type
 
-        # Indicator: EMA(10) that will be calculated on 1-min bars
-        self.indicator_ema10 = MovingAverageFactory.create(10, MovingAverageType.EXPONENTIAL)
-        self.indicator_ema10_history = deque()  # we will store historical values here
+        # Indicator graph: all indicators calculated on 1-min bars are declared in one place.
+        # Graph updates them in correct order and collects historical values of each of them.
+        self.indicators_1min = IndicatorGraph(history_capacity=INDICATOR_HISTORY_CAPACITY)
+
+        # Indicator: EMA(10) that will be calculated on 1-min bars (no input = fed by bars)
+        # (strategy keeps its own reference, it stays valid also after `restore()` of graph state)
+        self.ema10 = MovingAverageFactory.create(10, MovingAverageType.EXPONENTIAL)
+        self.indicators_1min.add_indicator("ema10", self.ema10)
 
         # Indicator: Cascaded indicator
         # This will calculate EMA(20) values from of previous EMA(10) indicator calculated on bars
-        self.indicator_ema20 = MovingAverageFactory.create(20, MovingAverageType.EXPONENTIAL)
-        self.indicator_ema20_history = deque()  # we will store historical values here
+        self.ema20 = MovingAverageFactory.create(20, MovingAverageType.EXPONENTIAL)
+        self.indicators_1min.add_indicator("ema20", self.ema20, input="ema10")
+
+        # Transform: any function of other nodes, here distance between both EMAs
+        self.indicators_1min.add_transform(
+            "ema_spread", lambda ema10, ema20: ema10 - ema20, inputs=["ema10", "ema20"]
+        )
 
     def on_start(self):
         # SUBSCRIBE TO BARS
         # Subscription 1: primary bars (1-min external data)
         self.subscribe_bars(self.config.primary_bar_type)
 
-        # REGISTER INDICATOR to bars, so indicators will automatically feeded by new bars and updated
-        # Register indicator
-        self.register_indicator_for_bars(self.bar_type_1min, self.indicator_ema10)
+        # REGISTER INDICATOR GRAPH to bars, so all indicators in graph will be automatically
+        # feeded by new bars and updated (cascaded ones too) - no manual `update_raw` in `on_bar`
+        self.register_indicator_for_bars(self.bar_type_1min, self.indicators_1min)
 
         # NOTE:
-        # Indicator(s) work that way, that they calculate / store only last value. In case we need
-        # to store historical values, we need to store them manually - what we do in this example
+        # Indicator(s) work that way, that they calculate / store only last value.
+        # Graph stores also historical values of each node - see `self.indicators_1min.history(...)`
 
     def on_bar(self, bar: Bar):
         self.bars_1min_processed += 1  # Just count 1-min bars
 
-        # Collect historical values of EMA(10)
-        # As we registered EMA(10) indicator, we can expect, it automatically has the latest calculated value
-        ema_10_current_value = self.indicator_ema10.value
-        # Store latest value. We append from left, so value at index 0 is always the latest in list
-        self.indicator_ema10_history.appendleft(ema_10_current_value)
-
-        # Calculate cascaded indicator EMA(20) manually
-        # Update EMA(20) on indicator EMA(20) on 1-min-bars
-        # We need to wait, until EMA(10) is initialized = has first value after first 10 bars
-        if self.indicator_ema10.initialized:
-            # Feed input value into indicator manually
-            self.indicator_ema20.update_raw(self.indicator_ema10.value)
-            # Collect historical values
-            self.indicator_ema20_history.appendleft(self.indicator_ema20.value)
-
-        # Wait until both indicators are initialized
+        # Wait until all indicators in graph are initialized
         # i.e. they have enough input data and have calculated first value)
-        if (not self.indicator_ema10.initialized) or (not self.indicator_ema20.initialized):
-            self.log.info("Still waiting till both indicators are initialized...")
+        if not self.indicators_1min.initialized:
+            self.log.info("Still waiting till all indicators are initialized...")
             return
 
         # Now we can read indicator values and do whatever we need in our strategy
-        # Read latest value directly from indicator
-        ema10_last_value = self.indicator_ema10.value
+        # Read latest value directly from graph
+        ema10_last_value = self.indicators_1min.value("ema10")
+        # Read history of node. Value at index 0 is always the latest in history
+        ema10_history = self.indicators_1min.history("ema10")
         # Read latest value from history - should provide the same value as previous `ema10_last_value`
-        ema10_last_value_from_history = self.indicator_ema10_history[0]
+        ema10_last_value_from_history = ema10_history[0]
         # Value at 5-bars back is at index 4 (indexing start with 0)
-        ema10_value_5_bars_back = self.indicator_ema10_history[4]
+        ema10_value_5_bars_back = ema10_history[4]
+        # Last 5 values as NumPy array (oldest -> latest) for vectorized calculations
+        ema10_mean_5_bars = ema10_history.window(5).mean()
+        # Cascaded indicator (read directly from indicator) + transform
+        ema20_last_value = self.ema20.value
+        ema_spread = self.indicators_1min.value("ema_spread")
 
         self.log.info(
-            f"EMA(10) latest: {ema10_last_value}, EMA(10) from history: {ema10_last_value_from_history}, EMA(10) 5 bars ago: {ema10_value_5_bars_back}"
+            f"EMA(10) latest: {ema10_last_value}, EMA(10) from history: {ema10_last_value_from_history}, EMA(10) 5 bars ago: {ema10_value_5_bars_back}, EMA(10) mean of 5 bars: {ema10_mean_5_bars}, EMA(20) of EMA(10): {ema20_last_value}, spread: {ema_spread}"
         )
 
+    def on_save(self) -> dict[str, bytes]:
+        # State of all indicators is saved with strategy state.
+        # Nautilus calls it when the system is stopped (with `save_state=True` + cache database)
+        # or we can call `strategy.save()` ourselves - e.g. between chunks of backtest.
+        return {"indicators_1min": self.indicators_1min.snapshot()}
+
+    def on_load(self, state: dict[str, bytes]):
+        # Restore indicators -> they are initialized immediately, no warmup from bars is needed
+        # Nautilus calls it before strategy is started (with `load_state=True` + cache database)
+        # or we can call `strategy.load(state)` ourselves.
+        if "indicators_1min" in state:
+            self.indicators_1min.restore(state["indicators_1min"])
+            self.log.info(f"Indicators restored | Initialized: {self.indicators_1min.initialized}")
+
     def on_stop(self):
         self.log.info(f"Total 1-min bars processed: {self.bars_1min_processed}")
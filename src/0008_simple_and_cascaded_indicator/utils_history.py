@@ -0,0 +1,49 @@
+import numpy as np
+
+
+class RingBuffer:
+    # Fixed-capacity history of float values backed by NumPy array.
+    #
+    # - memory is allocated once -> long runs hold constant memory (oldest values are overwritten)
+    # - `append()` is O(1) and stores plain float64 (no Python float object per value)
+    # - indexing is the same as `deque` with `appendleft()`: [0] = latest, [n] = value n bars back
+    # - `window(n)` returns last n values as NumPy array view (no copy), oldest -> latest
+    #
+    # Trick: each value is written twice (at position `i` and `i + capacity`),
+    # so any window of last n values is always one contiguous slice of the array.
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self._data = np.full(2 * capacity, np.nan, dtype=np.float64)
+        self._position = -1  # position of the latest value (in first half of array)
+        self._count = 0
+
+    def append(self, value: float):
+        position = self._position + 1
+        if position == self.capacity:
+            position = 0
+        self._data[position] = value
+        self._data[position + self.capacity] = value
+        self._position = position
+        if self._count < self.capacity:
+            self._count += 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, bars_back: int) -> float:
+        if not 0 <= bars_back < self._count:
+            raise IndexError(f"Index {bars_back} out of range, history has {self._count} values")
+        return float(self._data[self._position + self.capacity - bars_back])
+
+    def window(self, n: int) -> np.ndarray:
+        # Last `n` values (oldest -> latest) as read-only view
+        # Note: View shares memory with buffer -> copy it, if you need it after next `append()`
+        if not 0 < n <= self._count:
+            raise IndexError(f"Window {n} out of range, history has {self._count} values")
+        end = self._position + self.capacity + 1
+        view = self._data[end - n : end]
+        view.flags.writeable = False
+        return view
@@ -0,0 +1,203 @@
+import graphlib
+import pickle
+from typing import Callable
+
+from nautilus_trader.indicators.base.indicator import Indicator
+from nautilus_trader.model.data import Bar
+
+from utils_history import RingBuffer
+
+
+class IndicatorNode:
+    # One node of indicator graph = Nautilus indicator or transform (plain Python function).
+    # Node without inputs is fed directly by bars, other nodes are fed by values of their inputs.
+    def __init__(
+        self,
+        name: str,
+        indicator: Indicator | None,
+        transform: Callable[..., float] | None,
+        inputs: list[str],
+        history_capacity: int,
+    ):
+        self.name = name
+        self.indicator = indicator
+        self.transform = transform
+        self.inputs = inputs
+        self.input_nodes: list[IndicatorNode] = []  # resolved, when graph is built
+        self.history_capacity = history_capacity
+        self.reset()
+
+    def reset(self):
+        self.value = 0.0
+        self.initialized = False
+        self.updated = False  # was node updated with the latest bar?
+        self.history = RingBuffer(self.history_capacity)  # [0] = latest value
+
+
+class IndicatorGraph(Indicator):
+    # Declarative graph of indicators, which are calculated from one bar type.
+    #
+    # Usage:
+    #   graph = IndicatorGraph()
+    #   graph.add_indicator("ema10", MovingAverageFactory.create(10, MovingAverageType.EXPONENTIAL))
+    #   graph.add_indicator("ema20", MovingAverageFactory.create(20, ...), input="ema10")
+    #   graph.add_transform("spread", lambda fast, slow: fast - slow, inputs=["ema10", "ema20"])
+    #   self.register_indicator_for_bars(bar_type, graph)  # graph is standard Nautilus indicator
+    #
+    # With each bar:
+    #   - nodes are updated in topological order (inputs always before nodes using them),
+    #     so order of `add_...()` calls doesn't matter
+    #   - every node is updated exactly once
+    #   - node is skipped, if any of its inputs was not updated with this bar or is not initialized yet
+    #     (= the same as manual `if indicator.initialized: other.update_raw(indicator.value)`)
+    #   - every updated node appends its value into its own history buffer
+    #
+    # State of the whole graph can be saved by `snapshot()` and restored by `restore()`
+    # (e.g. in `Strategy.on_save()` / `Strategy.on_load()`), so restarted strategy continues
+    # with initialized indicators instead of waiting for new bars / replaying history.
+
+    def __init__(self, history_capacity: int = 1_000):
+        super().__init__([])
+        self.history_capacity = history_capacity
+        self._nodes: dict[str, IndicatorNode] = {}
+        self._update_order: list[IndicatorNode] | None = None  # built lazily, at first bar
+        self.last_ts_init = -1  # timestamp of the last processed bar
+
+    def add_indicator(self, name: str, indicator: Indicator, input: str | None = None):
+        # `input=None` -> indicator is fed by bars, otherwise by values of `input` node
+        # Indicator fed by other node must support `update_raw()` (as all moving averages do)
+        if input is not None and not hasattr(indicator, "update_raw"):
+            raise ValueError(f"Indicator {indicator} of node '{name}' has no `update_raw()` method")
+        inputs = [] if input is None else [input]
+        self._add_node(IndicatorNode(name, indicator, None, inputs, self.history_capacity))
+
+    def add_transform(self, name: str, transform: Callable[..., float], inputs: list[str]):
+        # `transform` is called with latest values of all `inputs` (in the same order)
+        if not inputs:
+            raise ValueError(f"Transform node '{name}' needs at least one input")
+        self._add_node(IndicatorNode(name, None, transform, list(inputs), self.history_capacity))
+
+    def _add_node(self, node: IndicatorNode):
+        if node.name in self._nodes:
+            raise ValueError(f"Node '{node.name}' already exists in graph")
+        self._nodes[node.name] = node
+        self._update_order = None  # graph changed -> build update order again
+
+    def _build_update_order(self) -> list[IndicatorNode]:
+        sorter = graphlib.TopologicalSorter()
+        for node in self._nodes.values():
+            for input_name in node.inputs:
+                if input_name not in self._nodes:
+                    raise ValueError(f"Node '{node.name}' has unknown input '{input_name}'")
+            node.input_nodes = [self._nodes[input_name] for input_name in node.inputs]
+            sorter.add(node.name, *node.inputs)
+        try:
+            return [self._nodes[name] for name in sorter.static_order()]
+        except graphlib.CycleError as e:
+            raise ValueError(f"Indicator graph contains cycle: {e.args[1]}") from e
+
+    def node(self, name: str) -> IndicatorNode:
+        return self._nodes[name]
+
+    def value(self, name: str) -> float:
+        return self._nodes[name].value
+
+    def history(self, name: str) -> RingBuffer:
+        return self._nodes[name].history
+
+    def handle_bar(self, bar: Bar):
+        # Bars already included in graph state are skipped (e.g. overlap of restored state + new bars)
+        if bar.ts_init <= self.last_ts_init:
+            return
+        self.last_ts_init = bar.ts_init
+
+        if self._update_order is None:
+            self._update_order = self._build_update_order()
+
+        for node in self._update_order:
+            if node.input_nodes:
+                # Derived node: skip, if any input has no new value
+                node.updated = all(n.updated and n.initialized for n in node.input_nodes)
+                if not node.updated:
+                    continue
+                if node.indicator is not None:
+                    node.indicator.update_raw(node.input_nodes[0].value)
+                else:
+                    node.value = node.transform(*[n.value for n in node.input_nodes])
+                    node.initialized = True
+            else:
+                # Root node: fed directly by bar
+                node.indicator.handle_bar(bar)
+                node.updated = True
+
+            if node.indicator is not None:
+                node.value = node.indicator.value
+                node.initialized = node.indicator.initialized
+            node.history.append(node.value)
+
+        self._set_has_inputs(True)
+        if not self.initialized:
+            self._set_initialized(all(node.initialized for node in self._update_order))
+
+    def snapshot(self) -> bytes:
+        # Whole state of all nodes: Nautilus indicators (incl. their internal buffers)
+        # are pickled as they are, transforms are not stored (they are defined by code).
+        nodes = {}
+        for name, node in self._nodes.items():
+            history_count = len(node.history)
+            nodes[name] = {
+                "indicator": node.indicator,
+                "value": node.value,
+                "initialized": node.initialized,
+                "updated": node.updated,
+                "history": node.history.window(history_count).copy() if history_count else [],
+            }
+        state = {"last_ts_init": self.last_ts_init, "nodes": nodes}
+        return pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def restore(self, snapshot: bytes):
+        # Graph must have the same nodes as the graph, which created the snapshot
+        # Warning: Restore only snapshots created by your own code (pickle can run any code on load)
+        state = pickle.loads(snapshot)
+        nodes = state["nodes"]
+        if nodes.keys() != self._nodes.keys():
+            raise ValueError(
+                f"Snapshot nodes {sorted(nodes)} don't match graph nodes {sorted(self._nodes)}"
+            )
+        for name, node_state in nodes.items():
+            indicator, saved_indicator = self._nodes[name].indicator, node_state["indicator"]
+            if type(indicator) is not type(saved_indicator):
+                raise ValueError(
+                    f"Snapshot indicator of node '{name}' is {type(saved_indicator).__name__}, "
+                    f"graph has {type(indicator).__name__}"
+                )
+
+        for name, node_state in nodes.items():
+            node = self._nodes[name]
+            node.reset()
+            if node.indicator is not None:
+                # State is copied into existing indicator (object is not replaced), so references
+                # held by strategy (e.g. `self.ema10`) still point to the restored indicator
+                _copy_indicator_state(node.indicator, node_state["indicator"])
+            node.value = node_state["value"]
+            node.initialized = node_state["initialized"]
+            node.updated = node_state["updated"]
+            for value in node_state["history"]:
+                node.history.append(value)
+
+        self.last_ts_init = state["last_ts_init"]
+        self._set_has_inputs(self.last_ts_init >= 0)
+        self._set_initialized(all(node.initialized for node in self._nodes.values()))
+
+    def _reset(self):
+        self.last_ts_init = -1
+        for node in self._nodes.values():
+            if node.indicator is not None:
+                node.indicator.reset()
+            node.reset()
+
+
+def _copy_indicator_state(target: Indicator, source: Indicator):
+    # Nautilus indicators (Cython classes + their Python subclasses) support pickle protocol:
+    # `__reduce__()` returns their whole state, `__setstate__()` sets it into existing object
+    target.__setstate__(source.__reduce__()[2])
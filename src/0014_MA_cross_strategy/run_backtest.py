@@ -12,6 +12,8 @@ from nautilus_trader.model.objects import Money
 
 import utils_csv
 import utils_instruments
+import utils_logging
+import utils_vectorized
 from strategy import MACrossStrategy, MACrossStrategyConfig
 
 
@@ -59,6 +61,11 @@ if __name__ == "__main__":
     )
     # Step 3: Add bars to engine
     engine.add_data(eurusd_futures_1min_bars_list)
+    # Step 4: Put bars before start of the backtest into cache as history
+    # -> strategy warms up its indicators from them at start (no waiting for first bars)
+    start = pd.Timestamp("2024-01-02", tz="UTC")
+    history_bars = [bar for bar in eurusd_futures_1min_bars_list if bar.ts_init < start.value]
+    engine.cache.add_bars(history_bars)
 
     # Strategy: Configure -> create -> add to engine
     strategy_config = MACrossStrategyConfig(
@@ -70,13 +77,25 @@ if __name__ == "__main__":
         ma_slow_period=50,
         profit_in_ticks=20,
         stoploss_in_ticks=20,
+        log_level=utils_logging.lowest_log_level(engine_config.logging),
     )
-    strategy = MACrossStrategy(strategy_config)
+    # Optionally precompute MA cross signals for all bars at once (vectorized pre-pass)
+    # Fills are identical to event-driven mode (see `run_vectorized_comparison.py`)
+    use_vectorized_signals = False
+    signals = None
+    if use_vectorized_signals:
+        signals = utils_vectorized.ma_cross_signals(
+            bars=eurusd_futures_1min_bars_list,
+            ma_type=strategy_config.ma_type,
+            fast_period=strategy_config.ma_fast_period,
+            slow_period=strategy_config.ma_slow_period,
+        )
+    strategy = MACrossStrategy(strategy_config, signals=signals)
     engine.add_strategy(strategy)
 
     # Run engine = Run backtest
     engine.run(
-        start=None,  #'2024-01-25',  # if start is not specified = any first data, that will come will be processed
+        start=start,  # if start is not specified = any first data, that will come will be processed
         end="2024-01-03",
         streaming=False,
     )
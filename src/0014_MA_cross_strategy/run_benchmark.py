@@ -0,0 +1,163 @@
+import time
+import timeit
+
+import pandas as pd
+from nautilus_trader.backtest.engine import BacktestEngine, Decimal
+from nautilus_trader.backtest.models import FillModel, PerContractFeeModel
+from nautilus_trader.common.component import Logger
+from nautilus_trader.common.enums import LogColor
+from nautilus_trader.config import BacktestEngineConfig, LoggingConfig
+from nautilus_trader.indicators.average.moving_average import MovingAverageType
+from nautilus_trader.model import TraderId
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.enums import AccountType, OmsType, OrderSide
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Money
+
+import utils_csv
+import utils_instruments
+import utils_logging
+from strategy import MACrossStrategy, MACrossStrategyConfig
+
+
+# Benchmark 1: bars/sec of the same backtest with different logging setups.
+#
+# "before" = `on_bar` logs with eager f-strings, like before lazy logging was added
+#            (`EagerLoggingMACrossStrategy` below), Nautilus then throws away messages
+#            below configured level
+# "after"  = strategy formats only messages, that will be really written
+#            (strategy `log_level=utils_logging.lowest_log_level(logging_config)`)
+# Note: order + warmup messages (a few hundred per run) are lazy in both variants.
+
+CSV_PATH = r"../!market_data/cme/futures/fx/6EH4.GLBX_1min_bars_20240101_20240131.csv"
+END = None  # None = whole CSV file (1 month of 1-minute bars)
+REPEATS = 3  # best of N runs is reported (the least affected by noise)
+LOG_CALLS = 100_000  # count of calls in benchmark 2
+
+
+class EagerLoggingMACrossStrategy(MACrossStrategy):
+    # `MACrossStrategy.on_bar` with original logging: message is always formatted
+    # (and bars are always counted), no matter if it will be written or not
+    def on_bar(self, bar: Bar):
+        self.log.info(f"Bar: {repr(bar)}")
+
+        if self.signals is not None:
+            crossing = self.signals.get(bar.ts_init)
+        else:
+            if not self.indicators_initialized():
+                count_of_bars = self.cache.bar_count(self.config.primary_bar_type)
+                self.log.info(
+                    f"Waiting for indicators to warm initialize. | Bars count {count_of_bars}",
+                    color=LogColor.BLUE,
+                )
+                return
+            crossing = self.detect_crossing()
+
+        if crossing is None:
+            return
+        if crossing > 0 and not self.is_net_long:
+            self.reverse_position(OrderSide.BUY, bar)
+        if crossing < 0 and not self.is_net_short:
+            self.reverse_position(OrderSide.SELL, bar)
+
+
+LOGGING_CONFIGS = {
+    "console=WARNING": LoggingConfig(log_level="WARNING"),
+    "console=ERROR": LoggingConfig(log_level="ERROR"),
+}
+
+
+def run_once(
+    instrument: Instrument, bar_type: BarType, bars: list[Bar], logging: LoggingConfig, lazy: bool
+) -> tuple[float, int]:
+    engine = BacktestEngine(
+        config=BacktestEngineConfig(trader_id=TraderId("BACKTEST_TRADER-001"), logging=logging)
+    )
+    engine.add_venue(
+        venue=Venue("GLBX"),
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.MARGIN,
+        starting_balances=[Money(1_000_000, USD)],
+        fee_model=PerContractFeeModel(commission=Money(2.36, USD)),
+        base_currency=USD,
+        default_leverage=Decimal(1),
+        fill_model=FillModel(
+            prob_fill_on_limit=0, prob_fill_on_stop=0, prob_slippage=1, random_seed=42
+        ),
+    )
+    engine.add_instrument(instrument)
+    engine.add_data(bars)
+
+    strategy_config = MACrossStrategyConfig(
+        instrument=instrument,
+        primary_bar_type=bar_type,
+        trade_size=Decimal(1),
+        ma_type=MovingAverageType.SIMPLE,
+        ma_fast_period=20,
+        ma_slow_period=50,
+        profit_in_ticks=20,
+        stoploss_in_ticks=20,
+        log_level=utils_logging.lowest_log_level(logging),
+    )
+    strategy_class = MACrossStrategy if lazy else EagerLoggingMACrossStrategy
+    engine.add_strategy(strategy_class(strategy_config))
+
+    start = time.perf_counter()
+    engine.run(end=END)
+    secs = time.perf_counter() - start
+    bars_count = engine.get_result().iterations
+    engine.dispose()
+    return secs, bars_count
+
+
+def log_call_cost_us(logging: LoggingConfig, bar: Bar) -> dict:
+    # Benchmark 2: cost of single `on_bar` log statement alone (in microseconds).
+    # Backtest run above is dominated by order processing, so here we measure logging in isolation.
+    # Logger needs initialized logging system -> it is taken from (not running) engine.
+    engine = BacktestEngine(
+        config=BacktestEngineConfig(trader_id=TraderId("BACKTEST_TRADER-001"), logging=logging)
+    )
+    log = Logger("Benchmark")
+    lazy_log = utils_logging.LazyLogger(log, level=utils_logging.lowest_log_level(logging))
+    eager_secs = timeit.timeit(lambda: log.info(f"Bar: {repr(bar)}"), number=LOG_CALLS)
+    lazy_secs = timeit.timeit(lambda: lazy_log.info("Bar: %r", bar), number=LOG_CALLS)
+    engine.dispose()
+    return {
+        "before_us": round(eager_secs / LOG_CALLS * 1e6, 3),
+        "after_us": round(lazy_secs / LOG_CALLS * 1e6, 3),
+    }
+
+
+if __name__ == "__main__":
+    # Data are loaded only once and shared by all runs
+    instrument = utils_instruments.eurusd_future(2024, 3, "GLBX")
+    bar_type = BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL")
+    bars = utils_csv.load_bars_from_ninjatrader_csv(CSV_PATH, instrument, bar_type)
+
+    rows = []
+    for name, logging in LOGGING_CONFIGS.items():
+        for variant, lazy in [("before", False), ("after", True)]:
+            results = [run_once(instrument, bar_type, bars, logging, lazy) for _ in range(REPEATS)]
+            secs, bars_count = min(results)
+            rows.append(
+                {
+                    "logging": name,
+                    "variant": variant,
+                    "bars": bars_count,
+                    "run_secs": round(secs, 3),
+                    "bars_per_sec": round(bars_count / secs),
+                }
+            )
+
+    log_rows = [
+        {"logging": name, **log_call_cost_us(logging, bars[0])}
+        for name, logging in LOGGING_CONFIGS.items()
+    ]
+
+    with pd.option_context("display.width", None):
+        print("Backtest throughput:")
+        print(pd.DataFrame(rows).set_index(["logging", "variant"]))
+        print("\nCost of one log statement in `on_bar`:")
+        print(pd.DataFrame(log_rows).set_index("logging"))
@@ -0,0 +1,80 @@
+import timeit
+
+import numpy as np
+import pandas as pd
+from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
+from nautilus_trader.indicators.average.moving_average import MovingAverageType
+from nautilus_trader.model.data import BarType
+
+import utils_csv
+import utils_instruments
+import utils_vectorized
+
+
+# Batch computation of moving averages over NumPy array vs. streaming Nautilus indicator
+#
+# "streaming" = indicator updated value by value (as with `register_indicator_for_bars`)
+# "batch"     = `utils_vectorized.moving_average_values()` over the whole array of closes
+#
+# Values must be bit-identical, otherwise vectorized pre-pass could produce different fills.
+#
+# Expected result:
+#   - SMA: 100x+ faster (window sums are computed for all bars at once)
+#   - EMA / WILDER: only slightly faster (recursive formula = loop, see `exponential_moving_average`)
+#   - other types: the same speed (batch falls back to streaming indicator)
+
+CSV_PATH = r"../!market_data/cme/futures/fx/6EH4.GLBX_1min_bars_20240101_20240131.csv"
+PERIODS = [10, 50, 200]
+MA_TYPES = [
+    MovingAverageType.SIMPLE,
+    MovingAverageType.EXPONENTIAL,
+    MovingAverageType.WILDER,
+    MovingAverageType.DOUBLE_EXPONENTIAL,
+]
+REPEATS = 3
+
+
+def streaming_values(closes: np.ndarray, period: int, ma_type: MovingAverageType) -> np.ndarray:
+    indicator = MovingAverageFactory.create(period=period, ma_type=ma_type)
+    values = np.empty(len(closes), dtype=np.float64)
+    for i, close in enumerate(closes.tolist()):
+        indicator.update_raw(close)
+        values[i] = indicator.value
+    return values
+
+
+if __name__ == "__main__":
+    instrument = utils_instruments.eurusd_future(2024, 3, "GLBX")
+    bar_type = BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL")
+    bars = utils_csv.load_bars_from_ninjatrader_csv(CSV_PATH, instrument, bar_type)
+    closes = np.fromiter((bar.close.as_double() for bar in bars), dtype=np.float64, count=len(bars))
+
+    rows = []
+    for ma_type in MA_TYPES:
+        for period in PERIODS:
+            streaming = streaming_values(closes, period, ma_type)
+            batch = utils_vectorized.moving_average_values(closes, period, ma_type)
+            # Compare bits, not just values (`==` would hide e.g. -0.0 vs 0.0)
+            assert np.array_equal(streaming.view(np.int64), batch.view(np.int64)), (
+                f"{ma_type.name}({period}): batch values differ from streaming indicator"
+            )
+
+            streaming_secs = timeit.timeit(
+                lambda: streaming_values(closes, period, ma_type), number=REPEATS
+            )
+            batch_secs = timeit.timeit(
+                lambda: utils_vectorized.moving_average_values(closes, period, ma_type),
+                number=REPEATS,
+            )
+            rows.append(
+                {
+                    "indicator": f"{ma_type.name}({period})",
+                    "streaming_ms": round(streaming_secs / REPEATS * 1e3, 2),
+                    "batch_ms": round(batch_secs / REPEATS * 1e3, 2),
+                    "speedup": round(streaming_secs / batch_secs, 1),
+                }
+            )
+
+    print(f"Closes: {len(closes)}, all batch values are bit-identical to streaming indicators\n")
+    with pd.option_context("display.width", None):
+        print(pd.DataFrame(rows).set_index("indicator"))
@@ -0,0 +1,127 @@
+import timeit
+
+import pandas as pd
+from nautilus_trader.backtest.engine import BacktestEngine, Decimal
+from nautilus_trader.config import BacktestEngineConfig, LoggingConfig
+from nautilus_trader.indicators.average.moving_average import MovingAverageType
+from nautilus_trader.model import TraderId
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.enums import AccountType, OmsType, OrderSide, OrderType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money, Price
+from nautilus_trader.model.orders import OrderList
+
+import utils_csv
+import utils_instruments
+from strategy import MACrossStrategy, MACrossStrategyConfig
+
+
+# Micro-benchmark of order-construction path in `MACrossStrategy.fire_trade()`
+#
+# "before" = prices computed with Decimal arithmetic + `make_price()` / `make_qty()` per order
+# "after"  = offsets precomputed in `on_start()` as fixed-point integers,
+#            prices built by integer addition (`MACrossStrategy.create_bracket_order()`)
+
+CSV_PATH = r"../!market_data/cme/futures/fx/6EH4.GLBX_1min_bars_20240101_20240131.csv"
+CALLS = 20_000
+
+
+def bracket_prices_before(strategy: MACrossStrategy, last_price: Price) -> tuple[Price, Price]:
+    # Original computation of profit/stoploss prices (for BUY order)
+    config = strategy.config
+    profit_price = last_price + config.profit_in_ticks * config.instrument.price_increment
+    stoploss_price = last_price - config.stoploss_in_ticks * config.instrument.price_increment
+    return config.instrument.make_price(profit_price), config.instrument.make_price(stoploss_price)
+
+
+def bracket_prices_after(strategy: MACrossStrategy, last_price: Price) -> tuple[Price, Price]:
+    # Current computation of profit/stoploss prices (for BUY order)
+    return (
+        Price.from_raw(last_price.raw + strategy.profit_offset_raw, strategy.price_precision),
+        Price.from_raw(last_price.raw - strategy.stoploss_offset_raw, strategy.price_precision),
+    )
+
+
+def bracket_order_before(strategy: MACrossStrategy, last_price: Price) -> OrderList:
+    config = strategy.config
+    profit_price, stoploss_price = bracket_prices_before(strategy, last_price)
+    return strategy.order_factory.bracket(
+        instrument_id=config.instrument.id,
+        order_side=OrderSide.BUY,
+        quantity=config.instrument.make_qty(config.trade_size),
+        entry_order_type=OrderType.MARKET,
+        sl_trigger_price=stoploss_price,
+        tp_order_type=OrderType.LIMIT,
+        tp_price=profit_price,
+    )
+
+
+if __name__ == "__main__":
+    # Strategy must be running in engine (prices are precomputed in `on_start()`),
+    # so short backtest is run first - only to start the strategy
+    engine = BacktestEngine(
+        config=BacktestEngineConfig(
+            trader_id=TraderId("BACKTEST_TRADER-001"),
+            logging=LoggingConfig(log_level="ERROR"),
+        )
+    )
+    engine.add_venue(
+        venue=Venue("GLBX"),
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.MARGIN,
+        starting_balances=[Money(1_000_000, USD)],
+        base_currency=USD,
+        default_leverage=Decimal(1),
+    )
+    instrument = utils_instruments.eurusd_future(2024, 3, "GLBX")
+    engine.add_instrument(instrument)
+    bar_type = BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL")
+    bars = utils_csv.load_bars_from_ninjatrader_csv(CSV_PATH, instrument, bar_type)
+    engine.add_data(bars[:10])  # indicators are not initialized yet -> no orders
+
+    strategy = MACrossStrategy(
+        MACrossStrategyConfig(
+            instrument=instrument,
+            primary_bar_type=bar_type,
+            trade_size=Decimal(1),
+            ma_type=MovingAverageType.SIMPLE,
+            ma_fast_period=20,
+            ma_slow_period=50,
+            profit_in_ticks=20,
+            stoploss_in_ticks=20,
+        )
+    )
+    engine.add_strategy(strategy)
+    engine.run()
+
+    # Both ways must produce exactly the same prices
+    last_price = bars[-1].close
+    assert bracket_prices_before(strategy, last_price) == bracket_prices_after(strategy, last_price)
+
+    # Measure
+    benchmarks = {
+        "prices only": (bracket_prices_before, bracket_prices_after),
+        "whole bracket order": (
+            bracket_order_before,
+            lambda s, p: s.create_bracket_order(OrderSide.BUY, p),
+        ),
+    }
+    rows = []
+    for name, (before, after) in benchmarks.items():
+        before_secs = timeit.timeit(lambda: before(strategy, last_price), number=CALLS)
+        after_secs = timeit.timeit(lambda: after(strategy, last_price), number=CALLS)
+        rows.append(
+            {
+                "path": name,
+                "before_us": round(before_secs / CALLS * 1e6, 2),
+                "after_us": round(after_secs / CALLS * 1e6, 2),
+                "speedup": round(before_secs / after_secs, 2),
+            }
+        )
+
+    with pd.option_context("display.width", None):
+        print(pd.DataFrame(rows).set_index("path"))
+
+    # Cleanup resources
+    engine.dispose()
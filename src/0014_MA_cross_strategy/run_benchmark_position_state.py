@@ -0,0 +1,132 @@
+import time
+import timeit
+from collections.abc import Callable
+
+import pandas as pd
+from nautilus_trader.backtest.engine import BacktestEngine, Decimal
+from nautilus_trader.backtest.models import FillModel, PerContractFeeModel
+from nautilus_trader.config import BacktestEngineConfig, LoggingConfig
+from nautilus_trader.indicators.average.moving_average import MovingAverageType
+from nautilus_trader.model import TraderId
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Money
+
+import utils_csv
+import utils_instruments
+from strategy import MACrossStrategy, MACrossStrategyConfig
+
+
+# Benchmark: position state read from portfolio on every bar vs. cached position state
+#
+# "before" = position state is queried from portfolio on every bar
+#            (emulated by `PortfolioQueryMACrossStrategy` below)
+# "after"  = `MACrossStrategy` as is - position state is updated only from position events
+
+CSV_PATH = r"../!market_data/cme/futures/fx/6EH4.GLBX_1min_bars_20240101_20240131.csv"
+END = None  # None = whole CSV file (1 month of 1-minute bars)
+STATE_READS = 100_000  # count of position state reads measured in isolation
+
+
+def read_from_portfolio(strategy: MACrossStrategy) -> tuple[bool, bool, bool]:
+    instrument_id = strategy.config.instrument.id
+    return (
+        strategy.portfolio.is_flat(instrument_id),
+        strategy.portfolio.is_net_long(instrument_id),
+        strategy.portfolio.is_net_short(instrument_id),
+    )
+
+
+def read_cached(strategy: MACrossStrategy) -> tuple[bool, bool, bool]:
+    return strategy.is_flat, strategy.is_net_long, strategy.is_net_short
+
+
+class PortfolioQueryMACrossStrategy(MACrossStrategy):
+    # Refreshes position state from portfolio queries on every bar (= the cost paid before)
+    def on_bar(self, bar: Bar):
+        self.is_flat, self.is_net_long, self.is_net_short = read_from_portfolio(self)
+        super().on_bar(bar)
+
+
+def run_once(
+    strategy_class: type[MACrossStrategy],
+    read_position_state: Callable[[MACrossStrategy], tuple[bool, bool, bool]],
+    instrument: Instrument,
+    bar_type: BarType,
+    bars: list[Bar],
+) -> dict:
+    engine = BacktestEngine(
+        config=BacktestEngineConfig(
+            trader_id=TraderId("BACKTEST_TRADER-001"),
+            logging=LoggingConfig(log_level="ERROR"),
+        )
+    )
+    engine.add_venue(
+        venue=Venue("GLBX"),
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.MARGIN,
+        starting_balances=[Money(1_000_000, USD)],
+        fee_model=PerContractFeeModel(commission=Money(2.36, USD)),
+        base_currency=USD,
+        default_leverage=Decimal(1),
+        fill_model=FillModel(
+            prob_fill_on_limit=0, prob_fill_on_stop=0, prob_slippage=1, random_seed=42
+        ),
+    )
+    engine.add_instrument(instrument)
+    engine.add_data(bars)
+
+    strategy_config = MACrossStrategyConfig(
+        instrument=instrument,
+        primary_bar_type=bar_type,
+        trade_size=Decimal(1),
+        ma_type=MovingAverageType.SIMPLE,
+        ma_fast_period=20,
+        ma_slow_period=50,
+        profit_in_ticks=20,
+        stoploss_in_ticks=20,
+        log_level="ERROR",
+    )
+    strategy = strategy_class(strategy_config)
+    engine.add_strategy(strategy)
+
+    start = time.perf_counter()
+    engine.run(end=END)
+    secs = time.perf_counter() - start
+
+    # Cost of reading position state alone (run above is dominated by order processing)
+    read_secs = timeit.timeit(lambda: read_position_state(strategy), number=STATE_READS)
+
+    result = engine.get_result()
+    engine.dispose()
+    return {
+        "bars": result.iterations,
+        "orders": result.total_orders,
+        "positions": result.total_positions,
+        "run_secs": round(secs, 2),
+        "bars_per_sec": round(result.iterations / secs),
+        "state_read_us": round(read_secs / STATE_READS * 1e6, 3),
+    }
+
+
+if __name__ == "__main__":
+    instrument = utils_instruments.eurusd_future(2024, 3, "GLBX")
+    bar_type = BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL")
+    bars = utils_csv.load_bars_from_ninjatrader_csv(CSV_PATH, instrument, bar_type)
+
+    rows = {
+        "before": run_once(
+            PortfolioQueryMACrossStrategy, read_from_portfolio, instrument, bar_type, bars
+        ),
+        "after": run_once(MACrossStrategy, read_cached, instrument, bar_type, bars),
+    }
+
+    # Both variants must trade exactly the same
+    assert rows["before"]["orders"] == rows["after"]["orders"]
+    assert rows["before"]["positions"] == rows["after"]["positions"]
+
+    with pd.option_context("display.width", None):
+        print(pd.DataFrame.from_dict(rows, orient="index"))
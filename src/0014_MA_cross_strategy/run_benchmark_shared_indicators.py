@@ -0,0 +1,115 @@
+import time
+
+import pandas as pd
+from nautilus_trader.backtest.engine import BacktestEngine, Decimal
+from nautilus_trader.backtest.models import FillModel, PerContractFeeModel
+from nautilus_trader.config import BacktestEngineConfig, LoggingConfig
+from nautilus_trader.indicators.average.moving_average import MovingAverageType
+from nautilus_trader.model import TraderId
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Money
+
+import utils_csv
+import utils_instruments
+from run_vectorized_comparison import assert_same_reports
+from strategy import MACrossStrategy, MACrossStrategyConfig
+from utils_indicator_registry import IndicatorRegistry
+
+
+# Fleet of `MACrossStrategy` instances on the same bar type (the same MAs, different tick targets)
+#
+# "own indicators"    = each strategy creates + updates its own MAs (registry is not passed)
+# "shared indicators" = all strategies get MAs from one `IndicatorRegistry` -> each MA once per bar
+#
+# Both fleets must produce identical fills + positions. Script fails, if they differ.
+#
+# Note: Run time of this fleet is dominated by order handling (thousands of bracket orders),
+# so saved indicator updates show up only as small difference in total time. The more indicators
+# (and the longer their periods), the bigger the saving.
+
+CSV_PATH = r"../!market_data/cme/futures/fx/6EH4.GLBX_1min_bars_20240101_20240131.csv"
+TICK_TARGETS = [10, 20, 30, 40, 50, 60, 70, 80]  # one strategy per profit/stoploss target
+
+
+def run_fleet(instrument: Instrument, bar_type: BarType, bars: list[Bar], shared: bool) -> dict:
+    engine = BacktestEngine(
+        config=BacktestEngineConfig(
+            trader_id=TraderId("BACKTEST_TRADER-001"),
+            logging=LoggingConfig(log_level="ERROR"),
+        )
+    )
+    engine.add_venue(
+        venue=Venue("GLBX"),
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.MARGIN,
+        starting_balances=[Money(1_000_000, USD)],
+        fee_model=PerContractFeeModel(commission=Money(2.36, USD)),
+        base_currency=USD,
+        default_leverage=Decimal(1),
+        fill_model=FillModel(
+            prob_fill_on_limit=0, prob_fill_on_stop=0, prob_slippage=1, random_seed=42
+        ),
+    )
+    engine.add_instrument(instrument)
+    engine.add_data(bars)
+
+    # One registry for the whole fleet (or none -> each strategy has its own indicators)
+    indicator_registry = IndicatorRegistry() if shared else None
+    for ticks in TICK_TARGETS:
+        strategy_config = MACrossStrategyConfig(
+            instrument=instrument,
+            primary_bar_type=bar_type,
+            trade_size=Decimal(1),
+            ma_type=MovingAverageType.SIMPLE,
+            ma_fast_period=20,
+            ma_slow_period=50,
+            profit_in_ticks=ticks,
+            stoploss_in_ticks=ticks,
+            log_level="ERROR",
+            order_id_tag=str(ticks),  # each strategy in engine needs unique ID
+        )
+        engine.add_strategy(MACrossStrategy(strategy_config, indicator_registry=indicator_registry))
+
+    start = time.perf_counter()
+    engine.run()
+    secs = time.perf_counter() - start
+
+    result = {
+        "secs": secs,
+        "indicators": (indicator_registry.indicators_count() if shared else 2 * len(TICK_TARGETS)),
+        "fills": engine.trader.generate_order_fills_report().reset_index(drop=True),
+        "positions": engine.trader.generate_positions_report().reset_index(drop=True),
+    }
+    engine.dispose()
+    return result
+
+
+if __name__ == "__main__":
+    instrument = utils_instruments.eurusd_future(2024, 3, "GLBX")
+    bar_type = BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL")
+    bars = utils_csv.load_bars_from_ninjatrader_csv(CSV_PATH, instrument, bar_type)
+
+    own = run_fleet(instrument, bar_type, bars, shared=False)
+    shared = run_fleet(instrument, bar_type, bars, shared=True)
+
+    assert_same_reports(own["fills"], shared["fills"], "fills")
+    assert_same_reports(own["positions"], shared["positions"], "positions")
+
+    rows = [
+        {
+            "fleet": name,
+            "strategies": len(TICK_TARGETS),
+            "indicators": result["indicators"],
+            "indicator_updates": result["indicators"] * len(bars),
+            "fills": len(result["fills"]),
+            "run_secs": round(result["secs"], 2),
+        }
+        for name, result in {"own indicators": own, "shared indicators": shared}.items()
+    ]
+    print("OK: Fleets with own and shared indicators produced identical fills + positions")
+    with pd.option_context("display.width", None):
+        print(pd.DataFrame(rows).set_index("fleet"))
@@ -0,0 +1,144 @@
+import time
+
+import pandas as pd
+from nautilus_trader.backtest.engine import BacktestEngine, Decimal
+from nautilus_trader.backtest.models import FillModel, PerContractFeeModel
+from nautilus_trader.config import BacktestEngineConfig, LoggingConfig
+from nautilus_trader.indicators.average.moving_average import MovingAverageType
+from nautilus_trader.model import TraderId
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Money
+
+import utils_csv
+import utils_instruments
+import utils_vectorized
+from strategy import MACrossStrategy, MACrossStrategyConfig
+
+
+# Regression check: event-driven mode vs. vectorized pre-pass mode of `MACrossStrategy`
+# Both modes must produce identical fills + positions. Script fails, if they differ.
+#
+# Speed: pre-pass is faster only for SIMPLE MA (all values computed at once by NumPy), and only
+# a little (most of the time is spent in the engine, not in indicators).
+# EXPONENTIAL MA is computed value by value in pre-pass too -> about the same time as event-driven
+# mode (no speed-up, see `speedup` column). Times are noisy -> the best of `REPEATS` runs is used.
+
+CSV_PATH = r"../!market_data/cme/futures/fx/6EH4.GLBX_1min_bars_20240101_20240131.csv"
+END = None  # None = whole CSV file (1 month of 1-minute bars)
+MA_TYPES = [MovingAverageType.SIMPLE, MovingAverageType.EXPONENTIAL]
+REPEATS = 3  # each mode is run more times, the best time is reported
+
+# Columns with random identifiers (UUIDs), which differ in each run
+RANDOM_ID_COLUMNS = ["init_id", "position_id", "opening_order_id", "closing_order_id"]
+
+
+def run_once(
+    instrument: Instrument,
+    bar_type: BarType,
+    bars: list[Bar],
+    ma_type: MovingAverageType,
+    vectorized: bool,
+) -> dict:
+    engine = BacktestEngine(
+        config=BacktestEngineConfig(
+            trader_id=TraderId("BACKTEST_TRADER-001"),
+            logging=LoggingConfig(log_level="ERROR"),
+        )
+    )
+    engine.add_venue(
+        venue=Venue("GLBX"),
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.MARGIN,
+        starting_balances=[Money(1_000_000, USD)],
+        fee_model=PerContractFeeModel(commission=Money(2.36, USD)),
+        base_currency=USD,
+        default_leverage=Decimal(1),
+        fill_model=FillModel(
+            prob_fill_on_limit=0, prob_fill_on_stop=0, prob_slippage=1, random_seed=42
+        ),
+    )
+    engine.add_instrument(instrument)
+    engine.add_data(bars)
+
+    strategy_config = MACrossStrategyConfig(
+        instrument=instrument,
+        primary_bar_type=bar_type,
+        trade_size=Decimal(1),
+        ma_type=ma_type,
+        ma_fast_period=20,
+        ma_slow_period=50,
+        profit_in_ticks=20,
+        stoploss_in_ticks=20,
+        log_level="ERROR",
+    )
+
+    start = time.perf_counter()
+    signals = None
+    if vectorized:
+        signals = utils_vectorized.ma_cross_signals(
+            bars, ma_type, strategy_config.ma_fast_period, strategy_config.ma_slow_period
+        )
+    engine.add_strategy(MACrossStrategy(strategy_config, signals=signals))
+    engine.run()
+    secs = time.perf_counter() - start
+
+    result = {
+        "secs": secs,
+        "fills": engine.trader.generate_order_fills_report().reset_index(drop=True),
+        "positions": engine.trader.generate_positions_report().reset_index(drop=True),
+    }
+    engine.dispose()
+    return result
+
+
+def assert_same_reports(expected: pd.DataFrame, actual: pd.DataFrame, name: str):
+    expected = expected.drop(columns=RANDOM_ID_COLUMNS, errors="ignore")
+    actual = actual.drop(columns=RANDOM_ID_COLUMNS, errors="ignore")
+    pd.testing.assert_frame_equal(expected, actual, obj=name)
+
+
+if __name__ == "__main__":
+    instrument = utils_instruments.eurusd_future(2024, 3, "GLBX")
+    bar_type = BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL")
+    all_bars = utils_csv.load_bars_from_ninjatrader_csv(CSV_PATH, instrument, bar_type)
+
+    # Pre-pass must see exactly the bars processed by engine -> bars are cut here (not in engine)
+    bars = all_bars
+    if END is not None:
+        end_ns = pd.Timestamp(END, tz="UTC").value
+        bars = [bar for bar in all_bars if bar.ts_init <= end_ns]
+
+    rows = []
+    for ma_type in MA_TYPES:
+        event_driven = run_once(instrument, bar_type, bars, ma_type, vectorized=False)
+        vectorized = run_once(instrument, bar_type, bars, ma_type, vectorized=True)
+        for _ in range(REPEATS - 1):
+            for result, is_vectorized in [(event_driven, False), (vectorized, True)]:
+                secs = run_once(instrument, bar_type, bars, ma_type, is_vectorized)["secs"]
+                result["secs"] = min(result["secs"], secs)
+
+        assert_same_reports(event_driven["fills"], vectorized["fills"], "fills")
+        assert_same_reports(event_driven["positions"], vectorized["positions"], "positions")
+
+        rows.append(
+            {
+                "ma_type": ma_type.name,
+                "bars": len(bars),
+                "fills": len(vectorized["fills"]),
+                "event_driven_secs": round(event_driven["secs"], 2),
+                "vectorized_secs": round(vectorized["secs"], 2),  # including pre-pass
+                "speedup": round(event_driven["secs"] / vectorized["secs"], 2),
+            }
+        )
+
+    print("OK: Event-driven and vectorized modes produced identical fills + positions")
+    with pd.option_context("display.width", None):
+        print(pd.DataFrame(rows).set_index("ma_type"))
+    print(
+        "Note: Vectorized pre-pass can speed up only SIMPLE MA (computed for all bars at once), "
+        "other MA types are computed value by value -> no speed-up."
+    )
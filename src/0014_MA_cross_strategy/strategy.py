@@ -3,15 +3,20 @@ from decimal import Decimal
 from nautilus_trader.common.enums import LogColor
 from nautilus_trader.config import StrategyConfig
 from nautilus_trader.core.correctness import PyCondition
-from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
 from nautilus_trader.indicators.average.moving_average import MovingAverageType
 from nautilus_trader.model.data import Bar, BarType
-from nautilus_trader.model.enums import OrderSide, OrderType
+from nautilus_trader.model.enums import OrderSide, OrderType, PositionSide
+from nautilus_trader.model.events import PositionChanged, PositionClosed, PositionOpened
 from nautilus_trader.model.functions import order_side_to_str
 from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Price
 from nautilus_trader.model.orders import OrderList
 from nautilus_trader.trading.strategy import Strategy
 
+import utils_warmup
+from utils_indicator_registry import IndicatorRegistry
+from utils_logging import LazyLogger
+
 
 class MACrossStrategyConfig(StrategyConfig, frozen=True):
     instrument: Instrument
@@ -22,10 +27,20 @@ class MACrossStrategyConfig(StrategyConfig, frozen=True):
     ma_slow_period: int
     profit_in_ticks: int
     stoploss_in_ticks: int
+    # Lowest log level written by any log output (see `utils_logging.lowest_log_level()`)
+    # Messages below this level are not even formatted. Default "DEBUG" = format all messages.
+    log_level: str = "DEBUG"
+    # Optional: ParquetDataCatalog used for indicators warmup, when cache has not enough bars
+    warmup_catalog_path: str | None = None
 
 
 class MACrossStrategy(Strategy):
-    def __init__(self, config: MACrossStrategyConfig):
+    def __init__(
+        self,
+        config: MACrossStrategyConfig,
+        signals: dict[int, int] | None = None,
+        indicator_registry: IndicatorRegistry | None = None,
+    ):
         super().__init__(config)
 
         # Basic checks if configuration makes sense for the strategy
@@ -35,103 +50,206 @@ class MACrossStrategy(Strategy):
         )
 
         # Create indicators
-        self.ma_fast = MovingAverageFactory.create(
-            period=config.ma_fast_period, ma_type=config.ma_type
+        # Optional: Registry shared by more strategies on the same bar type -> identical indicators
+        # are created + updated only once for all of them. Without it, strategy has its own ones.
+        if indicator_registry is None:
+            indicator_registry = IndicatorRegistry()
+        bar_type = config.primary_bar_type
+        self.ma_fast = indicator_registry.moving_average(
+            bar_type, config.ma_fast_period, config.ma_type
+        )
+        self.ma_slow = indicator_registry.moving_average(
+            bar_type, config.ma_slow_period, config.ma_type
         )
-        self.ma_slow = MovingAverageFactory.create(
-            period=config.ma_slow_period, ma_type=config.ma_type
+        # Both indicators registered as one, which skips bars already processed by other strategies
+        self.shared_indicators = indicator_registry.shared_indicators(
+            bar_type, [self.ma_fast, self.ma_slow]
         )
 
+        # Logger formatting messages only when they will be really written
+        self.lazy_log = LazyLogger(self.log, level=config.log_level)
+
+        # Optional: MA crossings precomputed for all bars by vectorized pre-pass
+        # (see `utils_vectorized.ma_cross_signals()`). If provided, indicators are not updated
+        # bar by bar and `on_bar` only looks up, if there is crossing at the bar.
+        # Note: Faster only with SIMPLE MA, other MA types are precomputed value by value.
+        self.signals = signals
+
+        # Last known side of fast MA vs. slow MA (+1 above, -1 below), used to detect crossings
+        self.ma_state: int | None = None
+
+        # Position state of this strategy - kept up to date from position events,
+        # so `on_bar` reads plain attributes instead of querying portfolio on every bar
+        self.update_position_state(PositionSide.FLAT)
+
     def on_start(self):
         # Connect indicators with bar-type for automatic updating
-        self.register_indicator_for_bars(self.config.primary_bar_type, self.ma_fast)
-        self.register_indicator_for_bars(self.config.primary_bar_type, self.ma_slow)
+        # (not needed, when signals are precomputed by vectorized pre-pass)
+        if self.signals is None:
+            self.register_indicator_for_bars(self.config.primary_bar_type, self.shared_indicators)
+
+            # Warmup indicators from history -> no need to wait for first bars of the run
+            self.warmup_indicators()
 
         # Subscribe to bars
         self.subscribe_bars(self.config.primary_bar_type)
 
-    def on_bar(self, bar: Bar):
-        self.log.info(f"Bar: {repr(bar)}")
-
-        # Wait until all registered indicators are initialized
-        if not self.indicators_initialized():
-            count_of_bars = self.cache.bar_count(self.config.primary_bar_type)
-            self.log.info(
-                f"Waiting for indicators to warm initialize. | Bars count {count_of_bars}",
-                color=LogColor.BLUE,
+        # Precompute everything for orders, that never changes during the run.
+        # Profit/stoploss offsets are stored as fixed-point integers (the same as `Price.raw`),
+        # so bracket prices are built by integer addition only (no Decimal math + rounding per order).
+        instrument = self.config.instrument
+        self.price_precision = instrument.price_precision
+        self.profit_offset_raw = self.config.profit_in_ticks * instrument.price_increment.raw
+        self.stoploss_offset_raw = self.config.stoploss_in_ticks * instrument.price_increment.raw
+        self.trade_quantity = instrument.make_qty(self.config.trade_size)
+
+    def warmup_indicators(self):
+        bar_type = self.config.primary_bar_type
+        required_count = max(self.ma_fast.period, self.ma_slow.period)
+
+        # History is taken from cache first, then from catalog (if configured)
+        history = utils_warmup.history_from_cache(self.cache, bar_type, required_count)
+        if len(history) < required_count and self.config.warmup_catalog_path is not None:
+            history = utils_warmup.history_from_catalog(
+                self.config.warmup_catalog_path, bar_type, self.clock.timestamp_ns(), required_count
             )
-            return
+        if not history:
+            return  # no history -> indicators will be initialized by first bars of the run
+
+        utils_warmup.warmup_indicators([self.shared_indicators], history)
+        if self.indicators_initialized():
+            self.detect_crossing()  # remember current side of MAs, so first bar can be crossing
+        self.lazy_log.info(
+            "Indicators warmed up from %d historical bars | Initialized: %s",
+            len(history),
+            self.indicators_initialized(),
+            color=LogColor.BLUE,
+        )
+
+    def on_bar(self, bar: Bar):
+        self.lazy_log.info("Bar: %r", bar)
 
-        # Note: If we got here, all registered indicator are initialized
+        if self.signals is not None:
+            # Vectorized mode: crossings are precomputed -> bars without crossing are skipped
+            crossing = self.signals.get(bar.ts_init)
+        else:
+            # Wait until all registered indicators are initialized
+            if not self.indicators_initialized():
+                if self.lazy_log.is_info_enabled:  # counting bars in cache is not for free
+                    self.lazy_log.info(
+                        "Waiting for indicators to warm initialize. | Bars count %d",
+                        self.cache.bar_count(self.config.primary_bar_type),
+                        color=LogColor.BLUE,
+                    )
+                return
+
+            # Note: If we got here, all registered indicator are initialized
+            crossing = self.detect_crossing()
+
+        # Act only when MAs cross each other (not on every bar, where one MA is above the other)
+        if crossing is None:
+            return
 
         # BUY LOGIC
-        if self.ma_fast.value > self.ma_slow.value:  # If fast EMA is above slow EMA
-            if self.portfolio.is_flat(self.config.instrument.id):  # If we are flat
-                self.cancel_all_orders(
-                    self.config.instrument.id
-                )  # Make sure all waiting orders are cancelled
-                self.fire_trade(OrderSide.BUY, bar)  # Fire buy order
-            if self.portfolio.is_net_short(self.config.instrument.id):  # We are short already
-                self.cancel_all_orders(
-                    self.config.instrument.id
-                )  # Make sure all waiting orders are cancelled
-                self.close_all_positions(self.config.instrument.id)  # Let's close current position
-                self.fire_trade(OrderSide.BUY, bar)  # Fire buy order
+        if crossing > 0 and not self.is_net_long:  # If fast MA crossed above slow MA
+            self.reverse_position(OrderSide.BUY, bar)
 
         # SELL LOGIC
-        if self.ma_fast.value < self.ma_slow.value:
-            if self.portfolio.is_flat(self.config.instrument.id):
-                self.cancel_all_orders(self.config.instrument.id)
-                self.fire_trade(OrderSide.SELL, bar)
-            if self.portfolio.is_net_long(self.config.instrument.id):
-                self.cancel_all_orders(self.config.instrument.id)
-                self.close_all_positions(self.config.instrument.id)
-                self.fire_trade(OrderSide.BUY, bar)
+        if crossing < 0 and not self.is_net_short:  # If fast MA crossed below slow MA
+            self.reverse_position(OrderSide.SELL, bar)
+
+    def reverse_position(self, order_side: OrderSide, bar: Bar):
+        # Single action for entering new position (from flat or from opposite position):
+        #   1. cancel waiting orders (profit/stoploss of current position)
+        #   2. close current position
+        #   3. submit new bracket order
+        # Each step is sent only if there is something to do. Nautilus checks this too,
+        # but only after querying cache and formatting INFO log message for each skipped command.
+        # Note: Waiting orders = open + emulated (e.g. profit/stoploss held by OrderEmulator),
+        # the same orders `cancel_all_orders()` cancels.
+        instrument_id = self.config.instrument.id
+        waiting_orders_count = self.cache.orders_open_count(
+            instrument_id=instrument_id, strategy_id=self.id
+        ) + self.cache.orders_emulated_count(instrument_id=instrument_id, strategy_id=self.id)
+        if waiting_orders_count:
+            self.cancel_all_orders(instrument_id)  # Make sure all waiting orders are cancelled
+        if not self.is_flat:
+            self.close_all_positions(instrument_id)  # Let's close current position
+        self.fire_trade(order_side, bar)  # Fire new order
+
+    def detect_crossing(self) -> int | None:
+        # +1 = fast MA crossed above slow MA, -1 = fast MA crossed below slow MA, None = no crossing
+        if self.ma_fast.value > self.ma_slow.value:
+            ma_state = 1
+        elif self.ma_fast.value < self.ma_slow.value:
+            ma_state = -1
+        else:
+            return None  # MAs only touch each other -> state is kept until they really cross
+
+        previous_ma_state, self.ma_state = self.ma_state, ma_state
+        if previous_ma_state is None or previous_ma_state == ma_state:
+            return None  # first bar after warmup or no change
+        return ma_state
+
+    def on_position_opened(self, event: PositionOpened):
+        self.update_position_state(event.side)
+
+    def on_position_changed(self, event: PositionChanged):
+        self.update_position_state(event.side)
+
+    def on_position_closed(self, event: PositionClosed):
+        self.update_position_state(PositionSide.FLAT)
+
+    def update_position_state(self, side: PositionSide):
+        # Note: Strategy trades single instrument with NETTING OMS -> max. 1 open position,
+        # so its side says everything (the same as `portfolio.is_flat()` / `is_net_long()` / ...)
+        self.is_flat = side == PositionSide.FLAT
+        self.is_net_long = side == PositionSide.LONG
+        self.is_net_short = side == PositionSide.SHORT
 
     def fire_trade(self, order_side: OrderSide, last_bar: Bar):
         last_price = last_bar.close
+        bracket_order_list = self.create_bracket_order(order_side, last_price)
+
+        # Log order
+        self.lazy_log.info(
+            "Order: %s | Last price: %s | Profit: %s | Stoploss: %s",
+            order_side_to_str(order_side),
+            last_price,
+            bracket_order_list.orders[2].price,  # profit LIMIT order
+            bracket_order_list.orders[1].trigger_price,  # stoploss STOP_MARKET order
+            color=LogColor.BLUE,
+        )
 
-        # Prepare profit/stoploss prices
+        # Submit order
+        self.submit_order_list(bracket_order_list)
+
+    def create_bracket_order(self, order_side: OrderSide, last_price: Price) -> OrderList:
+        # Prepare profit/stoploss prices (integer arithmetic on fixed-point raw values)
+        # Note: Bar prices have the same precision as instrument prices.
         if order_side == OrderSide.BUY:
-            profit_price = (
-                last_price + self.config.profit_in_ticks * self.config.instrument.price_increment
-            )
-            stoploss_price = (
-                last_price - self.config.stoploss_in_ticks * self.config.instrument.price_increment
-            )
+            profit_raw = last_price.raw + self.profit_offset_raw
+            stoploss_raw = last_price.raw - self.stoploss_offset_raw
         elif order_side == OrderSide.SELL:
-            profit_price = (
-                last_price - self.config.profit_in_ticks * self.config.instrument.price_increment
-            )
-            stoploss_price = (
-                last_price + self.config.stoploss_in_ticks * self.config.instrument.price_increment
-            )
+            profit_raw = last_price.raw - self.profit_offset_raw
+            stoploss_raw = last_price.raw + self.stoploss_offset_raw
         else:
             raise ValueError(f"Order side: {order_side} is not supported.")
 
         # Prepare bracket order (bracket order is entry order with related contingent profit / stoploss orders)
-        bracket_order_list: OrderList = self.order_factory.bracket(
+        return self.order_factory.bracket(
             instrument_id=self.config.instrument.id,
             order_side=order_side,
-            quantity=self.config.instrument.make_qty(self.config.trade_size),
+            quantity=self.trade_quantity,
             entry_order_type=OrderType.MARKET,  # enter trade with MARKET order
-            sl_trigger_price=self.config.instrument.make_price(
-                stoploss_price
+            sl_trigger_price=Price.from_raw(
+                stoploss_raw, self.price_precision
             ),  # stoploss is always MARKET order (fixed in Nautilus)
             tp_order_type=OrderType.LIMIT,  # profit is LIMIT order
-            tp_price=self.config.instrument.make_price(
-                profit_price
+            tp_price=Price.from_raw(
+                profit_raw, self.price_precision
             ),  # set price for profit LIMIT order
         )
 
-        # Log order
-        self.log.info(
-            f"Order: {order_side_to_str(order_side)} | Last price: {last_price} | Profit: {profit_price} | Stoploss: {stoploss_price}",
-            color=LogColor.BLUE,
-        )
-
-        # Submit order
-        self.submit_order_list(bracket_order_list)
-
     def on_stop(self):
         pass
@@ -0,0 +1,109 @@
+from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
+from nautilus_trader.indicators.average.moving_average import MovingAverageType
+from nautilus_trader.indicators.base.indicator import Indicator
+from nautilus_trader.model.data import Bar, BarType
+
+
+# Indicators shared by many strategies / actors, which use the same bar type.
+#
+# Without registry, 10 strategies with the same MA periods on the same bars = 10x the same
+# indicator objects, each updated with every bar. With registry, identical indicators
+# (the same type + params + bar type) are created only once and updated only once per bar.
+#
+# Usage:
+#   registry = IndicatorRegistry()  # one instance, passed to all strategies / actors
+#
+#   # Strategy / Actor __init__:
+#   self.ma_fast = registry.moving_average(bar_type, 20, MovingAverageType.SIMPLE)
+#   self.ma_slow = registry.moving_average(bar_type, 50, MovingAverageType.SIMPLE)
+#   self.shared_indicators = registry.shared_indicators(bar_type, [self.ma_fast, self.ma_slow])
+#
+#   # Strategy / Actor on_start:
+#   self.register_indicator_for_bars(bar_type, self.shared_indicators)
+#
+# Note: Shared indicator is read-only for its users - never update it manually (e.g. `update_raw`),
+# it would change values for all other strategies too.
+
+
+class SharedIndicatorEntry:
+    # Shared indicator + timestamp of the last bar it was updated with
+    def __init__(self, indicator: Indicator):
+        self.indicator = indicator
+        self.last_ts_init = -1
+
+
+class SharedIndicators(Indicator):
+    # Indicators of one strategy / actor taken from registry, registered as one Nautilus indicator.
+    #
+    # Each user registers its own `SharedIndicators`, so every user gets the bar, but only the first
+    # one really updates shared indicators - the others see, that indicator already got this bar.
+    # This works regardless of order, in which strategies receive bars, and also for warmup
+    # from history (bars older than the last processed bar are skipped).
+
+    def __init__(self, entries: list[SharedIndicatorEntry]):
+        super().__init__([])
+        self._entries = entries
+
+    def handle_bar(self, bar: Bar):
+        ts_init = bar.ts_init
+        for entry in self._entries:
+            if ts_init > entry.last_ts_init:
+                entry.indicator.handle_bar(bar)
+                entry.last_ts_init = ts_init
+
+        self._set_has_inputs(True)
+        if not self.initialized:
+            self._set_initialized(all(entry.indicator.initialized for entry in self._entries))
+
+    def _reset(self):
+        # Called by `reset()`, e.g. when Nautilus resets all strategies (`engine.reset()`).
+        # Note: shared indicators are reset too -> for ALL their users, not only for this one
+        # (keeping their values + resetting only timestamps would feed the same bars twice).
+        # Nautilus resets all strategies / actors together, so every user starts from scratch.
+        for entry in self._entries:
+            entry.indicator.reset()
+            entry.last_ts_init = -1
+
+
+class IndicatorRegistry:
+    def __init__(self):
+        # key = (indicator type, params, bar type)
+        self._entries: dict[tuple, SharedIndicatorEntry] = {}
+
+    def moving_average(
+        self, bar_type: BarType, period: int, ma_type: MovingAverageType
+    ) -> Indicator:
+        key = (MovingAverageFactory, (period, ma_type), bar_type)
+        return self._get(key, lambda: MovingAverageFactory.create(period=period, ma_type=ma_type))
+
+    def indicator(self, bar_type: BarType, indicator_class: type[Indicator], *params) -> Indicator:
+        # Any other indicator, e.g. `registry.indicator(bar_type, AverageTrueRange, 14)`
+        key = (indicator_class, params, bar_type)
+        return self._get(key, lambda: indicator_class(*params))
+
+    def _get(self, key: tuple, create) -> Indicator:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = SharedIndicatorEntry(create())
+        return entry.indicator
+
+    def shared_indicators(self, bar_type: BarType, indicators: list[Indicator]) -> SharedIndicators:
+        entries = []
+        for indicator in indicators:
+            entry = next(
+                (
+                    entry
+                    for key, entry in self._entries.items()
+                    if key[2] == bar_type and entry.indicator is indicator
+                ),
+                None,
+            )
+            if entry is None:
+                raise ValueError(
+                    f"Indicator {indicator} is not in registry for bar type {bar_type}"
+                )
+            entries.append(entry)
+        return SharedIndicators(entries)
+
+    def indicators_count(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,78 @@
+from nautilus_trader.common.component import Logger
+from nautilus_trader.common.enums import LogColor
+from nautilus_trader.config import LoggingConfig
+
+
+# Nautilus log levels ordered from the most detailed to the least detailed
+LOG_LEVELS = ["TRACE", "DEBUG", "INFO", "WARNING", "ERROR", "OFF"]
+
+# Other spellings of the same levels (Nautilus accepts "WARN", short labels are used in log output)
+LOG_LEVEL_ALIASES = {
+    "TRC": "TRACE",
+    "DBG": "DEBUG",
+    "INF": "INFO",
+    "WARN": "WARNING",
+    "WRN": "WARNING",
+    "ERR": "ERROR",
+}
+
+
+def normalize_log_level(level: str) -> str:
+    # Any spelling (lowercase, "WARN", "WRN", ...) -> one of `LOG_LEVELS`
+    normalized = level.strip().upper()
+    normalized = LOG_LEVEL_ALIASES.get(normalized, normalized)
+    if normalized not in LOG_LEVELS:
+        raise ValueError(f"Unknown log level: {level!r}, expected one of {LOG_LEVELS}")
+    return normalized
+
+
+def lowest_log_level(logging_config: LoggingConfig) -> str:
+    # Lowest log level, that is written by any log output (console or file).
+    # Messages below this level are thrown away by Nautilus anyway.
+    if logging_config.bypass_logging:
+        return "OFF"
+    levels = [normalize_log_level(logging_config.log_level)]
+    if logging_config.log_level_file is not None:
+        levels.append(normalize_log_level(logging_config.log_level_file))
+    return min(levels, key=LOG_LEVELS.index)
+
+
+class LazyLogger:
+    # Thin wrapper around strategy logger (`self.log`), which formats message only
+    # when it will really be written by some log output.
+    #
+    # Calling `self.log.info(f"Bar: {repr(bar)}")` always builds the string first
+    # (and Nautilus converts it for Rust logger), even if INFO level is not written anywhere.
+    # In hot paths (like `on_bar`) this costs more than the trading logic itself.
+    #
+    # Usage:
+    #   self.lazy_log = LazyLogger(self.log, level="INFO")
+    #   self.lazy_log.info("Bar: %r", bar)             # formatted only when INFO is enabled
+    #   if self.lazy_log.is_debug_enabled:             # guard for expensive arguments
+    #       self.lazy_log.debug("Bars count %d", self.cache.bar_count(bar_type))
+    def __init__(self, log: Logger, level: str = "DEBUG"):
+        self.log = log
+        self.level = normalize_log_level(level)
+
+        # Flags are computed only once here -> checking them in hot path is just attribute read
+        level_index = LOG_LEVELS.index(self.level)
+        self.is_debug_enabled = level_index <= LOG_LEVELS.index("DEBUG")
+        self.is_info_enabled = level_index <= LOG_LEVELS.index("INFO")
+        self.is_warning_enabled = level_index <= LOG_LEVELS.index("WARNING")
+        self.is_error_enabled = level_index <= LOG_LEVELS.index("ERROR")
+
+    def debug(self, message: str, *args, color: LogColor = LogColor.NORMAL):
+        if self.is_debug_enabled:
+            self.log.debug(message % args if args else message, color)
+
+    def info(self, message: str, *args, color: LogColor = LogColor.NORMAL):
+        if self.is_info_enabled:
+            self.log.info(message % args if args else message, color)
+
+    def warning(self, message: str, *args, color: LogColor = LogColor.YELLOW):
+        if self.is_warning_enabled:
+            self.log.warning(message % args if args else message, color)
+
+    def error(self, message: str, *args, color: LogColor = LogColor.RED):
+        if self.is_error_enabled:
+            self.log.error(message % args if args else message, color)
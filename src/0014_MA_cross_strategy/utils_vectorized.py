@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+from nautilus_trader.indicators.average.ma_factory import MovingAverageFactory
+from nautilus_trader.indicators.average.moving_average import MovingAverageType
+from nautilus_trader.model.data import Bar
+
+
+# Vectorized pre-pass for MA cross strategy.
+#
+# MA cross condition depends only on bar closes, so it can be computed for all bars
+# before the backtest is started. Strategy then only looks up precomputed crossing in `on_bar`
+# instead of updating indicators bar by bar.
+#
+# Important: Pre-pass must get the same bars, which will be processed by the engine
+# (the same start / end), otherwise indicators would be warmed up from different data.
+#
+# Note: Pre-pass is faster only for SIMPLE MA, which is computed for all bars at once (NumPy).
+# EXPONENTIAL, WILDER + other MA types are computed value by value (each value depends on
+# the previous one) -> about the same time as event-driven mode, no speed-up
+# (see `run_vectorized_comparison.py`). Use pre-pass with these types only for identical results.
+
+
+def simple_moving_average(closes: np.ndarray, period: int) -> np.ndarray:
+    # Nautilus SMA = sum of last `period` values (added one by one, from the oldest) / count.
+    # Sums of all windows are built the same way, only for all bars at once:
+    # 1st value of every window is added, then 2nd value of every window, ...
+    # -> the same additions in the same order = bit-identical results.
+    count = len(closes)
+    values = np.empty(count, dtype=np.float64)
+
+    # Before indicator is initialized, its value is the mean of all values received so far
+    head = min(period - 1, count)
+    values[:head] = np.cumsum(closes[:head]) / np.arange(1, head + 1)
+
+    if count >= period:
+        windows = count - period + 1
+        totals = np.zeros(windows, dtype=np.float64)
+        for offset in range(period):
+            totals += closes[offset : offset + windows]
+        values[period - 1 :] = totals / period
+    return values
+
+
+def exponential_moving_average(
+    closes: np.ndarray, period: int, alpha: float | None = None
+) -> np.ndarray:
+    # Each value depends on the previous one -> it can't be computed as one NumPy operation
+    # without changing rounding. Plain loop over Python floats (the same formula as Nautilus)
+    # keeps values exact, but it is only slightly faster than updating the indicator itself.
+    if alpha is None:
+        alpha = 2.0 / (period + 1.0)
+    keep = 1.0 - alpha
+    values = np.empty(len(closes), dtype=np.float64)
+    value = float(closes[0]) if len(closes) else 0.0  # first value is the first input
+    for i, close in enumerate(closes.tolist()):
+        value = alpha * close + keep * value
+        values[i] = value
+    return values
+
+
+def moving_average_values(
+    closes: np.ndarray, period: int, ma_type: MovingAverageType
+) -> np.ndarray:
+    # Values of `MovingAverageFactory.create(period, ma_type)` after each close,
+    # identical (bit by bit) to event-driven mode -> both modes produce identical fills.
+    closes = np.ascontiguousarray(closes, dtype=np.float64)
+    if ma_type == MovingAverageType.SIMPLE:
+        return simple_moving_average(closes, period)
+    if ma_type == MovingAverageType.EXPONENTIAL:
+        return exponential_moving_average(closes, period)
+    if ma_type == MovingAverageType.WILDER:
+        return exponential_moving_average(closes, period, alpha=1.0 / period)
+
+    # Other types (DOUBLE_EXPONENTIAL, HULL, ADAPTIVE, ...): feed the Nautilus indicator
+    # value by value (always exact, just slower)
+    indicator = MovingAverageFactory.create(period=period, ma_type=ma_type)
+    values = np.empty(len(closes), dtype=np.float64)
+    for i, close in enumerate(closes.tolist()):
+        indicator.update_raw(close)
+        values[i] = indicator.value
+    return values
+
+
+def ma_cross_signals(
+    bars: list[Bar], ma_type: MovingAverageType, fast_period: int, slow_period: int
+) -> dict[int, int]:
+    # Returns only bars, where MAs cross each other (key = bar.ts_init):
+    #   +1 = fast MA crossed above slow MA
+    #   -1 = fast MA crossed below slow MA
+    # The same rules as `MACrossStrategy.detect_crossing()` are used.
+    closes = np.fromiter((bar.close.as_double() for bar in bars), dtype=np.float64, count=len(bars))
+    ma_fast = moving_average_values(closes, fast_period, ma_type)
+    ma_slow = moving_average_values(closes, slow_period, ma_type)
+
+    # Step 1: Side of fast MA vs. slow MA for all bars at once (+1 above, -1 below, 0 equal)
+    ma_states = np.where(ma_fast > ma_slow, 1.0, np.where(ma_fast < ma_slow, -1.0, 0.0))
+
+    # Step 2: Bars during warmup have no state (indicators are initialized,
+    # when they got at least `period` values -> slow MA is the last one)
+    warmup = max(fast_period, slow_period) - 1
+    ma_states[:warmup] = np.nan
+
+    # Step 3: MAs only touching each other (0) keep the previous state
+    ma_states = pd.Series(ma_states).replace(0.0, np.nan).ffill().to_numpy()
+
+    # Step 4: Crossing = state changed from previous bar (both states must be known)
+    previous_states, states = ma_states[:-1], ma_states[1:]
+    is_crossing = ~np.isnan(previous_states) & ~np.isnan(states) & (previous_states != states)
+    crossing_indexes = np.flatnonzero(is_crossing) + 1
+
+    ts_init = np.fromiter((bar.ts_init for bar in bars), dtype=np.uint64, count=len(bars))
+    return dict(
+        zip(ts_init[crossing_indexes].tolist(), ma_states[crossing_indexes].astype(int).tolist())
+    )
@@ -0,0 +1,30 @@
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.indicators.base.indicator import Indicator
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.persistence.catalog.parquet import ParquetDataCatalog
+
+
+# Warmup of indicators from historical bars.
+#
+# Without warmup, strategy must wait for first N bars of the run, until its indicators
+# are initialized. With warmup, indicators are fed from history at strategy start
+# -> live strategy can trade immediately + backtest doesn't process waiting bars.
+
+
+def history_from_cache(cache: Cache, bar_type: BarType, count: int) -> list[Bar]:
+    # Cache returns bars from the newest to the oldest -> reverse them
+    return cache.bars(bar_type)[:count][::-1]
+
+
+def history_from_catalog(catalog_path: str, bar_type: BarType, end: int, count: int) -> list[Bar]:
+    # Last `count` bars before `end` (UNIX timestamp in nanoseconds)
+    catalog = ParquetDataCatalog(catalog_path)
+    bars = catalog.bars(bar_types=[str(bar_type)], end=end)
+    return bars[-count:]
+
+
+def warmup_indicators(indicators: list[Indicator], bars: list[Bar]):
+    # All history is processed in one call (bars must be sorted from the oldest to the newest)
+    for bar in bars:
+        for indicator in indicators:
+            indicator.handle_bar(bar)
@@ -0,0 +1,122 @@
+import itertools
+import tomllib
+from pathlib import Path
+
+import msgspec
+from nautilus_trader.config import NautilusConfig
+
+
+# Each section of one backtest run is described by a small (immutable) config object.
+# Default values match the setup used in example `0014_MA_cross_strategy`.
+
+
+class VenueConfig(NautilusConfig, frozen=True):
+    name: str = "GLBX"
+    oms_type: str = "NETTING"  # name of `OmsType` enum
+    account_type: str = "MARGIN"  # name of `AccountType` enum
+    base_currency: str = "USD"
+    starting_balance: float = 1_000_000
+    default_leverage: float = 1
+
+
+class FeeModelConfig(NautilusConfig, frozen=True):
+    commission_per_contract: float = 2.36  # -> `PerContractFeeModel`
+
+
+class FillModelConfig(NautilusConfig, frozen=True):
+    prob_fill_on_limit: float = 0.0
+    prob_fill_on_stop: float = 0.0
+    prob_slippage: float = 1.0
+    random_seed: int | None = 42
+
+
+class InstrumentConfig(NautilusConfig, frozen=True):
+    factory: str = "eurusd_future"  # name of function in `utils_instruments.py`
+    params: dict = {}  # keyword arguments for the factory function, like: expiry_year, expiry_month
+
+
+class BarDataConfig(NautilusConfig, frozen=True):
+    csv_path: str  # relative paths are resolved against the folder of the manifest file
+    bar_spec: str = "1-MINUTE-LAST-EXTERNAL"  # bar type = "{instrument_id}-{bar_spec}"
+
+
+class StrategyRunConfig(NautilusConfig, frozen=True):
+    strategy_path: str = "strategy:MACrossStrategy"  # "module:ClassName"
+    config_path: str = "strategy:MACrossStrategyConfig"  # "module:ClassName"
+    params: dict = {}  # strategy config values (instrument + bar type are filled automatically)
+
+
+class StopConditionsConfig(NautilusConfig, frozen=True):
+    # All conditions are optional, run is stopped (pruned) when any of them is met
+    max_drawdown: float | None = None  # max allowed drop of equity from its peak
+    equity_floor: float | None = None  # min allowed equity
+    min_trades: int | None = None  # min count of closed trades ...
+    min_trades_by: str | None = None  # ... that must be reached by this time
+    check_interval_mins: int = 60  # how often are conditions evaluated (in backtest time)
+    # (engine is run in chunks of this size, pruned run stops right at the check)
+
+
+class RunConfig(NautilusConfig, frozen=True):
+    name: str
+    data: BarDataConfig
+    venue: VenueConfig = VenueConfig()
+    fee_model: FeeModelConfig = FeeModelConfig()
+    fill_model: FillModelConfig = FillModelConfig()
+    instrument: InstrumentConfig = InstrumentConfig()
+    strategy: StrategyRunConfig = StrategyRunConfig()
+    stop_conditions: StopConditionsConfig | None = None  # None = always run till the end
+    start: str | None = None  # None = from the first bar
+    end: str | None = None  # None = till the last bar
+    log_level: str = "ERROR"  # keep console quiet, when running hundreds of backtests
+
+
+def load_manifest(manifest_path: str | Path) -> list[RunConfig]:
+    # Manifest is a TOML file with 3 optional sections:
+    #   [defaults]  - values shared by all runs
+    #   [[runs]]    - list of single runs (each overrides some defaults)
+    #   [[sweeps]]  - list of parameter grids, every list in `strategy.params` is expanded
+    #                 into cartesian product of all values = one run per combination
+    manifest_path = Path(manifest_path).resolve()
+    with open(manifest_path, "rb") as f:
+        manifest = tomllib.load(f)
+
+    defaults = manifest.get("defaults", {})
+    raw_runs: list[dict] = []
+
+    for run in manifest.get("runs", []):
+        raw_runs.append(_merge(defaults, run))
+
+    for sweep in manifest.get("sweeps", []):
+        sweep = _merge(defaults, sweep)
+        grid = sweep.get("strategy", {}).get("params", {})
+        names = [name for name, value in grid.items() if isinstance(value, list)]
+        for combination in itertools.product(*(grid[name] for name in names)):
+            params = dict(zip(names, combination))
+            suffix = ",".join(f"{name}={value}" for name, value in params.items())
+            raw_runs.append(
+                _merge(
+                    sweep, {"name": f"{sweep['name']}[{suffix}]", "strategy": {"params": params}}
+                )
+            )
+
+    runs: list[RunConfig] = []
+    for raw_run in raw_runs:
+        # Make CSV path independent on working directory
+        csv_path = Path(raw_run["data"]["csv_path"])
+        if not csv_path.is_absolute():
+            csv_path = (manifest_path.parent / csv_path).resolve()
+            raw_run["data"] = {**raw_run["data"], "csv_path": str(csv_path)}
+        runs.append(msgspec.convert(raw_run, type=RunConfig))
+
+    return runs
+
+
+def _merge(base: dict, override: dict) -> dict:
+    # Deep merge of 2 dictionaries (values from `override` win)
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
@@ -0,0 +1,75 @@
+import hashlib
+import importlib
+import inspect
+from pathlib import Path
+
+import msgspec
+import nautilus_trader
+import pandas as pd
+
+from backtest_config import RunConfig
+
+
+# Backtest with fixed data + fixed random seed of FillModel is fully deterministic,
+# so its results can be stored on disk and reused next time instead of running it again.
+#
+# Results are stored under content-addressed key (hash) built from everything, that can change results:
+#   - content of data file(s)
+#   - run configuration (venue, fee/fill model, instrument, strategy, stop conditions, start/end)
+#   - source code of strategy module + all local modules of this example (instruments, CSV loading,
+#     stop conditions, engine setup in runner, ...) -> any code change gives new key
+#   - version of NautilusTrader
+class ResultsCache:
+    def __init__(self, cache_dir: str | Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._file_hashes: dict[str, str] = {}  # hashing data file once is enough
+        self._code_hash = self._hash_local_modules()  # code doesn't change during the run
+
+    def key(self, run: RunConfig) -> str | None:
+        # Runs without fixed random seed are not deterministic -> they cannot be cached
+        if run.fill_model.random_seed is None:
+            return None
+
+        # Name and log level have no effect on results
+        run_dict = msgspec.to_builtins(run)
+        del run_dict["name"]
+        del run_dict["log_level"]
+
+        strategy_module = importlib.import_module(run.strategy.strategy_path.split(":")[0])
+
+        hasher = hashlib.sha256()
+        hasher.update(msgspec.json.encode(run_dict, order="sorted"))
+        hasher.update(self._hash_file(run.data.csv_path).encode())
+        hasher.update(inspect.getsource(strategy_module).encode())
+        hasher.update(self._code_hash.encode())
+        hasher.update(nautilus_trader.__version__.encode())
+        return hasher.hexdigest()
+
+    def get(self, key: str | None) -> dict | None:
+        if key is None:
+            return None
+        path = self._path(key)
+        return pd.read_pickle(path) if path.exists() else None
+
+    def put(self, key: str | None, result: dict):
+        if key is None:
+            return
+        pd.to_pickle(result, self._path(key))
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def _hash_local_modules(self) -> str:
+        # All `.py` files in the folder of this example (sorted -> the same order every time)
+        hasher = hashlib.sha256()
+        for path in sorted(Path(__file__).resolve().parent.glob("*.py")):
+            hasher.update(path.name.encode())
+            hasher.update(path.read_bytes())
+        return hasher.hexdigest()
+
+    def _hash_file(self, path: str) -> str:
+        if path not in self._file_hashes:
+            with open(path, "rb") as f:
+                self._file_hashes[path] = hashlib.file_digest(f, "sha256").hexdigest()
+        return self._file_hashes[path]
@@ -0,0 +1,249 @@
+import argparse
+import importlib
+import time
+from decimal import Decimal
+from enum import Enum
+
+import pandas as pd
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.models import FillModel, PerContractFeeModel
+from nautilus_trader.config import BacktestEngineConfig, LoggingConfig
+from nautilus_trader.model import TraderId
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Currency, Money
+from nautilus_trader.trading.strategy import Strategy
+
+import utils_csv
+import utils_instruments
+from backtest_config import (
+    BarDataConfig,
+    InstrumentConfig,
+    RunConfig,
+    StopConditionsConfig,
+    StrategyRunConfig,
+    load_manifest,
+)
+from results_cache import ResultsCache
+from stop_conditions import EarlyStopActor, EquityFloor, MaxDrawdown, MinTradesByTime
+
+
+class DataCache:
+    # Instruments + bars are created only once and then shared by all runs using the same data.
+    # Loading CSV + wrangling bars is the slowest part of short backtests, so with hundreds
+    # of runs over the same file, this saves most of the time.
+    def __init__(self):
+        self._instruments: dict[tuple, Instrument] = {}
+        self._bars: dict[tuple, list[Bar]] = {}
+
+    def instrument(self, config: InstrumentConfig, venue: Venue) -> Instrument:
+        key = (config.factory, tuple(sorted(config.params.items())), venue)
+        if key not in self._instruments:
+            factory = getattr(utils_instruments, config.factory)
+            self._instruments[key] = factory(**config.params, venue_name=venue.value)
+        return self._instruments[key]
+
+    def bars(self, config: BarDataConfig, instrument: Instrument) -> tuple[BarType, list[Bar]]:
+        bar_type = BarType.from_str(f"{instrument.id}-{config.bar_spec}")
+        key = (config.csv_path, bar_type)
+        if key not in self._bars:
+            self._bars[key] = utils_csv.load_bars_from_ninjatrader_csv(
+                csv_path=config.csv_path,
+                instrument=instrument,
+                bar_type=bar_type,
+            )
+        return bar_type, self._bars[key]
+
+
+def create_strategy(
+    config: StrategyRunConfig, instrument: Instrument, bar_type: BarType
+) -> Strategy:
+    strategy_class = _import_from_path(config.strategy_path)
+    config_class = _import_from_path(config.config_path)
+
+    # Values from TOML are plain str/int/float -> convert them to types declared in strategy config
+    annotations = {}
+    for cls in reversed(config_class.__mro__):
+        annotations.update(getattr(cls, "__annotations__", {}))
+    params = {name: _convert(value, annotations.get(name)) for name, value in config.params.items()}
+
+    strategy_config = config_class(instrument=instrument, primary_bar_type=bar_type, **params)
+    return strategy_class(strategy_config)
+
+
+def create_early_stop_actor(
+    config: StopConditionsConfig, venue: Venue, currency: Currency
+) -> EarlyStopActor:
+    conditions = []
+    if config.max_drawdown is not None:
+        conditions.append(MaxDrawdown(config.max_drawdown))
+    if config.equity_floor is not None:
+        conditions.append(EquityFloor(config.equity_floor))
+    if config.min_trades is not None:
+        deadline = pd.Timestamp(config.min_trades_by, tz="UTC")
+        conditions.append(MinTradesByTime(config.min_trades, deadline))
+
+    return EarlyStopActor(
+        venue=venue,
+        currency=currency,
+        conditions=conditions,
+        check_interval=pd.Timedelta(minutes=config.check_interval_mins),
+    )
+
+
+def run_in_chunks(engine: BacktestEngine, start_ns: int, end_ns: int, actor: EarlyStopActor):
+    # Engine is run chunk by chunk in streaming mode (all data are already added).
+    # After each chunk stop conditions are checked and if any of them is met, remaining data
+    # are skipped -> run is stopped exactly at the check (chunk size = `actor.check_interval`)
+    #   - Note: `engine.run()` requires start < end -> too short last chunk is joined to previous
+    chunk_start_ns = start_ns
+    while chunk_start_ns < end_ns:
+        chunk_end_ns = chunk_start_ns + actor.check_interval.value
+        if chunk_end_ns + 1 >= end_ns:
+            chunk_end_ns = end_ns
+        engine.run(start=chunk_start_ns, end=chunk_end_ns, streaming=True)
+        if actor.check_conditions(chunk_end_ns) is not None:
+            break
+        chunk_start_ns = chunk_end_ns + 1
+    engine.end()
+
+
+def run_backtest(run: RunConfig, data_cache: DataCache) -> dict:
+    # Engine: configure + create
+    engine_config = BacktestEngineConfig(
+        trader_id=TraderId("BACKTEST_TRADER-001"),
+        logging=LoggingConfig(log_level=run.log_level),
+    )
+    engine = BacktestEngine(config=engine_config)
+
+    # Venue: create + add to engine
+    venue = Venue(run.venue.name)
+    currency = Currency.from_str(run.venue.base_currency)
+    engine.add_venue(
+        venue=venue,
+        oms_type=OmsType[run.venue.oms_type],
+        account_type=AccountType[run.venue.account_type],
+        starting_balances=[Money(run.venue.starting_balance, currency)],
+        fee_model=PerContractFeeModel(
+            commission=Money(run.fee_model.commission_per_contract, currency)
+        ),
+        base_currency=currency,
+        default_leverage=Decimal(str(run.venue.default_leverage)),
+        # Note: FillModel seeds random generator when created, so it must be created for each run
+        fill_model=FillModel(
+            prob_fill_on_limit=run.fill_model.prob_fill_on_limit,
+            prob_fill_on_stop=run.fill_model.prob_fill_on_stop,
+            prob_slippage=run.fill_model.prob_slippage,
+            random_seed=run.fill_model.random_seed,
+        ),
+    )
+
+    # Instrument + bars: taken from cache (loaded only by first run, that needs them)
+    instrument = data_cache.instrument(run.instrument, venue)
+    engine.add_instrument(instrument)
+    bar_type, bars = data_cache.bars(run.data, instrument)
+    engine.add_data(bars)
+
+    # Strategy
+    engine.add_strategy(create_strategy(run.strategy, instrument, bar_type))
+
+    # Optional: actor evaluating stop conditions
+    early_stop_actor = None
+    if run.stop_conditions is not None:
+        early_stop_actor = create_early_stop_actor(run.stop_conditions, venue, currency)
+        engine.add_actor(early_stop_actor)
+
+    # Run engine = Run backtest
+    wall_time_start = time.perf_counter()
+    if early_stop_actor is None:
+        engine.run(start=run.start, end=run.end)
+    else:
+        start_ns = pd.Timestamp(run.start, tz="UTC").value if run.start else bars[0].ts_init
+        end_ns = pd.Timestamp(run.end, tz="UTC").value if run.end else bars[-1].ts_init
+        run_in_chunks(engine, start_ns, end_ns, early_stop_actor)
+    wall_time = time.perf_counter() - wall_time_start
+
+    # Collect summary of results
+    result = engine.get_result()
+    stats_pnls = result.stats_pnls.get(run.venue.base_currency, {})
+    pruned_reason = early_stop_actor.pruned_reason if early_stop_actor else None
+    summary = {
+        "name": run.name,
+        "status": "pruned" if pruned_reason else "completed",
+        "pruned_reason": pruned_reason,
+        "pnl_total": stats_pnls.get("PnL (total)"),
+        "win_rate": stats_pnls.get("Win Rate"),
+        "total_orders": result.total_orders,
+        "total_positions": result.total_positions,
+        "iterations": result.iterations,
+        "wall_time_secs": round(wall_time, 3),
+    }
+    reports = {
+        "account": engine.trader.generate_account_report(venue),
+        "order_fills": engine.trader.generate_order_fills_report(),
+        "positions": engine.trader.generate_positions_report(),
+    }
+
+    # Cleanup resources
+    engine.dispose()
+
+    return {"summary": summary, "reports": reports}
+
+
+def _import_from_path(path: str):
+    # Path is in format "module:ClassName" (the same format Nautilus uses in `ImportableConfig`)
+    module_name, class_name = path.split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _convert(value, annotation):
+    # Enum values are written by name in TOML, like: ma_type = "EXPONENTIAL"
+    # Annotation can be enum class or enum member (like `MovingAverageType.SIMPLE`)
+    if isinstance(annotation, Enum):
+        annotation = type(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, Enum) and isinstance(value, str):
+        return annotation[value]
+    if annotation is Decimal:
+        return Decimal(str(value))
+    return value
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run backtests defined in TOML manifest file(s).")
+    parser.add_argument("manifests", nargs="+", help="path(s) to TOML manifest file(s)")
+    parser.add_argument("--cache-dir", default="results_cache", help="folder for cached results")
+    parser.add_argument("--no-cache", action="store_true", help="always run all backtests")
+    args = parser.parse_args()
+
+    # Collect runs from all manifests
+    runs: list[RunConfig] = []
+    for manifest in args.manifests:
+        runs.extend(load_manifest(manifest))
+
+    # Run all backtests (data are shared between runs)
+    # Already computed (deterministic) runs are taken from results cache
+    data_cache = DataCache()
+    results_cache = None if args.no_cache else ResultsCache(args.cache_dir)
+    summaries = []
+    for i, run in enumerate(runs, start=1):
+        key = results_cache.key(run) if results_cache else None
+        result = results_cache.get(key) if results_cache else None
+        is_cached = result is not None
+        if is_cached:
+            print(f"Backtest {i}/{len(runs)} taken from cache: {run.name}")
+        else:
+            print(f"Running backtest {i}/{len(runs)}: {run.name}")
+            result = run_backtest(run, data_cache)
+            if results_cache:
+                results_cache.put(key, result)
+
+        # Cached result could be computed under different name
+        summaries.append({**result["summary"], "name": run.name, "cached": is_cached})
+
+    # Print summary of all runs
+    with pd.option_context(
+        "display.max_rows", None, "display.max_colwidth", None, "display.width", None
+    ):
+        print(pd.DataFrame(summaries).set_index("name"))
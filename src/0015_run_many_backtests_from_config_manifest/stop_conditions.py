@@ -0,0 +1,107 @@
+from abc import ABC, abstractmethod
+
+import pandas as pd
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.model.events import PositionClosed
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Currency
+
+
+# Stop conditions are small objects with single method `check()`.
+# It returns reason (text) when the run should be stopped, otherwise None.
+# Custom conditions can be added simply by subclassing `StopCondition` and implementing `check()`.
+
+
+class StopCondition(ABC):
+    @abstractmethod
+    def check(self, equity: float, trades_count: int, ts_now: int) -> str | None: ...
+
+
+class MaxDrawdown(StopCondition):
+    def __init__(self, max_drawdown: float):
+        self.max_drawdown = max_drawdown
+        self.peak_equity: float | None = None
+
+    def check(self, equity: float, trades_count: int, ts_now: int) -> str | None:
+        self.peak_equity = equity if self.peak_equity is None else max(self.peak_equity, equity)
+        drawdown = self.peak_equity - equity
+        if drawdown > self.max_drawdown:
+            return f"Drawdown {drawdown:.2f} exceeded max drawdown {self.max_drawdown:.2f}"
+        return None
+
+
+class EquityFloor(StopCondition):
+    def __init__(self, equity_floor: float):
+        self.equity_floor = equity_floor
+
+    def check(self, equity: float, trades_count: int, ts_now: int) -> str | None:
+        if equity < self.equity_floor:
+            return f"Equity {equity:.2f} fell below equity floor {self.equity_floor:.2f}"
+        return None
+
+
+class MinTradesByTime(StopCondition):
+    def __init__(self, min_trades: int, deadline: pd.Timestamp):
+        self.min_trades = min_trades
+        self.deadline_ns = deadline.value
+
+    def check(self, equity: float, trades_count: int, ts_now: int) -> str | None:
+        if ts_now >= self.deadline_ns and trades_count < self.min_trades:
+            return f"Only {trades_count} trades till deadline, required at least {self.min_trades}"
+        return None
+
+
+# This actor tracks equity + closed trades of running backtest and evaluates stop conditions.
+# Runner calls `check_conditions()` between chunks of `engine.run()` (see `run_in_chunks`):
+#   - engine is paused at that moment -> when any condition is met, the run is left right there
+#     and marked as pruned (no more data, no more fills of resting orders at the exchange)
+#   - Note: stopping trader from inside of the run (e.g. `shutdown_system()` on timer) is not
+#     enough - engine still iterates remaining data of running chunk and exchange keeps filling
+#     resting orders (take-profit, stop-loss)
+class EarlyStopActor(Actor):
+    def __init__(
+        self,
+        venue: Venue,
+        currency: Currency,
+        conditions: list[StopCondition],
+        check_interval: pd.Timedelta,
+    ):
+        super().__init__()
+        self.venue = venue
+        self.currency = currency
+        self.conditions = conditions
+        self.check_interval = check_interval  # = size of chunks, runner runs engine in
+        self.trades_count = 0  # count of closed positions
+        self.pruned_reason: str | None = None
+
+    def on_start(self):
+        # Count closed positions of all strategies
+        self.msgbus.subscribe("events.position.*", self.on_position_event)
+
+    def on_position_event(self, event):
+        if isinstance(event, PositionClosed):
+            self.trades_count += 1
+
+    def check_conditions(self, ts_now: int) -> str | None:
+        # Returns reason, when the run should be stopped (conditions are not evaluated on every
+        # bar, but only between chunks, so it is cheap)
+        if self.pruned_reason is not None:
+            return self.pruned_reason
+
+        account = self.portfolio.account(self.venue)
+        if account is None:
+            return None  # account is not initialized yet
+
+        # Equity = account balance + unrealized PnL of open positions
+        equity = account.balance_total(self.currency).as_double()
+        unrealized_pnl = self.portfolio.unrealized_pnls(self.venue).get(self.currency)
+        if unrealized_pnl is not None:
+            equity += unrealized_pnl.as_double()
+
+        for condition in self.conditions:
+            reason = condition.check(equity, self.trades_count, ts_now)
+            if reason is not None:
+                self.pruned_reason = reason
+                self.log.warning(f"Stopping backtest early: {reason}")
+                return reason
+        return None
@@ -0,0 +1,169 @@
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+
+import pandas as pd
+from nautilus_trader.backtest.engine import BacktestEngine, Decimal
+from nautilus_trader.backtest.models import FillModel, PerContractFeeModel
+from nautilus_trader.config import BacktestEngineConfig, LoggingConfig
+from nautilus_trader.indicators.average.moving_average import MovingAverageType
+from nautilus_trader.model import TraderId
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import InstrumentId, Venue
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Money
+
+import utils_csv
+import utils_instruments
+from strategy import MACrossStrategy, MACrossStrategyConfig
+
+
+# !!! DEMO DATA: ALL INSTRUMENTS OF THE CURVE HAVE IDENTICAL PRICES !!!
+# We have market data only for 6EH4, so its CSV file is a stand-in for every contract of the curve
+# (see `DEMO_CSV_PATH`). All instruments get the same bars -> the same signals, orders + results.
+# The example measures loading + throughput of many instruments, its trading results say nothing
+# about the curve. With real data, map each instrument to its own file in `csv_paths`.
+
+# FUTURES CURVE: all combinations of underlyings x expiries
+# To validate scaling to 100+ instruments, simply extend these lists
+# (e.g. 6 underlyings x 20 expiries = 120 instruments)
+UNDERLYINGS = ["6E", "6B", "6J", "6A", "6C"]
+EXPIRIES = [(2024, 3), (2024, 6), (2024, 9), (2024, 12)]  # (year, month)
+
+# We have market data only for 6EH4 contract, so for demonstration purposes
+# the same CSV file is used as stand-in data for all contracts of the curve.
+# With real data, map each instrument to its own file here.
+DEMO_CSV_PATH = r"../!market_data/cme/futures/fx/6EH4.GLBX_1min_bars_20240101_20240131.csv"
+
+# Count of threads loading CSV files in parallel
+LOADING_THREADS = 8
+
+
+class MeasuredMACrossStrategy(MACrossStrategy):
+    # Same strategy, it only measures time spent in `on_bar` handler (= per instrument)
+    def __init__(self, config: MACrossStrategyConfig):
+        super().__init__(config)
+        self.bars_processed = 0
+        self.on_bar_time_ns = 0
+
+    def on_bar(self, bar: Bar):
+        start_ns = time.perf_counter_ns()
+        super().on_bar(bar)
+        self.on_bar_time_ns += time.perf_counter_ns() - start_ns
+        self.bars_processed += 1
+
+
+def load_curve_bars(
+    instruments: list[Instrument], csv_paths: dict[InstrumentId, str]
+) -> dict[InstrumentId, list[Bar]]:
+    # Each contract is loaded in separate thread
+    def load_instrument_bars(instrument: Instrument) -> list[Bar]:
+        return utils_csv.load_bars_from_ninjatrader_csv(
+            csv_path=csv_paths[instrument.id],
+            instrument=instrument,
+            bar_type=BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL"),
+        )
+
+    with ThreadPoolExecutor(max_workers=LOADING_THREADS) as executor:
+        bars_lists = executor.map(load_instrument_bars, instruments)
+        return {instrument.id: bars for instrument, bars in zip(instruments, bars_lists)}
+
+
+if __name__ == "__main__":
+    # Engine: configure + create
+    engine_config = BacktestEngineConfig(
+        trader_id=TraderId("BACKTEST_TRADER-001"),
+        logging=LoggingConfig(log_level="ERROR"),  # hundreds of instruments = huge logs
+    )
+    engine = BacktestEngine(config=engine_config)
+
+    # Venue: create + add to engine
+    # Note: Venue must be added first -> before Instrument
+    venue: Venue = Venue("GLBX")
+    engine.add_venue(
+        venue=venue,
+        oms_type=OmsType.NETTING,  # Order Management System type
+        account_type=AccountType.MARGIN,  # Type of trading account
+        starting_balances=[Money(1_000_000, USD)],  # Initial balance
+        fee_model=PerContractFeeModel(commission=Money(2.36, USD)),
+        base_currency=USD,  # Base currency for the venue
+        default_leverage=Decimal(1),
+        fill_model=FillModel(
+            prob_fill_on_limit=0,  # 0 = 0% probability = never fill market touches limit price
+            prob_fill_on_stop=0,  # 0 = 0% probability =  never fill at stop-price when market touches stop-price
+            prob_slippage=1,  # 1 = 100% probability =  always simulate 1-tick slippage with market order
+            random_seed=42,  # fixed random seed for reproducible results
+        ),
+    )
+
+    # Instruments: create whole curve + add to engine
+    instruments = utils_instruments.fx_futures_curve(UNDERLYINGS, EXPIRIES, venue.value)
+    for instrument in instruments:
+        engine.add_instrument(instrument)
+
+    # BAR DATA: LOAD FROM CSV (IN PARALLEL) + MERGE + ADD TO ENGINE
+    # Step 1: Load bars of all contracts
+    loading_start = time.perf_counter()
+    csv_paths = {instrument.id: DEMO_CSV_PATH for instrument in instruments}
+    bars_by_instrument = load_curve_bars(instruments, csv_paths)
+    # Step 2: Merge all contracts into one time-ordered feed
+    # Bars of each contract are already sorted, so sorting the concatenation is cheap.
+    # This is done once here, instead of re-sorting whole engine data after each `add_data()` call.
+    all_bars = sorted(itertools.chain(*bars_by_instrument.values()), key=attrgetter("ts_init"))
+    # Step 3: Add bars to engine (already sorted)
+    engine.add_data(all_bars, sort=False)
+    loading_secs = time.perf_counter() - loading_start
+
+    # Strategies: one instance per instrument
+    strategies: dict[InstrumentId, MeasuredMACrossStrategy] = {}
+    for i, instrument in enumerate(instruments):
+        strategy_config = MACrossStrategyConfig(
+            instrument=instrument,
+            primary_bar_type=BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL"),
+            trade_size=Decimal(1),
+            ma_type=MovingAverageType.SIMPLE,
+            ma_fast_period=20,
+            ma_slow_period=50,
+            profit_in_ticks=20,
+            stoploss_in_ticks=20,
+            order_id_tag=f"{i:03d}",  # each instance of the same strategy needs unique tag
+        )
+        strategies[instrument.id] = MeasuredMACrossStrategy(strategy_config)
+    engine.add_strategies(list(strategies.values()))
+
+    # Run engine = Run backtest
+    run_start = time.perf_counter()
+    engine.run(end="2024-01-03")
+    run_secs = time.perf_counter() - run_start
+
+    # THROUGHPUT METRICS
+    # Per instrument
+    rows = []
+    for instrument_id, strategy in strategies.items():
+        on_bar_secs = strategy.on_bar_time_ns / 1e9
+        on_bar_per_sec = strategy.bars_processed / on_bar_secs if on_bar_secs else 0.0
+        rows.append(
+            {
+                "instrument": instrument_id.value,
+                "bars": strategy.bars_processed,
+                "orders": engine.cache.orders_total_count(instrument_id=instrument_id),
+                "on_bar_secs": round(on_bar_secs, 3),
+                "on_bar_per_sec": round(on_bar_per_sec),
+            }
+        )
+    with pd.option_context("display.max_rows", None, "display.width", None):
+        print(pd.DataFrame(rows).set_index("instrument"))
+
+    # Total
+    total_bars = sum(strategy.bars_processed for strategy in strategies.values())
+    print(f"\nInstruments: {len(instruments)}")
+    if set(csv_paths.values()) == {DEMO_CSV_PATH}:
+        print("Note: all instruments use 6EH4 stand-in data -> identical prices + results")
+    print(f"Loading + merging bars: {loading_secs:.2f} secs ({len(all_bars):_} bars)")
+    print(f"Backtest run: {run_secs:.2f} secs ({total_bars / run_secs:_.0f} bars/sec)")
+
+    # Cleanup resources
+    engine.dispose()
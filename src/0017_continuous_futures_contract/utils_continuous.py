@@ -0,0 +1,130 @@
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import utils_csv
+from utils_instruments import get_contract_month_code, third_friday_of_month
+
+
+# CME FX futures are listed in quarterly cycle: March, June, September, December
+QUARTERLY_MONTHS = (3, 6, 9, 12)
+
+
+def roll_schedule(
+    base_symbol: str,
+    first_expiry: tuple[int, int],
+    last_expiry: tuple[int, int],
+    roll_bdays_before_expiry: int = 5,
+    months: tuple[int, ...] = QUARTERLY_MONTHS,
+) -> pd.DataFrame:
+    # Precomputed schedule = one row per contract:
+    #   - `raw_symbol` - contract symbol, like "6EH4"
+    #   - `expiry`     - expiration date (3rd Friday of the month)
+    #   - `roll_date`  - from this moment the next contract is used
+    # Contract is active in interval: <roll date of previous contract, its own roll date)
+    rows = []
+    for year in range(first_expiry[0], last_expiry[0] + 1):
+        for month in months:
+            if not (first_expiry <= (year, month) <= last_expiry):
+                continue
+            expiry = pd.Timestamp(third_friday_of_month(year, month))
+            rows.append(
+                {
+                    "raw_symbol": f"{base_symbol}{get_contract_month_code(month)}{year % 10}",
+                    "expiry": expiry,
+                    "roll_date": expiry - pd.offsets.BDay(roll_bdays_before_expiry),
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def build_continuous_df(
+    schedule: pd.DataFrame,
+    contract_dfs: dict[str, pd.DataFrame],
+    back_adjust: bool = True,
+) -> pd.DataFrame:
+    # Only contracts with available data are used
+    schedule = schedule[schedule["raw_symbol"].isin(contract_dfs)].reset_index(drop=True)
+
+    # Step 1: Put bars of all contracts into one DataFrame (`contract` = row in schedule)
+    all_df = pd.concat(
+        [contract_dfs[symbol].assign(contract=i) for i, symbol in enumerate(schedule["raw_symbol"])]
+    )
+    contracts = all_df["contract"].to_numpy()
+
+    # Step 2: Find active contract for each timestamp = count of roll dates <= timestamp
+    # This is a single vectorized lookup in sorted roll dates (no loop over bars).
+    # Last contract with data has no next contract to roll into -> it stays active after its
+    # roll date (till the end of its data), so bars after the last roll are not dropped.
+    roll_dates = schedule["roll_date"].to_numpy()
+    active_contracts = np.searchsorted(roll_dates, all_df.index.to_numpy(), side="right")
+    active_contracts = np.minimum(active_contracts, len(schedule) - 1)
+
+    # Step 3: Stitch = keep only bars of active contract
+    continuous_df = all_df[contracts == active_contracts].sort_index().copy()
+
+    # Step 4 (optional): Back-adjust prices, so there are no artificial price jumps at rolls
+    # Older contracts are shifted by sum of all price gaps at later rolls.
+    if back_adjust:
+        gaps = np.zeros(len(schedule))
+        for i in range(len(schedule) - 1):  # loop over rolls only (a few per year)
+            gaps[i] = _roll_gap(all_df, i, schedule["roll_date"].iloc[i])
+        adjustments = gaps[::-1].cumsum()[::-1]  # sum of gaps at this and all later rolls
+        shift = adjustments[continuous_df["contract"].to_numpy()]
+        for column in ["open", "high", "low", "close"]:
+            continuous_df[column] = continuous_df[column] + shift
+
+    continuous_df["raw_symbol"] = schedule["raw_symbol"].to_numpy()[
+        continuous_df["contract"].to_numpy()
+    ]
+    return continuous_df.drop(columns=["contract"])
+
+
+def load_continuous_df(
+    schedule: pd.DataFrame,
+    contract_csv_paths: dict[str, str],
+    back_adjust: bool = True,
+    cache_dir: str = "continuous_cache",
+) -> pd.DataFrame:
+    # Continuous series is built only once and then cached as parquet file.
+    # Cache key is built from the schedule, content of data files, adjustment and the code,
+    # which loads + stitches the data (content-addressed, the same way as results cache of
+    # example 0015) -> any change of this module or `utils_csv` builds the series again.
+    hasher = hashlib.sha256()
+    for module_path in [__file__, utils_csv.__file__]:
+        hasher.update(Path(module_path).read_bytes())
+    hasher.update(schedule.to_json().encode())
+    for symbol, csv_path in sorted(contract_csv_paths.items()):
+        with open(csv_path, "rb") as f:
+            file_hash = hashlib.file_digest(f, "sha256").hexdigest()
+        hasher.update(f"{symbol}|{file_hash}".encode())
+    hasher.update(str(back_adjust).encode())
+    cache_path = Path(cache_dir) / f"{hasher.hexdigest()}.parquet"
+
+    if cache_path.exists():
+        return pd.read_parquet(cache_path)
+
+    contract_dfs = {
+        symbol: utils_csv.load_df_from_ninjatrader_csv(csv_path)
+        for symbol, csv_path in contract_csv_paths.items()
+    }
+    continuous_df = build_continuous_df(schedule, contract_dfs, back_adjust)
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    continuous_df.to_parquet(cache_path)
+    return continuous_df
+
+
+def _roll_gap(all_df: pd.DataFrame, contract: int, roll_date: pd.Timestamp) -> float:
+    # Price difference (new - old contract) at the last timestamp before roll,
+    # where both contracts have a bar
+    before_roll = all_df[all_df.index < roll_date]
+    old_closes = before_roll.loc[before_roll["contract"] == contract, "close"]
+    new_closes = before_roll.loc[before_roll["contract"] == contract + 1, "close"]
+    common_timestamps = old_closes.index.intersection(new_closes.index)
+    if common_timestamps.empty:
+        return 0.0  # no overlapping data -> no adjustment is possible
+    timestamp = common_timestamps.max()
+    return new_closes.loc[timestamp] - old_closes.loc[timestamp]
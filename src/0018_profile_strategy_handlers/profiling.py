@@ -0,0 +1,128 @@
+import functools
+import time
+
+import pandas as pd
+
+
+# Handlers, which are profiled by default (only those, which exist on the class, are used)
+DEFAULT_PROFILED_HANDLERS = [
+    "on_bar",
+    "on_quote_tick",
+    "on_trade_tick",
+    "on_data",
+    "on_signal",
+    "on_event",
+    "on_timer",
+    "on_order_filled",
+    "on_position_opened",
+    "on_position_changed",
+    "on_position_closed",
+]
+
+
+class HandlerStats:
+    # Timing statistics of one handler.
+    # Latency histogram uses power-of-2 buckets: bucket `b` = latencies from 2^(b-1) to 2^b - 1 ns.
+    # It is just a list of counters, so recording one call is very cheap.
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.histogram = [0] * 64
+
+    def record(self, elapsed_ns: int):
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        self.histogram[elapsed_ns.bit_length()] += 1
+
+    def percentile_ns(self, percentile: float) -> int:
+        # Upper bound of histogram bucket, where the percentile falls into
+        required_count = self.count * percentile / 100
+        cumulative_count = 0
+        for bucket, bucket_count in enumerate(self.histogram):
+            cumulative_count += bucket_count
+            if cumulative_count >= required_count:
+                return min(2**bucket - 1, self.max_ns)
+        return self.max_ns
+
+
+class ProfilingMixin:
+    # Opt-in profiling of handlers for any Strategy / Actor.
+    #
+    # Usage:
+    #   class MyStrategy(ProfilingMixin, Strategy):
+    #       def __init__(self, config):
+    #           super().__init__(config)
+    #           if config.profiling:
+    #               self.enable_profiling()  # or: self.enable_profiling(["on_bar", "my_handler"])
+    #
+    # How it works:
+    #   `enable_profiling()` replaces handlers of this one instance by timed wrappers.
+    #   When profiling is not enabled, nothing is replaced -> there is zero overhead.
+    #   Summary is written to log, when strategy / actor is stopped (after its `on_stop`).
+    #
+    # Note: Enable profiling before the strategy / actor is started, because timers and
+    # subscriptions created in `on_start` keep reference to the handler, which existed at that time.
+
+    def enable_profiling(self, handlers: list[str] = DEFAULT_PROFILED_HANDLERS):
+        self.handler_stats: dict[str, HandlerStats] = {}
+        for name in handlers:
+            if hasattr(self, name):
+                self._wrap_handler(name)
+
+        # Summary is logged right after original `on_stop`
+        on_stop = self.on_stop
+
+        @functools.wraps(on_stop)
+        def on_stop_with_summary():
+            on_stop()
+            self.log_profiling_summary()
+
+        self.on_stop = on_stop_with_summary
+
+    def _wrap_handler(self, name: str):
+        handler = getattr(self, name)
+        stats = self.handler_stats[name] = HandlerStats()
+        perf_counter_ns = time.perf_counter_ns  # local variable = faster lookup
+
+        @functools.wraps(handler)
+        def timed_handler(*args, **kwargs):
+            start_ns = perf_counter_ns()
+            try:
+                return handler(*args, **kwargs)
+            finally:
+                stats.record(perf_counter_ns() - start_ns)
+
+        # Instance attribute has priority over method of class.
+        # Nautilus calls handlers as `self.on_bar(bar)`, so it will call the timed wrapper.
+        setattr(self, name, timed_handler)
+
+    def profiling_summary(self) -> pd.DataFrame:
+        rows = []
+        for name, stats in getattr(self, "handler_stats", {}).items():
+            if stats.count == 0:
+                continue
+            rows.append(
+                {
+                    "handler": name,
+                    "calls": stats.count,
+                    "total_ms": round(stats.total_ns / 1e6, 3),
+                    "mean_us": round(stats.total_ns / stats.count / 1e3, 3),
+                    "p50_us": round(stats.percentile_ns(50) / 1e3, 3),
+                    "p99_us": round(stats.percentile_ns(99) / 1e3, 3),
+                    "max_us": round(stats.max_ns / 1e3, 3),
+                }
+            )
+        if not rows:
+            return pd.DataFrame()
+        return pd.DataFrame(rows).set_index("handler").sort_values("total_ms", ascending=False)
+
+    def log_profiling_summary(self):
+        summary = self.profiling_summary()
+        if summary.empty:
+            self.log.info("Profiling summary: no profiled handler was called")
+            return
+        with pd.option_context("display.width", None, "display.max_columns", None):
+            self.log.info(f"Profiling summary (p50/p99 = upper bound of bucket):\n{summary}")
@@ -0,0 +1,115 @@
+import time
+
+import pandas as pd
+from nautilus_trader.backtest.engine import BacktestEngine, Decimal
+from nautilus_trader.backtest.models import PerContractFeeModel
+from nautilus_trader.config import BacktestEngineConfig, LoggingConfig
+from nautilus_trader.model import TraderId
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Money
+
+import utils_csv
+import utils_instruments
+from actor_and_data import BarCountDataActor
+from strategy import DemoStrategy, DemoStrategyConfig
+
+
+def run_backtest(
+    instrument: Instrument, bar_type: BarType, bars: list[Bar], profiling: bool
+) -> tuple[float, pd.DataFrame, pd.DataFrame]:
+    # Engine: configure + create
+    engine_config = BacktestEngineConfig(
+        trader_id=TraderId("BACKTEST_TRADER-001"),
+        logging=LoggingConfig(log_level="INFO"),
+    )
+    engine = BacktestEngine(config=engine_config)
+
+    # Venue: create + add to engine
+    #   - Note: Venue must be added first -> before Instrument
+    venue: Venue = Venue("GLBX")
+    engine.add_venue(
+        venue=venue,
+        oms_type=OmsType.NETTING,  # Order Management System type
+        account_type=AccountType.MARGIN,  # Type of trading account
+        starting_balances=[Money(1_000_000, USD)],  # Initial balance
+        fee_model=PerContractFeeModel(commission=Money(2.50, USD)),
+        base_currency=USD,  # Base currency for the venue
+        default_leverage=Decimal(1),
+    )
+
+    # Instrument + bars: add to engine
+    engine.add_instrument(instrument)
+    engine.add_data(bars)
+
+    # Strategy: Configure -> create -> add to engine
+    strategy_config = DemoStrategyConfig(
+        instrument=instrument, primary_bar_type=bar_type, profiling=profiling
+    )
+    strategy = DemoStrategy(strategy_config)
+    engine.add_strategy(strategy)
+
+    # Actor: Create -> (optionally enable profiling) -> add to engine
+    market_data_actor = BarCountDataActor(bar_type=bar_type)
+    if profiling:
+        market_data_actor.enable_profiling()  # default handlers (on_bar, on_signal, ...)
+    engine.add_actor(market_data_actor)
+
+    # Run engine = Run backtest
+    start = time.perf_counter()
+    engine.run()
+    run_secs = time.perf_counter() - start
+
+    # Profiling summaries are also logged at `on_stop`, here we get them as DataFrames
+    strategy_summary = strategy.profiling_summary()
+    actor_summary = market_data_actor.profiling_summary()
+
+    # Cleanup resources
+    engine.dispose()
+
+    return run_secs, strategy_summary, actor_summary
+
+
+if __name__ == "__main__":
+    # Instrument
+    eurusd_future_instrument = utils_instruments.eurusd_future(2024, 3, "GLBX")
+
+    # BAR DATA: LOAD FROM CSV
+    # Step 1: Define bar type
+    eurusd_future_1min_bar_type = BarType.from_str(
+        f"{eurusd_future_instrument.id}-1-MINUTE-LAST-EXTERNAL"
+    )
+    # Step 2: Load bar data from CSV file
+    eurusd_futures_1min_bars_list: list[Bar] = utils_csv.load_bars_from_ninjatrader_csv(
+        csv_path=r"../!market_data/cme/futures/fx/6EH4.GLBX_1min_bars_20240101_20240131.csv",
+        instrument=eurusd_future_instrument,
+        bar_type=eurusd_future_1min_bar_type,
+    )
+
+    # Run the same backtest without and with profiling (to see overhead of profiling)
+    results = {
+        profiling: run_backtest(
+            eurusd_future_instrument,
+            eurusd_future_1min_bar_type,
+            eurusd_futures_1min_bars_list,
+            profiling=profiling,
+        )
+        for profiling in [False, True]
+    }
+
+    run_secs_disabled = results[False][0]
+    run_secs_enabled, strategy_summary, actor_summary = results[True]
+
+    with pd.option_context("display.width", None, "display.max_columns", None):
+        n_dashes = 50
+        print(f"\n{'-' * n_dashes}\nProfiling summary: DemoStrategy\n{'-' * n_dashes}")
+        print(strategy_summary)
+
+        print(f"\n{'-' * n_dashes}\nProfiling summary: BarCountDataActor\n{'-' * n_dashes}")
+        print(actor_summary)
+
+    print(f"\nBacktest run without profiling: {run_secs_disabled:.2f} secs")
+    print(f"Backtest run with profiling:    {run_secs_enabled:.2f} secs")
@@ -0,0 +1,62 @@
+import pandas as pd
+from nautilus_trader.common.component import TimeEvent
+from nautilus_trader.config import StrategyConfig
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.trading.strategy import Strategy
+
+from profiling import ProfilingMixin
+
+
+class DemoStrategyConfig(StrategyConfig, frozen=True):
+    instrument: Instrument
+    primary_bar_type: BarType
+    profiling: bool = False  # opt-in: measure time spent in handlers
+
+
+# ProfilingMixin must be listed before Strategy
+class DemoStrategy(ProfilingMixin, Strategy):
+    def __init__(self, config: DemoStrategyConfig):
+        super().__init__(config)
+        # Count processed bars
+        self.bars_1min_processed = 0
+
+        # Profile standard handlers + our custom handler
+        if config.profiling:
+            self.enable_profiling(["on_bar", "on_signal", "on_timer", "on_each_10th_bar"])
+
+    def on_start(self):
+        # Subscribe to bars
+        self.subscribe_bars(self.config.primary_bar_type)
+
+        # Subscribe to signal
+        self.subscribe_signal("signal_count_bars")
+
+        # Recurring timer
+        self.clock.set_timer(
+            name="every_hour",
+            interval=pd.Timedelta(hours=1),
+            callback=self.on_timer,
+        )
+
+    def on_bar(self, bar: Bar):
+        self.bars_1min_processed += 1  # Just count 1-min bars
+
+        if self.bars_1min_processed % 10 == 0:
+            self.on_each_10th_bar(bar)
+
+    def on_each_10th_bar(self, bar: Bar):
+        # Deliberately slow code: builds DataFrame from all cached bars each time
+        # -> profiling summary should show it on the top
+        bars = self.cache.bars(self.config.primary_bar_type)
+        closes = pd.Series([b.close.as_double() for b in bars])
+        self.log.debug(f"Average close of {len(closes)} cached bars: {closes.mean()}")
+
+    def on_signal(self, signal):
+        self.log.debug(f"Signal value: {signal.value}, Signal timestamp: {signal.ts_event}")
+
+    def on_timer(self, event: TimeEvent):
+        self.log.debug(f"Event from timer arrived: {event}")
+
+    def on_stop(self):
+        self.log.info(f"Total 1-min bars processed: {self.bars_1min_processed}")
@@ -0,0 +1,131 @@
+import time
+
+from nautilus_trader.backtest.engine import BacktestEngine, Decimal
+from nautilus_trader.backtest.models import PerContractFeeModel
+from nautilus_trader.config import BacktestEngineConfig, LoggingConfig
+from nautilus_trader.model import TraderId
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Money
+
+import utils_csv
+import utils_instruments
+from strategy import DemoStrategy, DemoStrategyConfig
+
+
+def run_backtest(
+    instrument: Instrument,
+    bar_type: BarType,
+    bars: list[Bar],
+    use_bundle: bool,
+    log_level: str,
+    timeframes: tuple[int, ...] = (1, 5, 15, 60),
+) -> tuple[float, DemoStrategy]:
+    # Engine: configure + create
+    engine_config = BacktestEngineConfig(
+        trader_id=TraderId("BACKTEST_TRADER-001"),
+        logging=LoggingConfig(log_level=log_level),
+    )
+    engine = BacktestEngine(config=engine_config)
+
+    # Venue: create + add to engine
+    #   - Note: Venue must be added first -> before Instrument
+    venue: Venue = Venue("GLBX")
+    engine.add_venue(
+        venue=venue,
+        oms_type=OmsType.NETTING,  # Order Management System type
+        account_type=AccountType.MARGIN,  # Type of trading account
+        starting_balances=[Money(1_000_000, USD)],  # Initial balance
+        fee_model=PerContractFeeModel(commission=Money(2.50, USD)),
+        base_currency=USD,  # Base currency for the venue
+        default_leverage=Decimal(1),
+    )
+
+    # Instrument + bars: add to engine
+    engine.add_instrument(instrument)
+    engine.add_data(bars)
+
+    # Strategy: Configure -> create -> add to engine
+    strategy_config = DemoStrategyConfig(
+        instrument=instrument,
+        primary_bar_type=bar_type,
+        timeframes=timeframes,
+        use_bundle=use_bundle,
+    )
+    strategy = DemoStrategy(strategy_config)
+    engine.add_strategy(strategy)
+
+    # Run engine = Run backtest
+    start = time.perf_counter()
+    engine.run()
+    run_secs = time.perf_counter() - start
+
+    # Cleanup resources
+    engine.dispose()
+
+    return run_secs, strategy
+
+
+if __name__ == "__main__":
+    # Instrument
+    eurusd_future_instrument = utils_instruments.eurusd_future(2024, 3, "GLBX")
+
+    # BAR DATA: LOAD FROM CSV
+    # Step 1: Define bar type
+    eurusd_future_1min_bar_type = BarType.from_str(
+        f"{eurusd_future_instrument.id}-1-MINUTE-LAST-EXTERNAL"
+    )
+    # Step 2: Load bar data from CSV file
+    eurusd_futures_1min_bars_list: list[Bar] = utils_csv.load_bars_from_ninjatrader_csv(
+        csv_path=r"../!market_data/cme/futures/fx/6EH4.GLBX_1min_bars_20240101_20240131.csv",
+        instrument=eurusd_future_instrument,
+        bar_type=eurusd_future_1min_bar_type,
+    )
+
+    # Backtest with indicators on 1/5/15/60-min bars from the bundle (see hourly overview in log)
+    run_backtest(
+        eurusd_future_instrument,
+        eurusd_future_1min_bar_type,
+        eurusd_futures_1min_bars_list,
+        use_bundle=True,
+        log_level="INFO",
+    )
+
+    # Comparison with Nautilus aggregation of each timeframe (without logging, to compare speed)
+    # Both ways must produce identical indicator values at each closed bar of each timeframe.
+    results = {
+        use_bundle: run_backtest(
+            eurusd_future_instrument,
+            eurusd_future_1min_bar_type,
+            eurusd_futures_1min_bars_list,
+            use_bundle=use_bundle,
+            log_level="ERROR",
+        )
+        for use_bundle in [False, True]
+    }
+    secs_nautilus, strategy_nautilus = results[False]
+    secs_bundle, strategy_bundle = results[True]
+
+    assert strategy_nautilus.indicator_values == strategy_bundle.indicator_values, (
+        "Bundle and Nautilus aggregation produced different indicator values"
+    )
+    # Baseline: indicators only on 1-min bars
+    secs_1min_only, _ = run_backtest(
+        eurusd_future_instrument,
+        eurusd_future_1min_bar_type,
+        eurusd_futures_1min_bars_list,
+        use_bundle=True,
+        log_level="ERROR",
+        timeframes=(1,),
+    )
+
+    print(
+        f"\nOK: identical values of {len(strategy_bundle.indicator_values)} indicator updates "
+        f"on 1/5/15/60-min bars"
+    )
+    print(f"Backtest with Nautilus aggregation per timeframe: {secs_nautilus:.2f} secs")
+    print(f"Backtest with multi-timeframe bundle:             {secs_bundle:.2f} secs")
+    print(f"Backtest with 1-min indicators only (baseline):   {secs_1min_only:.2f} secs")
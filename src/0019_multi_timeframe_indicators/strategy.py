@@ -0,0 +1,104 @@
+from nautilus_trader.config import StrategyConfig
+from nautilus_trader.indicators.atr import AverageTrueRange
+from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
+from nautilus_trader.indicators.base.indicator import Indicator
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.trading.strategy import Strategy
+
+from utils_multi_timeframe import MultiTimeframeIndicators
+
+
+# The same indicator family is calculated on each timeframe (name -> factory of new instance)
+INDICATORS = {
+    "ema10": lambda: ExponentialMovingAverage(10),
+    "atr14": lambda: AverageTrueRange(14),
+}
+
+
+class DemoStrategyConfig(StrategyConfig, frozen=True):
+    instrument: Instrument
+    primary_bar_type: BarType  # 1-min bars, all other timeframes are derived from them
+    timeframes: tuple[int, ...] = (1, 5, 15, 60)  # minutes
+    # True  = all timeframes from one `MultiTimeframeIndicators` bundle (only 1-min bars subscribed)
+    # False = Nautilus aggregates each timeframe (`X-MINUTE-LAST-INTERNAL@1-MINUTE-EXTERNAL`)
+    use_bundle: bool = True
+
+
+class DemoStrategy(Strategy):
+    def __init__(self, config: DemoStrategyConfig):
+        super().__init__(config)
+        self.bars_1min_processed = 0
+        # Values of all indicators at each closed bar: (minutes, ts_event, name) -> value
+        self.indicator_values: dict[tuple[int, int, str], float] = {}
+
+        if config.use_bundle:
+            self.bundle = MultiTimeframeIndicators(
+                instrument=config.instrument,
+                base_bar_type=config.primary_bar_type,
+                timeframes=list(config.timeframes),
+                indicators=INDICATORS,
+                on_bar_closed=self.on_timeframe_bar,  # called for each closed bar of each timeframe
+            )
+        else:
+            # One bar type + own indicators for each timeframe
+            self.bar_types: dict[int, BarType] = {}
+            self.indicators: dict[int, dict[str, Indicator]] = {}
+            for minutes in config.timeframes:
+                if minutes == config.primary_bar_type.spec.step:
+                    bar_type = config.primary_bar_type
+                else:
+                    bar_type = BarType.from_str(
+                        f"{config.instrument.id}-{minutes}-MINUTE-LAST-INTERNAL@1-MINUTE-EXTERNAL"
+                    )
+                self.bar_types[minutes] = bar_type
+                self.indicators[minutes] = {name: create() for name, create in INDICATORS.items()}
+            # Bar types of received bars are standard ones (without `@1-MINUTE-EXTERNAL`)
+            self.minutes_by_bar_type = {
+                bar_type.standard(): minutes for minutes, bar_type in self.bar_types.items()
+            }
+
+    def on_start(self):
+        if self.config.use_bundle:
+            # Only 1-min bars, bundle derives all other timeframes
+            self.register_indicator_for_bars(self.config.primary_bar_type, self.bundle)
+            self.subscribe_bars(self.config.primary_bar_type)
+        else:
+            for minutes, bar_type in self.bar_types.items():
+                for indicator in self.indicators[minutes].values():
+                    self.register_indicator_for_bars(bar_type.standard(), indicator)
+                self.subscribe_bars(bar_type)
+
+    def indicator(self, minutes: int, name: str) -> Indicator:
+        if self.config.use_bundle:
+            return self.bundle.indicator(minutes, name)
+        return self.indicators[minutes][name]
+
+    def on_bar(self, bar: Bar):
+        if self.config.use_bundle:
+            # Only 1-min bars are received, bundle calls `on_timeframe_bar` for all timeframes
+            self.bars_1min_processed += 1
+            return
+
+        minutes = self.minutes_by_bar_type[bar.bar_type]
+        if minutes == self.config.primary_bar_type.spec.step:
+            self.bars_1min_processed += 1
+        self.on_timeframe_bar(minutes, bar)
+
+    def on_timeframe_bar(self, minutes: int, bar: Bar):
+        # Called once for each closed bar of each timeframe (indicators are already updated)
+        for name in INDICATORS:
+            indicator = self.indicator(minutes, name)
+            if indicator.initialized:
+                self.indicator_values[(minutes, bar.ts_event, name)] = indicator.value
+
+        # Example of multi-timeframe logic: print overview at each hourly bar
+        if minutes == max(self.config.timeframes):
+            values = " | ".join(
+                f"{m}-min EMA(10): {self.indicator(m, 'ema10').value:.5f}"
+                for m in self.config.timeframes
+            )
+            self.log.info(f"Hourly bar closed | {values}")
+
+    def on_stop(self):
+        self.log.info(f"Total 1-min bars processed: {self.bars_1min_processed}")
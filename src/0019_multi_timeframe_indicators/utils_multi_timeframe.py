@@ -0,0 +1,251 @@
+from typing import Callable
+
+from nautilus_trader.indicators.base.indicator import Indicator
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Price, Quantity
+
+
+NANOS_IN_MINUTE = 60_000_000_000
+
+
+class TimeframeLevel:
+    # Bars of one timeframe, built from bars of the previous (smaller) timeframe + its indicators.
+    #
+    # Bars are built the same way as Nautilus time bars (`X-MINUTE-LAST-INTERNAL@1-MINUTE-EXTERNAL`):
+    #   - bar closes at interval end (e.g. 10:05), bar at 10:05 belongs to interval (10:00, 10:05]
+    #   - interval without any data gives flat bar (OHLC = last close, volume = 0)
+    # Prices + volumes are aggregated as raw integers (no Price / Quantity objects until bar closes).
+
+    def __init__(
+        self,
+        bar_type: BarType,
+        minutes: int,
+        indicators: dict[str, Indicator],
+        price_precision: int,
+        size_precision: int,
+        on_bar_closed: Callable[[int, Bar], None] | None,
+    ):
+        self.bar_type = bar_type
+        self.minutes = minutes
+        self.step_ns = minutes * NANOS_IN_MINUTE
+        self.indicators = indicators
+        self.price_precision = price_precision
+        self.size_precision = size_precision
+        self.parent: TimeframeLevel | None = None  # next bigger timeframe, built from our bars
+        self.on_bar_closed = on_bar_closed
+        self.reset()
+
+    def reset(self):
+        # Builder state (no bar built yet) + indicators of this timeframe
+        self.last_bar: Bar | None = None
+        self.end_ns: int | None = None  # end of currently built bar
+        self.has_updates = False
+        self.open_raw = self.high_raw = self.low_raw = self.close_raw = self.volume_raw = 0
+        self.last_close_raw: int | None = None
+        for indicator in self.indicators.values():
+            indicator.reset()
+
+    def handle(
+        self,
+        ts_event: int,
+        open_raw: int,
+        high_raw: int,
+        low_raw: int,
+        close_raw: int,
+        volume_raw: int,
+        has_updates: bool,
+    ):
+        self.close_intervals_before(ts_event)
+
+        if has_updates:
+            if not self.has_updates:
+                # First data in interval
+                self.open_raw, self.high_raw, self.low_raw = open_raw, high_raw, low_raw
+                self.volume_raw = volume_raw
+                self.has_updates = True
+            else:
+                if high_raw > self.high_raw:
+                    self.high_raw = high_raw
+                if low_raw < self.low_raw:
+                    self.low_raw = low_raw
+                self.volume_raw += volume_raw
+            self.close_raw = close_raw
+
+        # Input bar at interval end = last bar of interval
+        if ts_event == self.end_ns:
+            self._close_bar()
+
+    def close_intervals_before(self, ts_event: int):
+        # Input bar belongs to interval ending at the nearest multiple of step (including itself)
+        end_ns = -(-ts_event // self.step_ns) * self.step_ns
+        if self.end_ns is None:
+            self.end_ns = end_ns
+
+        # Close all intervals before input bar (intervals without any data)
+        while self.end_ns < end_ns:
+            self._close_bar()
+
+    def _close_bar(self):
+        ts = self.end_ns
+        self.end_ns += self.step_ns
+        has_updates = self.has_updates
+        if has_updates:
+            self.last_close_raw = self.close_raw
+            self.has_updates = False
+        elif self.last_close_raw is None:
+            return  # no data yet at all -> no bar (the same as Nautilus)
+        else:
+            # Flat bar for interval without data
+            self.open_raw = self.high_raw = self.low_raw = self.close_raw = self.last_close_raw
+            self.volume_raw = 0
+
+        precision = self.price_precision
+        self.last_bar = Bar(
+            bar_type=self.bar_type,
+            open=Price.from_raw(self.open_raw, precision),
+            high=Price.from_raw(self.high_raw, precision),
+            low=Price.from_raw(self.low_raw, precision),
+            close=Price.from_raw(self.close_raw, precision),
+            volume=Quantity.from_raw(self.volume_raw, self.size_precision),
+            ts_event=ts,
+            ts_init=ts,
+        )
+        # Indicators of this timeframe are updated only here = only when its bar is closed
+        for indicator in self.indicators.values():
+            indicator.handle_bar(self.last_bar)
+        if self.on_bar_closed is not None:
+            self.on_bar_closed(self.minutes, self.last_bar)
+
+        # Closed bar is input for next bigger timeframe (which shares all aggregation done so far)
+        if self.parent is not None:
+            self.parent.handle(
+                ts,
+                self.open_raw,
+                self.high_raw,
+                self.low_raw,
+                self.close_raw,
+                self.volume_raw,
+                has_updates,
+            )
+
+
+class MultiTimeframeIndicators(Indicator):
+    # The same family of indicators calculated on many timeframes, all derived from single bar stream.
+    #
+    # Usage:
+    #   bundle = MultiTimeframeIndicators(
+    #       instrument=instrument,
+    #       base_bar_type=bar_type_1min,
+    #       timeframes=[1, 5, 15, 60],  # minutes, each one must be multiple of the previous one
+    #       indicators={"ema10": lambda: ExponentialMovingAverage(10)},  # factory -> new instance
+    #   )
+    #   self.register_indicator_for_bars(bar_type_1min, bundle)  # only 1-min bars are subscribed
+    #
+    #   bundle.indicator(15, "ema10").value  # read value of EMA(10) on 15-min bars
+    #
+    # Optional `on_bar_closed(minutes, bar)` callback is called for each closed bar of each timeframe,
+    # right after indicators of that timeframe were updated (in the same order as Nautilus would
+    # publish these bars). Note: One 1-min bar can close more bars (e.g. 5, 15 + 60-min bar,
+    # or more bars of the same timeframe after gap in data) - callback is called for each of them.
+    #
+    # Compared to subscribing `X-MINUTE-LAST-INTERNAL@1-MINUTE-EXTERNAL` for each timeframe:
+    #   - bigger timeframe is built from closed bars of previous timeframe (15-min from 5-min bars, ...)
+    #     -> aggregation work is shared, only the smallest timeframe processes every 1-min bar
+    #   - no aggregator + timer per timeframe in Nautilus, no extra bar subscriptions
+    #   - indicators of each timeframe are updated only when its own bar is closed
+
+    def __init__(
+        self,
+        instrument: Instrument,
+        base_bar_type: BarType,
+        timeframes: list[int],
+        indicators: dict[str, Callable[[], Indicator]],
+        on_bar_closed: Callable[[int, Bar], None] | None = None,
+    ):
+        super().__init__([])
+        base_minutes = base_bar_type.spec.step
+        timeframes = sorted(timeframes)
+        if timeframes[0] != base_minutes:
+            raise ValueError(f"First timeframe must be the base one ({base_minutes}-min)")
+        for smaller, bigger in zip(timeframes[:-1], timeframes[1:]):
+            if bigger % smaller != 0:
+                raise ValueError(f"Timeframe {bigger} is not multiple of timeframe {smaller}")
+
+        self.base_bar_type = base_bar_type
+        self.on_bar_closed = on_bar_closed
+
+        # Base timeframe: indicators are updated directly by incoming bars
+        self._base_indicators = {name: create() for name, create in indicators.items()}
+        self._last_base_bar: Bar | None = None
+
+        # Bigger timeframes: chain of levels, each fed by closed bars of previous one
+        self._levels: dict[int, TimeframeLevel] = {}
+        previous = None
+        for minutes in timeframes[1:]:
+            level = TimeframeLevel(
+                bar_type=BarType.from_str(f"{instrument.id}-{minutes}-MINUTE-LAST-INTERNAL"),
+                minutes=minutes,
+                indicators={name: create() for name, create in indicators.items()},
+                price_precision=instrument.price_precision,
+                size_precision=instrument.size_precision,
+                on_bar_closed=on_bar_closed,
+            )
+            if previous is not None:
+                previous.parent = level
+            self._levels[minutes] = previous = level
+        self._first_level = self._levels[timeframes[1]] if len(timeframes) > 1 else None
+        self.timeframes = timeframes
+
+    def indicator(self, minutes: int, name: str) -> Indicator:
+        if minutes == self.timeframes[0]:
+            return self._base_indicators[name]
+        return self._levels[minutes].indicators[name]
+
+    def last_bar(self, minutes: int) -> Bar | None:
+        if minutes == self.timeframes[0]:
+            return self._last_base_bar
+        return self._levels[minutes].last_bar
+
+    def handle_bar(self, bar: Bar):
+        # Step 1: Bars of intervals without data, which ended before this bar (after gap in data)
+        if self._first_level is not None:
+            self._first_level.close_intervals_before(bar.ts_event)
+
+        # Step 2: Base timeframe
+        self._last_base_bar = bar
+        for indicator in self._base_indicators.values():
+            indicator.handle_bar(bar)
+        if self.on_bar_closed is not None:
+            self.on_bar_closed(self.timeframes[0], bar)
+
+        # Step 3: Bigger timeframes (bars ending with this bar are closed)
+        if self._first_level is not None:
+            self._first_level.handle(
+                bar.ts_event,
+                bar.open.raw,
+                bar.high.raw,
+                bar.low.raw,
+                bar.close.raw,
+                bar.volume.raw,
+                True,
+            )
+
+        self._set_has_inputs(True)
+        if not self.initialized:
+            self._set_initialized(
+                all(indicator.initialized for indicator in self._base_indicators.values())
+                and all(
+                    indicator.initialized
+                    for level in self._levels.values()
+                    for indicator in level.indicators.values()
+                )
+            )
+
+    def _reset(self):
+        # Called by `reset()` -> all timeframes start from scratch (indicators + bar builders)
+        self._last_base_bar = None
+        for indicator in self._base_indicators.values():
+            indicator.reset()
+        for level in self._levels.values():
+            level.reset()
@@ -0,0 +1,253 @@
+import bisect
+import math
+from collections import deque
+
+from nautilus_trader.indicators.base.indicator import Indicator
+from nautilus_trader.model.data import Bar
+
+
+# Rolling statistics as Nautilus indicators.
+#
+# All of them:
+#   - are standard Nautilus indicators -> `self.register_indicator_for_bars(bar_type, indicator)`
+#     (bar close is used as input) or can be fed manually by `indicator.update_raw(value)`
+#   - are initialized, when they got `period` values
+#   - update their state incrementally with each new value (no recomputation of whole window),
+#     so cost per bar doesn't grow with the period (percentile: see note in `RollingPercentile`)
+
+
+class RollingMeanStd(Indicator):
+    # Rolling mean + (sample) standard deviation, updated by Welford's algorithm:
+    # new value is added into running mean / sum of squared deviations, the oldest one is removed.
+    # `value` = standard deviation (as in pandas `rolling(period).std()`, i.e. ddof=1)
+
+    def __init__(self, period: int):
+        if period < 2:
+            raise ValueError(f"Period must be at least 2, got {period}")
+        super().__init__(params=[period])
+        self.period = period
+        self._window: deque[float] = deque()
+        self._reset()
+
+    def handle_bar(self, bar: Bar):
+        self.update_raw(bar.close.as_double())
+
+    def update_raw(self, value: float):
+        window = self._window
+        if len(window) == self.period:
+            # Remove the oldest value
+            oldest = window.popleft()
+            count = len(window)
+            delta = oldest - self.mean
+            self.mean -= delta / count
+            self._m2 -= delta * (oldest - self.mean)
+
+        # Add the newest value
+        window.append(value)
+        delta = value - self.mean
+        self.mean += delta / len(window)
+        self._m2 += delta * (value - self.mean)
+        if self._m2 < 0.0:
+            self._m2 = 0.0  # tiny negative number from rounding errors
+
+        if len(window) > 1:
+            self.variance = self._m2 / (len(window) - 1)
+            self.value = math.sqrt(self.variance)
+
+        if not self.initialized:
+            self._set_has_inputs(True)
+            if len(window) == self.period:
+                self._set_initialized(True)
+
+    def _reset(self):
+        self._window.clear()
+        self.mean = 0.0
+        self._m2 = 0.0  # sum of squared deviations from mean
+        self.variance = 0.0
+        self.value = 0.0
+
+
+class RollingZScore(Indicator):
+    # How many standard deviations is the latest value from rolling mean: (value - mean) / std
+
+    def __init__(self, period: int):
+        super().__init__(params=[period])
+        self.period = period
+        self.mean_std = RollingMeanStd(period)
+        self.value = 0.0
+
+    def handle_bar(self, bar: Bar):
+        self.update_raw(bar.close.as_double())
+
+    def update_raw(self, value: float):
+        self.mean_std.update_raw(value)
+        std = self.mean_std.value
+        self.value = (value - self.mean_std.mean) / std if std > 0.0 else 0.0
+
+        self._set_has_inputs(True)
+        self._set_initialized(self.mean_std.initialized)
+
+    def _reset(self):
+        self.mean_std.reset()
+        self.value = 0.0
+
+
+class RollingMinMax(Indicator):
+    # Rolling min + max by monotonic deques: each deque keeps only values, which can still become
+    # min (max) of some future window. Every value is added + removed only once -> O(1) on average.
+    # `value` = range (max - min)
+
+    def __init__(self, period: int):
+        super().__init__(params=[period])
+        self.period = period
+        # (index, value), increasing values
+        self._min_candidates: deque[tuple[int, float]] = deque()
+        # (index, value), decreasing values
+        self._max_candidates: deque[tuple[int, float]] = deque()
+        self._reset()
+
+    def handle_bar(self, bar: Bar):
+        self.update_raw(bar.close.as_double())
+
+    def update_raw(self, value: float):
+        index = self._count
+        self._count += 1
+
+        min_candidates = self._min_candidates
+        while min_candidates and min_candidates[-1][1] >= value:
+            min_candidates.pop()
+        min_candidates.append((index, value))
+        if min_candidates[0][0] <= index - self.period:
+            min_candidates.popleft()
+
+        max_candidates = self._max_candidates
+        while max_candidates and max_candidates[-1][1] <= value:
+            max_candidates.pop()
+        max_candidates.append((index, value))
+        if max_candidates[0][0] <= index - self.period:
+            max_candidates.popleft()
+
+        self.min = min_candidates[0][1]
+        self.max = max_candidates[0][1]
+        self.value = self.max - self.min
+
+        if not self.initialized:
+            self._set_has_inputs(True)
+            if self._count >= self.period:
+                self._set_initialized(True)
+
+    def _reset(self):
+        self._min_candidates.clear()
+        self._max_candidates.clear()
+        self._count = 0
+        self.min = 0.0
+        self.max = 0.0
+        self.value = 0.0
+
+
+class RollingPercentile(Indicator):
+    # Rolling percentile (0-100) with linear interpolation (as pandas `rolling(period).quantile()`)
+    #
+    # Window is kept also as sorted list, where the oldest value is removed + the newest is inserted
+    # by binary search. Search is O(log n), shifting of list items is O(n), but it is single
+    # memory move in C -> for usual periods (up to thousands) it is faster than any tree in Python.
+
+    def __init__(self, period: int, percentile: float):
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentile must be from 0 to 100, got {percentile}")
+        super().__init__(params=[period, percentile])
+        self.period = period
+        self.percentile = percentile
+        self._window: deque[float] = deque()
+        self._sorted: list[float] = []
+        self._reset()
+
+    def handle_bar(self, bar: Bar):
+        self.update_raw(bar.close.as_double())
+
+    def update_raw(self, value: float):
+        window, ordered = self._window, self._sorted
+        if len(window) == self.period:
+            oldest = window.popleft()
+            del ordered[bisect.bisect_left(ordered, oldest)]
+        window.append(value)
+        bisect.insort(ordered, value)
+
+        # Linear interpolation between 2 nearest values
+        position = (len(ordered) - 1) * self.percentile / 100
+        lower = int(position)
+        fraction = position - lower
+        self.value = ordered[lower]
+        if fraction > 0.0:
+            self.value += (ordered[lower + 1] - ordered[lower]) * fraction
+
+        if not self.initialized:
+            self._set_has_inputs(True)
+            if len(window) == self.period:
+                self._set_initialized(True)
+
+    def _reset(self):
+        self._window.clear()
+        self._sorted.clear()
+        self.value = 0.0
+
+
+class RollingCorrelation(Indicator):
+    # Rolling Pearson correlation of 2 series (x, y), updated by Welford's algorithm
+    # for means, variances and co-variance (add the newest pair, remove the oldest pair).
+    #
+    # Fed by `update_raw(x, y)`, e.g. returns of 2 instruments.
+    # When registered for bars, correlation of bar close and bar volume is calculated.
+
+    def __init__(self, period: int):
+        if period < 2:
+            raise ValueError(f"Period must be at least 2, got {period}")
+        super().__init__(params=[period])
+        self.period = period
+        self._window: deque[tuple[float, float]] = deque()
+        self._reset()
+
+    def handle_bar(self, bar: Bar):
+        self.update_raw(bar.close.as_double(), bar.volume.as_double())
+
+    def update_raw(self, x: float, y: float):
+        window = self._window
+        if len(window) == self.period:
+            # Remove the oldest pair
+            oldest_x, oldest_y = window.popleft()
+            count = len(window)
+            delta_x = oldest_x - self._mean_x
+            delta_y = oldest_y - self._mean_y
+            self._mean_x -= delta_x / count
+            self._mean_y -= delta_y / count
+            self._m2_x -= delta_x * (oldest_x - self._mean_x)
+            self._m2_y -= delta_y * (oldest_y - self._mean_y)
+            self._co_moment -= delta_x * (oldest_y - self._mean_y)
+
+        # Add the newest pair
+        window.append((x, y))
+        count = len(window)
+        delta_x = x - self._mean_x
+        delta_y = y - self._mean_y
+        self._mean_x += delta_x / count
+        self._mean_y += delta_y / count
+        self._m2_x += delta_x * (x - self._mean_x)
+        self._m2_y += delta_y * (y - self._mean_y)
+        self._co_moment += delta_x * (y - self._mean_y)
+
+        denominator = self._m2_x * self._m2_y
+        self.value = self._co_moment / math.sqrt(denominator) if denominator > 0.0 else 0.0
+
+        if not self.initialized:
+            self._set_has_inputs(True)
+            if count == self.period:
+                self._set_initialized(True)
+
+    def _reset(self):
+        self._window.clear()
+        self._mean_x = 0.0
+        self._mean_y = 0.0
+        self._m2_x = 0.0  # sum of squared deviations of x
+        self._m2_y = 0.0  # sum of squared deviations of y
+        self._co_moment = 0.0  # sum of (x - mean_x) * (y - mean_y)
+        self.value = 0.0
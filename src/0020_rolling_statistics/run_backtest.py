@@ -0,0 +1,154 @@
+import timeit
+
+import pandas as pd
+from nautilus_trader.backtest.engine import BacktestEngine, Decimal
+from nautilus_trader.backtest.models import PerContractFeeModel
+from nautilus_trader.config import BacktestEngineConfig, LoggingConfig
+from nautilus_trader.model import TraderId
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+
+import utils_csv
+import utils_instruments
+from rolling_statistics import (
+    RollingCorrelation,
+    RollingMeanStd,
+    RollingMinMax,
+    RollingPercentile,
+    RollingZScore,
+)
+from strategy import DemoStrategy, DemoStrategyConfig
+
+
+def pandas_features(bars: list[Bar], period: int, percentile: float) -> pd.DataFrame:
+    # The same features computed by pandas over the whole history at once (reference values)
+    close = pd.Series([bar.close.as_double() for bar in bars])
+    volume = pd.Series([bar.volume.as_double() for bar in bars])
+    rolling = close.rolling(period)
+    features = pd.DataFrame(
+        {
+            "ts_event": [bar.ts_event for bar in bars],
+            "std": rolling.std(),
+            "zscore": (close - rolling.mean()) / rolling.std(),
+            "range": rolling.max() - rolling.min(),
+            "percentile": rolling.quantile(percentile / 100),
+            "correlation": close.rolling(period).corr(volume),
+        }
+    )
+    return features.dropna().reset_index(drop=True)
+
+
+def benchmark_per_bar(closes: list[float], volumes: list[float], period: int, percentile: float):
+    # Cost of features per one bar:
+    #   "incremental" = update all rolling indicators with new values
+    #   "pandas"      = recompute all features from last `period` values (as it is often done in `on_bar`)
+    indicators = [
+        RollingMeanStd(period),
+        RollingZScore(period),
+        RollingMinMax(period),
+        RollingPercentile(period, percentile),
+    ]
+    correlation = RollingCorrelation(period)
+
+    def incremental(close: float, volume: float):
+        for indicator in indicators:
+            indicator.update_raw(close)
+        correlation.update_raw(close, volume)
+
+    def recompute(window_close: pd.Series, window_volume: pd.Series):
+        std = window_close.std()
+        _ = (window_close.iloc[-1] - window_close.mean()) / std
+        _ = window_close.max() - window_close.min()
+        _ = window_close.quantile(percentile / 100)
+        _ = window_close.corr(window_volume)
+
+    count = len(closes) - period
+    incremental_secs = timeit.timeit(
+        lambda: [incremental(c, v) for c, v in zip(closes[period:], volumes[period:])], number=1
+    )
+    close_series, volume_series = pd.Series(closes), pd.Series(volumes)
+    recompute_secs = timeit.timeit(
+        lambda: [
+            recompute(close_series.iloc[i - period : i], volume_series.iloc[i - period : i])
+            for i in range(period, len(closes))
+        ],
+        number=1,
+    )
+    print(f"\nFeatures per bar (period {period}):")
+    print(f"  incremental rolling indicators:  {incremental_secs / count * 1e6:8.2f} us")
+    print(f"  pandas recompute of window:      {recompute_secs / count * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    # Engine: configure + create
+    engine_config = BacktestEngineConfig(
+        trader_id=TraderId("BACKTEST_TRADER-001"),
+        logging=LoggingConfig(log_level="INFO"),
+    )
+    engine = BacktestEngine(config=engine_config)
+
+    # Venue: create + add to engine
+    #   - Note: Venue must be added first -> before Instrument
+    venue: Venue = Venue("GLBX")
+    engine.add_venue(
+        venue=venue,
+        oms_type=OmsType.NETTING,  # Order Management System type
+        account_type=AccountType.MARGIN,  # Type of trading account
+        starting_balances=[Money(1_000_000, USD)],  # Initial balance
+        fee_model=PerContractFeeModel(commission=Money(2.50, USD)),
+        base_currency=USD,  # Base currency for the venue
+        default_leverage=Decimal(1),
+    )
+
+    # Instrument: create + add to engine
+    eurusd_future_instrument = utils_instruments.eurusd_future(2024, 3, venue.value)
+    engine.add_instrument(eurusd_future_instrument)
+
+    # BAR DATA: LOAD FROM CSV + ADD TO ENGINE
+    # Step 1: Define bar type
+    eurusd_future_1min_bar_type = BarType.from_str(
+        f"{eurusd_future_instrument.id}-1-MINUTE-LAST-EXTERNAL"
+    )
+    # Step 2: Load bar data from CSV file
+    eurusd_futures_1min_bars_list: list[Bar] = utils_csv.load_bars_from_ninjatrader_csv(
+        csv_path=r"../!market_data/cme/futures/fx/6EH4.GLBX_1min_bars_20240101_20240131.csv",
+        instrument=eurusd_future_instrument,
+        bar_type=eurusd_future_1min_bar_type,
+    )
+    # Step 3: Add bars to engine
+    engine.add_data(eurusd_futures_1min_bars_list)
+
+    # Strategy: Configure -> create -> add to engine
+    strategy_config = DemoStrategyConfig(
+        instrument=eurusd_future_instrument,
+        primary_bar_type=eurusd_future_1min_bar_type,
+        period=60,
+        percentile=90.0,
+    )
+    strategy = DemoStrategy(strategy_config)
+    engine.add_strategy(strategy)
+
+    # Run engine = Run backtest
+    engine.run()
+
+    # Check: Features from rolling indicators = features computed by pandas
+    expected = pandas_features(
+        eurusd_futures_1min_bars_list, strategy_config.period, strategy_config.percentile
+    )
+    actual = pd.DataFrame(strategy.features)
+    pd.testing.assert_frame_equal(expected, actual, rtol=1e-6)
+    print(f"\nOK: {len(actual)} bars of rolling features are the same as computed by pandas")
+
+    # Speed of incremental indicators vs. recomputing window by pandas in each bar
+    benchmark_per_bar(
+        closes=[bar.close.as_double() for bar in eurusd_futures_1min_bars_list[:3_000]],
+        volumes=[bar.volume.as_double() for bar in eurusd_futures_1min_bars_list[:3_000]],
+        period=strategy_config.period,
+        percentile=strategy_config.percentile,
+    )
+
+    # Cleanup resources
+    engine.dispose()
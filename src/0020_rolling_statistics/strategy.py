@@ -0,0 +1,81 @@
+from nautilus_trader.config import StrategyConfig
+from nautilus_trader.model.data import Bar, BarType
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.trading.strategy import Strategy
+
+from rolling_statistics import (
+    RollingCorrelation,
+    RollingMeanStd,
+    RollingMinMax,
+    RollingPercentile,
+    RollingZScore,
+)
+
+
+class DemoStrategyConfig(StrategyConfig, frozen=True):
+    instrument: Instrument
+    primary_bar_type: BarType
+    period: int = 60  # rolling window (in bars) for all statistics
+    percentile: float = 90.0
+
+
+class DemoStrategy(Strategy):
+    def __init__(self, config: DemoStrategyConfig):
+        super().__init__(config)
+        # Count processed bars
+        self.bars_1min_processed = 0
+
+        # Rolling statistics (features) on 1-min bars (bar close is input)
+        self.std = RollingMeanStd(config.period)
+        self.zscore = RollingZScore(config.period)
+        self.min_max = RollingMinMax(config.period)
+        self.percentile = RollingPercentile(config.period, config.percentile)
+        self.close_volume_correlation = RollingCorrelation(config.period)  # close vs. volume
+
+        # Values of features at each bar (to be compared with pandas in `run_backtest.py`)
+        self.features: list[dict] = []
+
+    def on_start(self):
+        # Subscribe to bars
+        self.subscribe_bars(self.config.primary_bar_type)
+
+        # Register all statistics -> they are updated automatically with each new bar
+        for indicator in [
+            self.std,
+            self.zscore,
+            self.min_max,
+            self.percentile,
+            self.close_volume_correlation,
+        ]:
+            self.register_indicator_for_bars(self.config.primary_bar_type, indicator)
+
+    def on_bar(self, bar: Bar):
+        self.bars_1min_processed += 1  # Just count 1-min bars
+
+        # Wait until all registered indicators are initialized
+        if not self.indicators_initialized():
+            return
+
+        # Features are just read - no window is recomputed here
+        self.features.append(
+            {
+                "ts_event": bar.ts_event,
+                "std": self.std.value,
+                "zscore": self.zscore.value,
+                "range": self.min_max.value,
+                "percentile": self.percentile.value,
+                "correlation": self.close_volume_correlation.value,
+            }
+        )
+
+        # Print overview once per hour
+        if self.bars_1min_processed % 60 == 0:
+            self.log.info(
+                f"Std: {self.std.value:.6f} | Z-score: {self.zscore.value:+.2f} | "
+                f"Min / Max: {self.min_max.min} / {self.min_max.max} | "
+                f"P{self.config.percentile:g}: {self.percentile.value:.5f} | "
+                f"Close-volume correlation: {self.close_volume_correlation.value:+.2f}"
+            )
+
+    def on_stop(self):
+        self.log.info(f"Total 1-min bars processed: {self.bars_1min_processed}")
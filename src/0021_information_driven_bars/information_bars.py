@@ -0,0 +1,480 @@
+import math
+from typing import Callable
+
+import numpy as np
+from nautilus_trader.core.data import Data
+from nautilus_trader.indicators.base.indicator import Indicator
+from nautilus_trader.model.data import Bar, BarType, DataType
+from nautilus_trader.model.enums import BarAggregation
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Price, Quantity
+
+
+# Information-driven bars (volume, value + range bars) built from 1-min bars.
+#
+# Nautilus itself can build volume + value bars from 1-min bars
+# (subscription of `2000-VOLUME-LAST-INTERNAL@1-MINUTE-EXTERNAL`), here are 2 faster ways:
+#   - incremental builders `VolumeBars`, `ValueBars`, `RangeBars` = indicators fed by 1-min bars,
+#     which call `on_bar_closed(bar)` for each new bar (no aggregator, no extra subscription)
+#   - batch functions `aggregate_volume_bars`, ... = all bars at once, e.g. before backtest
+#     (bars can be added into engine as data, the same as in example 0006)
+#
+# Volume + value bars follow the same rules as bars built by Nautilus:
+#   - volume bar = exactly `step` contracts, value bar = `step` of value (volume * price)
+#   - 1-min bar exceeding the rest to the threshold is split: its volume is divided between bars
+#     (split volume is rounded to size precision), its OHLC is used in both bars
+#   - value of 1-min bar = volume * typical price (high + low + close) / 3
+#   - ts_event = ts_init = ts_init of the last 1-min bar in bar
+#   - 1-min bars without volume are ignored, the last incomplete bar is not created
+#
+# Note: Volume bars are always identical - Nautilus splits volume in integers too (raw values).
+# Value bars are split here in integers, while Nautilus splits in Decimal:
+#   `volume_diff = volume * value_diff / value_update`, rounded to size precision for the bar,
+#   the rest of volume is kept unrounded (+ typical price is rounded by `Quantity`).
+# Both give the same bars, unless a split lands (almost) exactly on half of the size increment,
+# where rounding can differ by 1 unit of size precision. Identity of all bars is checked only
+# on 6EH4 data of January 2024 (`run_backtest.py`) -> check it again for other data.
+#
+# Range bars (not available in Nautilus): bar is closed by the 1-min bar, with which range
+# (high - low) of the bar reaches `range_ticks` (1-min bars are not split -> range can be bigger).
+# Nautilus has no range aggregation -> no `BarType` describes them (e.g. `20-TICK` would be
+# a different bar). So range bars are custom data `RangeBar`, not `Bar`:
+#   - subscribe: `subscribe_data(range_bar_data_type(instrument_id, range_ticks))` -> `on_data`
+#   - add as data into engine: wrap them in `CustomData` (see `run_backtest.py`)
+
+
+class RangeBar(Data):
+    # The same OHLCV + timestamps as `Bar`, but identified by instrument + `range_ticks`
+
+    def __init__(
+        self,
+        instrument_id: InstrumentId,
+        range_ticks: int,
+        open: Price,
+        high: Price,
+        low: Price,
+        close: Price,
+        volume: Quantity,
+        ts_event: int,
+        ts_init: int,
+    ):
+        super().__init__()
+        self.instrument_id = instrument_id
+        self.range_ticks = range_ticks
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self._ts_event = ts_event
+        self._ts_init = ts_init
+
+    @property
+    def ts_event(self) -> int:
+        return self._ts_event
+
+    @property
+    def ts_init(self) -> int:
+        return self._ts_init
+
+    def __repr__(self) -> str:
+        return (
+            f"RangeBar({self.instrument_id}-{self.range_ticks}-RANGE,{self.open},{self.high},"
+            f"{self.low},{self.close},{self.volume},{self.ts_event})"
+        )
+
+
+def range_bar_data_type(instrument_id: InstrumentId, range_ticks: int) -> DataType:
+    # Data type to subscribe + publish range bars of one instrument + range
+    return DataType(
+        RangeBar, metadata={"instrument_id": str(instrument_id), "range_ticks": range_ticks}
+    )
+
+
+class _InformationBars(Indicator):
+    # Common part of incremental builders: OHLCV of currently built bar + creation of closed bar.
+    # Prices + volume are integers in units of their precision (e.g. 1.10760 -> 110760).
+
+    def __init__(
+        self,
+        instrument: Instrument,
+        on_bar_closed: Callable[[Bar], None] | None,
+        params: list,
+    ):
+        super().__init__(params)
+        self.on_bar_closed = on_bar_closed
+        self.price_precision = instrument.price_precision
+        self.size_precision = instrument.size_precision
+        self._price_scale = 10**instrument.price_precision
+        self._size_scale = 10**instrument.size_precision
+        self.last_bar: Bar | RangeBar | None = None
+        self.bars_count = 0
+        self._reset()
+
+    def _add(self, open_: int, high: int, low: int, close: int, volume: int):
+        if not self._has_data:
+            self._open, self._high, self._low = open_, high, low
+            self._has_data = True
+        else:
+            if high > self._high:
+                self._high = high
+            if low < self._low:
+                self._low = low
+        self._close = close
+        self._volume += volume
+
+    def _close_bar(self, ts: int):
+        precision = self.price_precision
+        scale = self._price_scale
+        self.last_bar = self._create_bar(
+            Price(self._open / scale, precision),
+            Price(self._high / scale, precision),
+            Price(self._low / scale, precision),
+            Price(self._close / scale, precision),
+            Quantity(self._volume / self._size_scale, self.size_precision),
+            ts,
+        )
+        self.bars_count += 1
+        self._has_data = False
+        self._volume = 0
+
+        self._set_has_inputs(True)
+        self._set_initialized(True)
+        if self.on_bar_closed is not None:
+            self.on_bar_closed(self.last_bar)
+
+    def _create_bar(
+        self,
+        open_: Price,
+        high: Price,
+        low: Price,
+        close: Price,
+        volume: Quantity,
+        ts: int,
+    ) -> Bar | RangeBar:
+        return Bar(self.bar_type, open_, high, low, close, volume, ts_event=ts, ts_init=ts)
+
+    def _integers(self, bar: Bar) -> tuple[int, int, int, int, int]:
+        # OHLC + volume as integers in units of their precision
+        scale = self._price_scale
+        return (
+            round(bar.open.as_double() * scale),
+            round(bar.high.as_double() * scale),
+            round(bar.low.as_double() * scale),
+            round(bar.close.as_double() * scale),
+            round(bar.volume.as_double() * self._size_scale),
+        )
+
+    def _reset(self):
+        self._has_data = False
+        self._open = self._high = self._low = self._close = 0
+        self._volume = 0
+
+
+def volume_unit(high: int, low: int, close: int) -> int:
+    # Measure of 1 contract in volume bars
+    return 1
+
+
+def typical_price(high: int, low: int, close: int) -> int:
+    # Measure of 1 contract in value bars = typical price (in units of price precision),
+    # rounded half up (works for integers + numpy arrays of integers)
+    return (high + low + close + 1) // 3
+
+
+class _ThresholdBars(_InformationBars):
+    # Bar is closed, when cumulative measure (volume or value) of its 1-min bars reaches threshold.
+    # Measure of 1-min bar = its volume * `unit_measure(high, low, close)` (integers -> exact
+    # comparisons), e.g. `volume_unit` for volume bars, `typical_price` for value bars.
+
+    def __init__(
+        self,
+        bar_type: BarType,
+        instrument: Instrument,
+        on_bar_closed: Callable[[Bar], None] | None,
+        threshold: int,
+        unit_measure: Callable[[int, int, int], int],
+    ):
+        self.bar_type = bar_type
+        super().__init__(instrument, on_bar_closed, params=[bar_type.spec.step])
+        self._threshold = threshold
+        self._unit_measure = unit_measure
+
+    def handle_bar(self, bar: Bar):
+        open_, high, low, close, volume = self._integers(bar)
+        if volume == 0:
+            return
+        unit = self._unit_measure(high, low, close)
+        measure = volume * unit
+
+        # Split 1-min bar, while its (remaining) measure reaches threshold
+        while self._measure + measure >= self._threshold:
+            part = self._threshold - self._measure
+            # Volume of split part, rounded half up to size precision (as Nautilus does)
+            self._add(open_, high, low, close, math.floor(part / unit + 0.5))
+            self._close_bar(bar.ts_init)
+            self._measure = 0
+            measure -= part
+            if measure == 0:
+                return
+
+        self._add(open_, high, low, close, math.floor(measure / unit + 0.5))
+        self._measure += measure
+
+    def _reset(self):
+        super()._reset()
+        self._measure = 0  # measure of currently built bar
+
+
+class VolumeBars(_ThresholdBars):
+    # Volume bars, `bar_type` e.g. `6EH4.GLBX-2000-VOLUME-LAST-INTERNAL` (2000 contracts per bar)
+
+    def __init__(
+        self,
+        bar_type: BarType,
+        instrument: Instrument,
+        on_bar_closed: Callable[[Bar], None] | None = None,
+    ):
+        if bar_type.spec.aggregation != BarAggregation.VOLUME:
+            raise ValueError(f"Volume bar type expected, got {bar_type}")
+        threshold = bar_type.spec.step * 10**instrument.size_precision
+        super().__init__(bar_type, instrument, on_bar_closed, threshold, volume_unit)
+
+
+class ValueBars(_ThresholdBars):
+    # Value bars, `bar_type` e.g. `6EH4.GLBX-2000-VALUE-LAST-INTERNAL` (value = volume * price)
+
+    def __init__(
+        self,
+        bar_type: BarType,
+        instrument: Instrument,
+        on_bar_closed: Callable[[Bar], None] | None = None,
+    ):
+        if bar_type.spec.aggregation != BarAggregation.VALUE:
+            raise ValueError(f"Value bar type expected, got {bar_type}")
+        scale = 10 ** (instrument.price_precision + instrument.size_precision)
+        threshold = bar_type.spec.step * scale
+        super().__init__(bar_type, instrument, on_bar_closed, threshold, typical_price)
+
+
+class RangeBars(_InformationBars):
+    # Range bars: each bar has range (high - low) of at least `range_ticks` ticks
+    # (closed bars are `RangeBar` custom data, see top of the file)
+
+    def __init__(
+        self,
+        instrument: Instrument,
+        range_ticks: int,
+        on_bar_closed: Callable[[RangeBar], None] | None = None,
+    ):
+        super().__init__(instrument, on_bar_closed, params=[range_ticks])
+        self.instrument_id = instrument.id
+        self.range_ticks = range_ticks
+        # Tick can be bigger than the smallest unit of price precision (6E: 0.00005 = 5 units)
+        self._range = range_ticks * round(
+            instrument.price_increment.as_double() * 10**self.price_precision
+        )
+
+    def handle_bar(self, bar: Bar):
+        open_, high, low, close, volume = self._integers(bar)
+        self._add(open_, high, low, close, volume)
+        if self._high - self._low >= self._range:
+            self._close_bar(bar.ts_init)
+
+    def _create_bar(
+        self,
+        open_: Price,
+        high: Price,
+        low: Price,
+        close: Price,
+        volume: Quantity,
+        ts: int,
+    ) -> RangeBar:
+        return RangeBar(
+            self.instrument_id, self.range_ticks, open_, high, low, close, volume, ts, ts
+        )
+
+
+# BATCH VARIANTS
+# The same bars as from incremental builders, calculated from all 1-min bars at once.
+
+
+def aggregate_volume_bars(bars: list[Bar], bar_type: BarType, instrument: Instrument) -> list[Bar]:
+    if bar_type.spec.aggregation != BarAggregation.VOLUME:
+        raise ValueError(f"Volume bar type expected, got {bar_type}")
+    arrays = _bars_to_arrays(bars, instrument)
+    threshold = bar_type.spec.step * 10**instrument.size_precision
+    units = np.ones(len(arrays["volume"]), dtype=np.int64)
+    return _aggregate_by_threshold(arrays, units, threshold, bar_type, instrument)
+
+
+def aggregate_value_bars(bars: list[Bar], bar_type: BarType, instrument: Instrument) -> list[Bar]:
+    if bar_type.spec.aggregation != BarAggregation.VALUE:
+        raise ValueError(f"Value bar type expected, got {bar_type}")
+    arrays = _bars_to_arrays(bars, instrument)
+    threshold = bar_type.spec.step * 10 ** (instrument.price_precision + instrument.size_precision)
+    units = typical_price(arrays["high"], arrays["low"], arrays["close"])
+    return _aggregate_by_threshold(arrays, units, threshold, bar_type, instrument)
+
+
+def aggregate_range_bars(
+    bars: list[Bar],
+    instrument: Instrument,
+    range_ticks: int,
+) -> list[RangeBar]:
+    arrays = _bars_to_arrays(bars, instrument, skip_zero_volume=False)
+    tick_size = round(instrument.price_increment.as_double() * 10**instrument.price_precision)
+    price_range = range_ticks * tick_size
+
+    # Step 1: Last 1-min bar of each range bar
+    # (end of bar depends on start of bar -> simple loop over integers, everything else vectorized)
+    lasts = []
+    high = low = None
+    for index, (bar_high, bar_low) in enumerate(
+        zip(arrays["high"].tolist(), arrays["low"].tolist())
+    ):
+        if high is None:
+            high, low = bar_high, bar_low
+        else:
+            high, low = max(high, bar_high), min(low, bar_low)
+        if high - low >= price_range:
+            lasts.append(index)
+            high = low = None
+    if not lasts:
+        return []
+
+    # Step 2: OHLCV of each bar (bars don't overlap, 1-min bars of incomplete last bar are dropped)
+    lasts = np.array(lasts, dtype=np.int64)
+    firsts = np.r_[0, lasts[:-1] + 1]
+    closed = {name: values[: lasts[-1] + 1] for name, values in arrays.items()}
+    columns = [
+        closed["open"][firsts],
+        np.maximum.reduceat(closed["high"], firsts),
+        np.minimum.reduceat(closed["low"], firsts),
+        closed["close"][lasts],
+        np.add.reduceat(closed["volume"], firsts),
+        closed["ts_init"][lasts],
+    ]
+
+    # Step 3: Integers -> `RangeBar` objects
+    price_precision, size_precision = instrument.price_precision, instrument.size_precision
+    price_scale, size_scale = 10**price_precision, 10**size_precision
+    return [
+        RangeBar(
+            instrument.id,
+            range_ticks,
+            Price(open_ / price_scale, price_precision),
+            Price(high / price_scale, price_precision),
+            Price(low / price_scale, price_precision),
+            Price(close / price_scale, price_precision),
+            Quantity(volume / size_scale, size_precision),
+            ts,
+            ts,
+        )
+        for open_, high, low, close, volume, ts in zip(*(column.tolist() for column in columns))
+    ]
+
+
+def _bars_to_arrays(
+    bars: list[Bar],
+    instrument: Instrument,
+    skip_zero_volume: bool = True,
+) -> dict[str, np.ndarray]:
+    # OHLC + volume as integers in units of their precision (int64), ts_init (uint64)
+    count = len(bars)
+    price_scale = 10**instrument.price_precision
+    size_scale = 10**instrument.size_precision
+
+    def integers(values, scale: int) -> np.ndarray:
+        return np.rint(np.fromiter(values, dtype=np.float64, count=count) * scale).astype(np.int64)
+
+    arrays = {
+        "open": integers((bar.open.as_double() for bar in bars), price_scale),
+        "high": integers((bar.high.as_double() for bar in bars), price_scale),
+        "low": integers((bar.low.as_double() for bar in bars), price_scale),
+        "close": integers((bar.close.as_double() for bar in bars), price_scale),
+        "volume": integers((bar.volume.as_double() for bar in bars), size_scale),
+        "ts_init": np.fromiter((bar.ts_init for bar in bars), dtype=np.uint64, count=count),
+    }
+    if skip_zero_volume:
+        has_volume = arrays["volume"] > 0
+        if not has_volume.all():
+            arrays = {name: values[has_volume] for name, values in arrays.items()}
+    return arrays
+
+
+def _aggregate_by_threshold(
+    arrays: dict[str, np.ndarray],
+    units: np.ndarray,
+    threshold: int,
+    bar_type: BarType,
+    instrument: Instrument,
+) -> list[Bar]:
+    # Bar k contains cumulative measure (k * threshold, (k + 1) * threshold]
+    # (measure of 1-min bar = volume * unit, 1-min bar on the border belongs to both bars)
+    volumes = arrays["volume"]
+    measures = volumes * units
+    cum_measures = np.cumsum(measures)
+    bars_count = int(cum_measures[-1] // threshold) if len(cum_measures) else 0
+    if bars_count == 0:
+        return []
+
+    # Step 1: First + last 1-min bar of each bar
+    starts = np.arange(bars_count, dtype=np.int64) * threshold
+    ends = starts + threshold
+    firsts = np.searchsorted(cum_measures, starts, side="right")
+    lasts = np.searchsorted(cum_measures, ends, side="left")
+
+    # Step 2: Volume = split part of first 1-min bar + whole 1-min bars between + split part of last
+    # (split parts are rounded half up to size precision, the same as in incremental builder)
+    cum_volumes = np.cumsum(volumes)
+    first_parts = np.floor((cum_measures[firsts] - starts) / units[firsts] + 0.5)
+    last_parts = np.floor((ends - (cum_measures[lasts] - measures[lasts])) / units[lasts] + 0.5)
+    middle_volumes = cum_volumes[lasts - 1] - cum_volumes[firsts]
+    single_parts = np.floor(threshold / units[firsts] + 0.5)  # whole bar from one 1-min bar
+    bar_volumes = np.where(firsts == lasts, single_parts, first_parts + middle_volumes + last_parts)
+
+    # Step 3: High + low over overlapping ranges [first, last] -> `reduceat` on interleaved indices
+    # (odd positions are gaps between bars, they are dropped; dummy value for index after the end)
+    indices = np.column_stack([firsts, lasts + 1]).ravel()
+    highs = np.maximum.reduceat(np.r_[arrays["high"], 0], indices)[::2]
+    lows = np.minimum.reduceat(np.r_[arrays["low"], 0], indices)[::2]
+
+    return _create_bars(
+        bar_type,
+        instrument,
+        opens=arrays["open"][firsts],
+        highs=highs,
+        lows=lows,
+        closes=arrays["close"][lasts],
+        volumes=bar_volumes,
+        ts=arrays["ts_init"][lasts],
+    )
+
+
+def _create_bars(
+    bar_type: BarType,
+    instrument: Instrument,
+    opens: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    volumes: np.ndarray,
+    ts: np.ndarray,
+) -> list[Bar]:
+    # Integers -> prices + volumes, all bars created in one call
+    price_scale = 10**instrument.price_precision
+    size_scale = 10**instrument.size_precision
+    return Bar.from_raw_arrays_to_list(
+        bar_type,
+        instrument.price_precision,
+        instrument.size_precision,
+        opens / price_scale,
+        highs / price_scale,
+        lows / price_scale,
+        closes / price_scale,
+        volumes.astype(np.float64) / size_scale,
+        ts,
+        ts,
+    )
@@ -0,0 +1,156 @@
+import time
+
+from nautilus_trader.backtest.engine import BacktestEngine, Decimal
+from nautilus_trader.backtest.models import PerContractFeeModel
+from nautilus_trader.config import BacktestEngineConfig, LoggingConfig
+from nautilus_trader.model import TraderId
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.data import Bar, BarType, CustomData
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.model.identifiers import ClientId, Venue
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.model.objects import Money
+
+import utils_csv
+import utils_instruments
+from information_bars import (
+    aggregate_range_bars,
+    aggregate_value_bars,
+    aggregate_volume_bars,
+    range_bar_data_type,
+)
+from strategy import DemoStrategy, DemoStrategyConfig
+
+
+def run_backtest(
+    instrument: Instrument,
+    strategy_config: DemoStrategyConfig,
+    bars: list[Bar],
+    log_level: str,
+) -> tuple[float, DemoStrategy]:
+    # Engine: configure + create
+    engine_config = BacktestEngineConfig(
+        trader_id=TraderId("BACKTEST_TRADER-001"),
+        logging=LoggingConfig(log_level=log_level),
+    )
+    engine = BacktestEngine(config=engine_config)
+
+    # Venue: create + add to engine
+    #   - Note: Venue must be added first -> before Instrument
+    venue: Venue = Venue("GLBX")
+    engine.add_venue(
+        venue=venue,
+        oms_type=OmsType.NETTING,  # Order Management System type
+        account_type=AccountType.MARGIN,  # Type of trading account
+        starting_balances=[Money(1_000_000, USD)],  # Initial balance
+        fee_model=PerContractFeeModel(commission=Money(2.50, USD)),
+        base_currency=USD,  # Base currency for the venue
+        default_leverage=Decimal(1),
+    )
+
+    # Instrument + bars: add to engine (time of precomputing is included in measured time)
+    start = time.perf_counter()
+    engine.add_instrument(instrument)
+    engine.add_data(bars)
+    if strategy_config.bars_source == "precomputed":
+        # Information bars from batch functions
+        #   - `validate=False`, because engine doesn't accept INTERNAL bars as data by default
+        #   - added after 1-min bars -> 1-min bar comes first, if they have the same timestamp
+        precomputed_bars = [
+            aggregate_volume_bars(bars, strategy_config.volume_bar_type, instrument),
+            aggregate_value_bars(bars, strategy_config.value_bar_type, instrument),
+        ]
+        for information_bars in precomputed_bars:
+            engine.add_data(information_bars, validate=False)
+        # Range bars = custom data -> wrapped in `CustomData` with their data type, so engine
+        # publishes them to subscribers of this data type (client ID is only name of the source)
+        range_data_type = range_bar_data_type(instrument.id, strategy_config.range_ticks)
+        range_bars = aggregate_range_bars(bars, instrument, strategy_config.range_ticks)
+        engine.add_data(
+            [CustomData(range_data_type, range_bar) for range_bar in range_bars],
+            client_id=ClientId("RANGE_BARS"),
+        )
+
+    # Strategy: create -> add to engine
+    strategy = DemoStrategy(strategy_config)
+    engine.add_strategy(strategy)
+
+    # Run engine = Run backtest
+    engine.run()
+    run_secs = time.perf_counter() - start
+
+    # Cleanup resources
+    engine.dispose()
+
+    return run_secs, strategy
+
+
+if __name__ == "__main__":
+    # Instrument
+    eurusd_future_instrument = utils_instruments.eurusd_future(2024, 3, "GLBX")
+
+    # BAR DATA: LOAD FROM CSV
+    # Step 1: Define bar type
+    eurusd_future_1min_bar_type = BarType.from_str(
+        f"{eurusd_future_instrument.id}-1-MINUTE-LAST-EXTERNAL"
+    )
+    # Step 2: Load bar data from CSV file
+    eurusd_futures_1min_bars_list: list[Bar] = utils_csv.load_bars_from_ninjatrader_csv(
+        csv_path=r"../!market_data/cme/futures/fx/6EH4.GLBX_1min_bars_20240101_20240131.csv",
+        instrument=eurusd_future_instrument,
+        bar_type=eurusd_future_1min_bar_type,
+    )
+
+    # Information bars: 2000 contracts, 2000 of value (volume * price), range of 20 ticks
+    def strategy_config(bars_source: str) -> DemoStrategyConfig:
+        instrument_id = eurusd_future_instrument.id
+        return DemoStrategyConfig(
+            instrument=eurusd_future_instrument,
+            primary_bar_type=eurusd_future_1min_bar_type,
+            volume_bar_type=BarType.from_str(f"{instrument_id}-2000-VOLUME-LAST-INTERNAL"),
+            value_bar_type=BarType.from_str(f"{instrument_id}-2000-VALUE-LAST-INTERNAL"),
+            range_ticks=20,
+            bars_source=bars_source,
+        )
+
+    # Backtest with incremental builders (see bar counts + EMA values in log)
+    run_backtest(
+        eurusd_future_instrument,
+        strategy_config("builders"),
+        eurusd_futures_1min_bars_list,
+        log_level="INFO",
+    )
+
+    # Comparison of all bar sources (without logging, to compare speed)
+    # All of them must produce identical bars
+    results = {
+        bars_source: run_backtest(
+            eurusd_future_instrument,
+            strategy_config(bars_source),
+            eurusd_futures_1min_bars_list,
+            log_level="ERROR",
+        )
+        for bars_source in ["nautilus", "builders", "precomputed"]
+    }
+
+    # Bar equality doesn't compare prices + volume -> compare all fields
+    def bar_fields(bars: list[Bar]) -> list[tuple]:
+        return [
+            (bar.open, bar.high, bar.low, bar.close, bar.volume, bar.ts_event, bar.ts_init)
+            for bar in bars
+        ]
+
+    reference = results["nautilus"][1].information_bars
+    for bars_source in ["builders", "precomputed"]:
+        information_bars = results[bars_source][1].information_bars
+        for information_type, bars in information_bars.items():
+            assert bar_fields(bars) == bar_fields(reference[information_type]), (
+                f"Bars from {bars_source} differ: {information_type}"
+            )
+
+    print()
+    for information_type, bars in reference.items():
+        print(f"OK: {len(bars)} identical bars {information_type}")
+    print(f"\nBacktest with Nautilus aggregation:      {results['nautilus'][0]:.2f} secs")
+    print(f"Backtest with incremental builders:      {results['builders'][0]:.2f} secs")
+    print(f"Backtest with precomputed bars:          {results['precomputed'][0]:.2f} secs")
@@ -0,0 +1,96 @@
+from nautilus_trader.config import StrategyConfig
+from nautilus_trader.core.data import Data
+from nautilus_trader.indicators.average.ema import ExponentialMovingAverage
+from nautilus_trader.model.data import Bar, BarType, DataType
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.trading.strategy import Strategy
+
+from information_bars import RangeBar, RangeBars, ValueBars, VolumeBars, range_bar_data_type
+
+
+class DemoStrategyConfig(StrategyConfig, frozen=True):
+    instrument: Instrument
+    primary_bar_type: BarType  # 1-min bars, all information bars are built from them
+    volume_bar_type: BarType  # e.g. `6EH4.GLBX-2000-VOLUME-LAST-INTERNAL`
+    value_bar_type: BarType  # e.g. `6EH4.GLBX-2000-VALUE-LAST-INTERNAL`
+    range_ticks: int = 20  # range bars are custom data `RangeBar` (see `information_bars.py`)
+    # Where information bars come from:
+    #   "builders"    = incremental builders fed by 1-min bars (`VolumeBars`, `ValueBars`, ...)
+    #   "precomputed" = bars from batch functions, added into engine as data before backtest
+    #   "nautilus"    = Nautilus aggregates volume + value bars (`...@1-MINUTE-EXTERNAL`)
+    #                   + range bars from builder (no Nautilus alternative)
+    bars_source: str = "builders"
+
+
+class DemoStrategy(Strategy):
+    def __init__(self, config: DemoStrategyConfig):
+        super().__init__(config)
+        if config.bars_source not in ("builders", "precomputed", "nautilus"):
+            raise ValueError(f"Unknown bars source: {config.bars_source}")
+        self.bars_1min_processed = 0
+        # Range bars are identified by their data type (instrument + range), not by bar type
+        self.range_data_type = range_bar_data_type(config.instrument.id, config.range_ticks)
+        self.information_types: list[BarType | DataType] = [
+            config.volume_bar_type,
+            config.value_bar_type,
+            self.range_data_type,
+        ]
+        # All received information bars (to be compared in `run_backtest.py`) + EMA on each of them
+        self.information_bars: dict[BarType | DataType, list[Bar | RangeBar]] = {
+            information_type: [] for information_type in self.information_types
+        }
+        self.emas = {
+            information_type: ExponentialMovingAverage(10)
+            for information_type in self.information_types
+        }
+
+    def on_start(self):
+        config = self.config
+        self.subscribe_bars(config.primary_bar_type)
+
+        # Builders: indicators fed by 1-min bars, new bars come to `on_information_bar`
+        builders = []
+        if config.bars_source == "builders":
+            builders += [
+                VolumeBars(config.volume_bar_type, config.instrument, self.on_information_bar),
+                ValueBars(config.value_bar_type, config.instrument, self.on_information_bar),
+            ]
+        if config.bars_source in ("builders", "nautilus"):
+            builders.append(
+                RangeBars(config.instrument, config.range_ticks, self.on_information_bar)
+            )
+        for builder in builders:
+            self.register_indicator_for_bars(config.primary_bar_type, builder)
+
+        # Bars from engine: come to `on_bar` (range bars to `on_data`)
+        if config.bars_source == "precomputed":
+            self.subscribe_bars(config.volume_bar_type)
+            self.subscribe_bars(config.value_bar_type)
+            self.subscribe_data(self.range_data_type)
+        elif config.bars_source == "nautilus":
+            for bar_type in [config.volume_bar_type, config.value_bar_type]:
+                self.subscribe_bars(BarType.from_str(f"{bar_type}@1-MINUTE-EXTERNAL"))
+
+    def on_bar(self, bar: Bar):
+        if bar.bar_type == self.config.primary_bar_type:
+            self.bars_1min_processed += 1
+        else:
+            self.on_information_bar(bar)
+
+    def on_data(self, data: Data):
+        if isinstance(data, RangeBar):
+            self.on_information_bar(data)
+
+    def on_information_bar(self, bar: Bar | RangeBar):
+        # Called for each new volume / value / range bar (regardless of bars source)
+        information_type = self.range_data_type if isinstance(bar, RangeBar) else bar.bar_type
+        self.information_bars[information_type].append(bar)
+        self.emas[information_type].update_raw(bar.close.as_double())
+
+    def on_stop(self):
+        self.log.info(f"Total 1-min bars processed: {self.bars_1min_processed}")
+        for information_type, bars in self.information_bars.items():
+            self.log.info(
+                f"{information_type}: {len(bars)} bars, "
+                f"last EMA(10): {self.emas[information_type].value:.5f}"
+            )